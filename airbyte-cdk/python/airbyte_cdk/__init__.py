@@ -2,8 +2,30 @@
 # Copyright (c) 2021 Airbyte, Inc., all rights reserved.
 #
 
-from .connector import AirbyteSpec, Connector
-from .entrypoint import AirbyteEntrypoint
-from .logger import AirbyteLogger
+import logging
+from typing import TYPE_CHECKING
+
+from .lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from .connector import AirbyteSpec, Connector
+    from .entrypoint import AirbyteEntrypoint
+    from .logger import AirbyteLogger
+
+# Connectors read the level of the airbyte logger when their modules are imported, so it is set here as it used to be when the entrypoint
+# was imported with the package. The handlers are configured by `init_logger` once the entrypoint is imported.
+logging.getLogger("airbyte").setLevel(logging.INFO)
+
+# The public classes are imported when they are first accessed so that importing a submodule (e.g. airbyte_cdk.models) does not import
+# the entrypoint along with everything it depends on
+__getattr__, __dir__ = lazy_imports(
+    __name__,
+    {
+        "AirbyteEntrypoint": ".entrypoint",
+        "AirbyteLogger": ".logger",
+        "AirbyteSpec": ".connector",
+        "Connector": ".connector",
+    },
+)
 
 __all__ = ["AirbyteEntrypoint", "AirbyteLogger", "AirbyteSpec", "Connector"]
@@ -12,18 +12,21 @@ from .config import (
     ProcessingConfigModel,
 )
 from .document_processor import Chunk, DocumentProcessor
-from .embedder import CohereEmbedder, Embedder, FakeEmbedder, OpenAIEmbedder
+from .embedder import CachedEmbedder, CohereEmbedder, Embedder, FakeEmbedder, OpenAIEmbedder
+from .embedding_cache import EmbeddingCache, SqliteEmbeddingCache
 from .indexer import Indexer
 from .writer import Writer
 
 __all__ = [
     "AzureOpenAIEmbedder",
     "AzureOpenAIEmbeddingConfigModel",
+    "CachedEmbedder",
     "Chunk",
     "CohereEmbedder",
     "CohereEmbeddingConfigModel",
     "DocumentProcessor",
     "Embedder",
+    "EmbeddingCache",
     "FakeEmbedder",
     "FakeEmbeddingConfigModel",
     "FromFieldEmbedder",
@@ -34,5 +37,6 @@ __all__ = [
     "OpenAIEmbedder",
     "OpenAIEmbeddingConfigModel",
     "ProcessingConfigModel",
+    "SqliteEmbeddingCache",
     "Writer",
 ]
@@ -2,10 +2,12 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import logging
 import os
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional, Union, cast
+from typing import Dict, List, Optional, Union, cast
 
 from airbyte_cdk.destinations.vector_db_based.config import (
     AzureOpenAIEmbeddingConfigModel,
@@ -16,6 +18,7 @@ from airbyte_cdk.destinations.vector_db_based.config import (
     OpenAIEmbeddingConfigModel,
     ProcessingConfigModel,
 )
+from airbyte_cdk.destinations.vector_db_based.embedding_cache import EmbeddingCache, hash_text
 from airbyte_cdk.destinations.vector_db_based.utils import create_chunks, format_exception
 from airbyte_cdk.models import AirbyteRecordMessage
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException, FailureType
@@ -233,6 +236,72 @@ class FromFieldEmbedder(Embedder):
         return self.config.dimensions
 
 
+class CachedEmbedder(Embedder):
+    """
+    Embedder looking up the embeddings of the chunks in an EmbeddingCache before embedding them with the wrapped embedder.
+
+    The chunks without a cached embedding are embedded in a single call to the wrapped embedder, which keeps batching the requests to the
+    embedding provider, and chunks with the same text are only embedded once. The ratio of chunks served from the cache is logged at most
+    once per metrics emission interval.
+    """
+
+    def __init__(self, embedder: Embedder, cache: EmbeddingCache, model: str, metrics_emission_interval_in_seconds: float = 60.0) -> None:
+        """
+        :param embedder: embedder used for the chunks which are not cached
+        :param cache: cache of the embeddings
+        :param model: identifier of the embedding model of the embedder. Embeddings cached for another model are not used
+        :param metrics_emission_interval_in_seconds: minimum number of seconds between two logs of the cache hit rate
+        """
+        super().__init__()
+        self.embedder = embedder
+        self.cache = cache
+        self.model = model
+        self.metrics_emission_interval_in_seconds = metrics_emission_interval_in_seconds
+        self.hits = 0
+        self.misses = 0
+        self._last_metrics_emission: Optional[float] = None
+        self.logger = logging.getLogger("airbyte.embedding_cache")
+
+    def check(self) -> Optional[str]:
+        return self.embedder.check()
+
+    def embed_documents(self, documents: List[Document]) -> List[Optional[List[float]]]:
+        text_hashes = [hash_text(document.page_content) for document in documents]
+        embeddings: Dict[str, Optional[List[float]]] = dict(self.cache.get(self.model, set(text_hashes)))
+
+        documents_to_embed: Dict[str, Document] = {}
+        for text_hash, document in zip(text_hashes, documents):
+            if text_hash not in embeddings:
+                documents_to_embed.setdefault(text_hash, document)
+        if documents_to_embed:
+            new_embeddings = dict(zip(documents_to_embed.keys(), self.embedder.embed_documents(list(documents_to_embed.values()))))
+            self.cache.set(self.model, {text_hash: embedding for text_hash, embedding in new_embeddings.items() if embedding is not None})
+            embeddings.update(new_embeddings)
+
+        self.hits += len(documents) - len(documents_to_embed)
+        self.misses += len(documents_to_embed)
+        self._emit_metrics()
+        return [embeddings[text_hash] for text_hash in text_hashes]
+
+    @property
+    def embedding_dimensions(self) -> int:
+        return self.embedder.embedding_dimensions
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def _emit_metrics(self) -> None:
+        now = time.monotonic()
+        if self._last_metrics_emission is not None and now - self._last_metrics_emission < self.metrics_emission_interval_in_seconds:
+            return
+        self._last_metrics_emission = now
+        self.logger.info(
+            f"Embedding cache hit rate for model {self.model}: {self.hit_rate:.1%} ({self.hits} chunks served from the cache, {self.misses} embedded)"
+        )
+
+
 embedder_map = {
     "openai": OpenAIEmbedder,
     "cohere": CohereEmbedder,
@@ -253,9 +322,38 @@ def create_from_config(
         OpenAICompatibleEmbeddingConfigModel,
     ],
     processing_config: ProcessingConfigModel,
+    embedding_cache: Optional[EmbeddingCache] = None,
 ) -> Embedder:
-
+    """
+    Create the embedder configured by the user. If an embedding cache is provided, the embedder looks up the embeddings in the cache before
+    calling the embedding provider, except when the embeddings are read from the records.
+    """
     if embedding_config.mode == "azure_openai" or embedding_config.mode == "openai":
-        return cast(Embedder, embedder_map[embedding_config.mode](embedding_config, processing_config.chunk_size))
+        embedder = cast(Embedder, embedder_map[embedding_config.mode](embedding_config, processing_config.chunk_size))
     else:
-        return cast(Embedder, embedder_map[embedding_config.mode](embedding_config))
+        embedder = cast(Embedder, embedder_map[embedding_config.mode](embedding_config))
+
+    if embedding_cache is None or isinstance(embedding_config, FromFieldEmbeddingConfigModel):
+        return embedder
+    return CachedEmbedder(embedder, embedding_cache, _get_model_identifier(embedding_config))
+
+
+def _get_model_identifier(
+    embedding_config: Union[
+        AzureOpenAIEmbeddingConfigModel,
+        CohereEmbeddingConfigModel,
+        FakeEmbeddingConfigModel,
+        OpenAIEmbeddingConfigModel,
+        OpenAICompatibleEmbeddingConfigModel,
+    ]
+) -> str:
+    # identifies the model producing the embeddings so that embeddings cached for another model or deployment are not reused
+    if isinstance(embedding_config, AzureOpenAIEmbeddingConfigModel):
+        return f"azure_openai:{embedding_config.api_base}:{embedding_config.deployment}"
+    if isinstance(embedding_config, OpenAIEmbeddingConfigModel):
+        return "openai:text-embedding-ada-002"
+    if isinstance(embedding_config, CohereEmbeddingConfigModel):
+        return "cohere:embed-english-light-v2.0"
+    if isinstance(embedding_config, OpenAICompatibleEmbeddingConfigModel):
+        return f"openai_compatible:{embedding_config.base_url}:{embedding_config.model_name}:{embedding_config.dimensions}"
+    return str(embedding_config.mode)
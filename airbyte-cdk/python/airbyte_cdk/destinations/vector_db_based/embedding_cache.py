@@ -0,0 +1,88 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from array import array
+from typing import Dict, Iterable, List, Mapping
+
+from airbyte_cdk.destinations.vector_db_based.utils import create_chunks
+
+
+def hash_text(text: str) -> str:
+    """
+    Hash of the text of a chunk used as key of its embedding in the cache
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache(ABC):
+    """
+    EmbeddingCache is an abstract class that defines the interface for storing the embedding vectors of chunks so they are not embedded again.
+
+    Embeddings are identified by the embedding model which produced them and the hash of the embedded text, so records which did not change
+    since the last sync are not embedded again while changing the model invalidates the cached embeddings.
+    """
+
+    @abstractmethod
+    def get(self, model: str, text_hashes: Iterable[str]) -> Dict[str, List[float]]:
+        """
+        Return the cached embeddings of the texts by text hash. Texts without a cached embedding are omitted.
+        """
+        pass
+
+    @abstractmethod
+    def set(self, model: str, embeddings: Mapping[str, List[float]]) -> None:
+        """
+        Store the embeddings by text hash.
+        """
+        pass
+
+
+class SqliteEmbeddingCache(EmbeddingCache):
+    """
+    Embedding cache stored in a local SQLite database. The vectors are stored as arrays of double precision floats.
+
+    The database file has to be persisted between syncs, for example on a mounted volume, for the cache to be reused across syncs.
+    """
+
+    # SQLite limits the number of parameters of a statement to 999 in versions before 3.32.0
+    QUERY_BATCH_SIZE = 500
+
+    def __init__(self, path: str) -> None:
+        """
+        :param path: path of the database file which is created if it does not exist
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (model TEXT NOT NULL, text_hash TEXT NOT NULL, embedding BLOB NOT NULL, "
+                "PRIMARY KEY (model, text_hash)) WITHOUT ROWID"
+            )
+
+    def get(self, model: str, text_hashes: Iterable[str]) -> Dict[str, List[float]]:
+        embeddings: Dict[str, List[float]] = {}
+        for batch in create_chunks(text_hashes, batch_size=self.QUERY_BATCH_SIZE):
+            rows = self._connection.execute(
+                f"SELECT text_hash, embedding FROM embeddings WHERE model = ? AND text_hash IN ({', '.join('?' * len(batch))})",
+                (model, *batch),
+            )
+            for text_hash, embedding in rows:
+                embeddings[text_hash] = array("d", embedding).tolist()
+        return embeddings
+
+    def set(self, model: str, embeddings: Mapping[str, List[float]]) -> None:
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, embedding) VALUES (?, ?, ?)",
+                ((model, text_hash, array("d", embedding).tobytes()) for text_hash, embedding in embeddings.items()),
+            )
+
+    def close(self) -> None:
+        self._connection.close()
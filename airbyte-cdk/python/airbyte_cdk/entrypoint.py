@@ -5,11 +5,14 @@
 import argparse
 import importlib
 import ipaddress
+import json
 import logging
+import math
 import os.path
 import socket
 import sys
 import tempfile
+import threading
 from collections import defaultdict
 from functools import wraps
 from typing import Any, DefaultDict, Iterable, List, Mapping, MutableMapping, Optional, Union
@@ -19,7 +22,7 @@ import requests
 from airbyte_cdk.connector import TConfig
 from airbyte_cdk.exception_handler import init_uncaught_exception_handler
 from airbyte_cdk.logger import init_logger
-from airbyte_cdk.models import AirbyteMessage, FailureType, Status, Type
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, FailureType, Status, Type
 from airbyte_cdk.models.airbyte_protocol import AirbyteStateStats, ConnectorSpecification  # type: ignore [attr-defined]
 from airbyte_cdk.sources import Source
 from airbyte_cdk.sources.connector_state_manager import HashableStreamDescriptor
@@ -28,13 +31,25 @@ from airbyte_cdk.utils import is_cloud_environment, message_utils
 from airbyte_cdk.utils.airbyte_secrets_utils import get_secrets, update_secrets
 from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
+from pydantic.json import pydantic_encoder
 from requests import PreparedRequest, Response, Session
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = init_logger("airbyte")
 
 VALID_URL_SCHEMES = ["https"]
 CLOUD_DEPLOYMENT_MODE = "cloud"
 
+# Number of messages written to stdout at once. Messages other than records (state, log, trace, etc.) are always written immediately along
+# with the records that were emitted before them.
+OUTPUT_BUFFER_SIZE = 1000
+_RECORD_MESSAGE_PREFIX = '{"type": "RECORD"'
+_RECORD_MESSAGE_FIELDS = frozenset(AirbyteRecordMessage.__fields__.keys())
+
 
 class AirbyteEntrypoint(object):
     def __init__(self, source: Source):
@@ -200,6 +215,12 @@ class AirbyteEntrypoint(object):
 
     @staticmethod
     def airbyte_message_to_string(airbyte_message: AirbyteMessage) -> Any:
+        if (
+            airbyte_message.type == Type.RECORD
+            and airbyte_message.__fields_set__ == {"type", "record"}
+            and airbyte_message.record.__fields_set__ <= _RECORD_MESSAGE_FIELDS  # type: ignore[union-attr] # record is set
+        ):
+            return _record_message_to_string(airbyte_message.record)  # type: ignore[arg-type] # record is set
         return airbyte_message.json(exclude_unset=True)
 
     @classmethod
@@ -229,13 +250,79 @@ class AirbyteEntrypoint(object):
         return
 
 
+def _record_message_to_string(record: AirbyteRecordMessage) -> str:
+    """
+    Serialize a record message the same way `AirbyteMessage.json(exclude_unset=True)` does without going through the pydantic models. Only
+    the record data needs to be encoded, the rest of the message is formatted directly.
+    """
+    fields_set = record.__fields_set__
+    namespace = f'"namespace": {json.dumps(record.namespace)}, ' if "namespace" in fields_set else ""
+    return (
+        f'{_RECORD_MESSAGE_PREFIX}, "record": {{{namespace}"stream": {json.dumps(record.stream)}, '
+        f'"data": {_dumps(record.data)}, "emitted_at": {record.emitted_at}}}}}'
+    )
+
+
+def _dumps(data: Mapping[str, Any]) -> str:
+    if orjson:
+        try:
+            serialized = orjson.dumps(data, default=pydantic_encoder, option=orjson.OPT_NON_STR_KEYS)
+        except (orjson.JSONEncodeError, TypeError):
+            # orjson does not support some values like integers larger than 64 bits. The standard library is used in that case
+            pass
+        else:
+            # orjson writes NaN and infinite floats as null while the standard library writes them as NaN and Infinity
+            if b"null" not in serialized or not _has_non_finite_float(data):
+                return serialized.decode()
+    return json.dumps(data, default=pydantic_encoder)
+
+
+def _has_non_finite_float(value: Any) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, Mapping):
+        return any(_has_non_finite_float(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite_float(item) for item in value)
+    return False
+
+
+def _write(messages: List[str]) -> None:
+    # Messages are written with a single call for the same reason as described in `launch`
+    sys.stdout.write("".join(messages))
+    messages.clear()
+
+
 def launch(source: Source, args: List[str]) -> None:
     source_entrypoint = AirbyteEntrypoint(source)
     parsed_args = source_entrypoint.parse_args(args)
-    for message in source_entrypoint.run(parsed_args):
-        # simply printing is creating issues for concurrent CDK as Python uses different two instructions to print: one for the message and
-        # the other for the break line. Adding `\n` to the message ensure that both are printed at the same time
-        print(f"{message}\n", end="")
+    buffer: List[str] = []
+    # log records can be emitted from other threads than the one consuming the messages
+    buffer_lock = threading.Lock()
+
+    def write_buffer(record: Optional[logging.LogRecord] = None) -> bool:
+        # also used as a filter of the log handlers so that the records read before a log message are written before it
+        with buffer_lock:
+            if buffer:
+                _write(buffer)
+        return True
+
+    log_handlers = list(logging.getLogger().handlers)
+    for handler in log_handlers:
+        handler.addFilter(write_buffer)
+    try:
+        for message in source_entrypoint.run(parsed_args):
+            # simply printing is creating issues for concurrent CDK as Python uses different two instructions to print: one for the message
+            # and the other for the break line. Adding `\n` to the message ensure that both are printed at the same time
+            with buffer_lock:
+                buffer.append(f"{message}\n")
+                if len(buffer) >= OUTPUT_BUFFER_SIZE or not message.startswith(_RECORD_MESSAGE_PREFIX):
+                    _write(buffer)
+    finally:
+        for handler in log_handlers:
+            handler.removeFilter(write_buffer)
+        # records read before a failure still need to be emitted, before the trace message of the uncaught exception
+        write_buffer()
 
 
 def _init_internal_request_filter() -> None:
@@ -0,0 +1,30 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import importlib
+import sys
+from typing import Any, Callable, List, Mapping, Tuple
+
+
+def lazy_imports(package_name: str, imports: Mapping[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Return the module `__getattr__` and `__dir__` functions of a package which imports its public attributes when they are first accessed.
+
+    :param package_name: name of the package, i.e. its `__name__`
+    :param imports: name of the module, relative to the package, defining each attribute by attribute name
+    :return: the `__getattr__` and `__dir__` functions of the package
+    """
+    package = sys.modules[package_name]
+
+    def __getattr__(name: str) -> Any:
+        if name in imports:
+            value = getattr(importlib.import_module(imports[name], package_name), name)
+            setattr(package, name, value)
+            return value
+        raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(package)) | set(imports))
+
+    return __getattr__, __dir__
@@ -2,11 +2,15 @@
 # Copyright (c) 2021 Airbyte, Inc., all rights reserved.
 #
 
+from typing import TYPE_CHECKING
+
 import dpath.options
+from airbyte_cdk.lazy_imports import lazy_imports
 
-from .abstract_source import AbstractSource
-from .config import BaseConfig
-from .source import Source
+if TYPE_CHECKING:
+    from .abstract_source import AbstractSource
+    from .config import BaseConfig
+    from .source import Source
 
 # As part of the CDK sources, we do not control what the APIs return and it is possible that a key is empty.
 # Reasons why we are doing this at the airbyte_cdk level:
@@ -19,4 +23,15 @@ from .source import Source
 # this will not be thread-safe.
 dpath.options.ALLOW_EMPTY_STRING_KEYS = True
 
+# The public classes are imported when they are first accessed so that importing a subpackage (e.g. airbyte_cdk.sources.streams) or the
+# entrypoint, which only needs Source, does not import AbstractSource along with everything it depends on
+__getattr__, __dir__ = lazy_imports(
+    __name__,
+    {
+        "AbstractSource": ".abstract_source",
+        "BaseConfig": ".config",
+        "Source": ".source",
+    },
+)
+
 __all__ = ["AbstractSource", "BaseConfig", "Source"]
@@ -25,7 +25,6 @@ from airbyte_cdk.sources.message import InMemoryMessageRepository, MessageReposi
 from airbyte_cdk.sources.source import Source
 from airbyte_cdk.sources.streams import FULL_REFRESH_SENTINEL_STATE_KEY, Stream
 from airbyte_cdk.sources.streams.core import StreamData
-from airbyte_cdk.sources.streams.http.http import HttpStream
 from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
 from airbyte_cdk.sources.utils.schema_helpers import InternalConfig, split_config
 from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger, SliceLogger
@@ -189,9 +188,13 @@ class AbstractSource(Source, ABC):
         state_manager: ConnectorStateManager,
         internal_config: InternalConfig,
     ) -> Iterator[AirbyteMessage]:
-        if internal_config.page_size and isinstance(stream_instance, HttpStream):
-            logger.info(f"Setting page size for {stream_instance.name} to {internal_config.page_size}")
-            stream_instance.page_size = internal_config.page_size
+        if internal_config.page_size:
+            # imported here so that sources not using HTTP streams don't import the HTTP stack (requests_cache, pyrate_limiter...)
+            from airbyte_cdk.sources.streams.http.http import HttpStream
+
+            if isinstance(stream_instance, HttpStream):
+                logger.info(f"Setting page size for {stream_instance.name} to {internal_config.page_size}")
+                stream_instance.page_size = internal_config.page_size
         logger.debug(
             f"Syncing configured stream: {configured_stream.stream.name}",
             extra={
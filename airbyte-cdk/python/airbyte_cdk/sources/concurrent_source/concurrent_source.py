@@ -29,6 +29,7 @@ class ConcurrentSource:
     """
 
     DEFAULT_TIMEOUT_SECONDS = 900
+    DEFAULT_RECORD_BATCH_SIZE = 1
 
     @staticmethod
     def create(
@@ -38,6 +39,7 @@ class ConcurrentSource:
         slice_logger: SliceLogger,
         message_repository: MessageRepository,
         timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+        record_batch_size: int = DEFAULT_RECORD_BATCH_SIZE,
     ) -> "ConcurrentSource":
         is_single_threaded = initial_number_of_partitions_to_generate == 1 and num_workers == 1
         too_many_generator = not is_single_threaded and initial_number_of_partitions_to_generate >= num_workers
@@ -47,7 +49,13 @@ class ConcurrentSource:
             logger,
         )
         return ConcurrentSource(
-            threadpool, logger, slice_logger, message_repository, initial_number_of_partitions_to_generate, timeout_seconds
+            threadpool,
+            logger,
+            slice_logger,
+            message_repository,
+            initial_number_of_partitions_to_generate,
+            timeout_seconds,
+            record_batch_size,
         )
 
     def __init__(
@@ -58,6 +66,7 @@ class ConcurrentSource:
         message_repository: MessageRepository = InMemoryMessageRepository(),
         initial_number_partitions_to_generate: int = 1,
         timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+        record_batch_size: int = DEFAULT_RECORD_BATCH_SIZE,
     ) -> None:
         """
         :param threadpool: The threadpool to submit tasks to
@@ -66,6 +75,7 @@ class ConcurrentSource:
         :param message_repository: The repository to emit messages to
         :param initial_number_partitions_to_generate: The initial number of concurrent partition generation tasks. Limiting this number ensures will limit the latency of the first records emitted. While the latency is not critical, emitting the records early allows the platform and the destination to process them as early as possible.
         :param timeout_seconds: The maximum number of seconds to wait for a record to be read from the queue. If no record is read within this time, the source will stop reading and return.
+        :param record_batch_size: The maximum number of records a worker puts in the queue at once. Batching records reduces the contention on the queue when many workers are reading partitions.
         """
         self._threadpool = threadpool
         self._logger = logger
@@ -73,6 +83,7 @@ class ConcurrentSource:
         self._message_repository = message_repository
         self._initial_number_partitions_to_generate = initial_number_partitions_to_generate
         self._timeout_seconds = timeout_seconds
+        self._record_batch_size = record_batch_size
 
     def read(
         self,
@@ -97,7 +108,7 @@ class ConcurrentSource:
             self._logger,
             self._slice_logger,
             self._message_repository,
-            PartitionReader(queue),
+            PartitionReader(queue, self._record_batch_size),
         )
 
         # Enqueue initial partition generation tasks
@@ -142,7 +153,10 @@ class ConcurrentSource:
         concurrent_stream_processor: ConcurrentReadProcessor,
     ) -> Iterable[AirbyteMessage]:
         # handle queue item and call the appropriate handler depending on the type of the queue item
-        if isinstance(queue_item, Exception):
+        # batches of records are checked first as they are the most frequent items when batching is enabled
+        if isinstance(queue_item, list):
+            yield from concurrent_stream_processor.on_records(queue_item)
+        elif isinstance(queue_item, Exception):
             yield from concurrent_stream_processor.on_exception(queue_item)
         elif isinstance(queue_item, PartitionGenerationCompletedSentinel):
             yield from concurrent_stream_processor.on_partition_generation_completed(queue_item)
@@ -23,3 +23,9 @@ class Decoder:
         :return: Mapping or array describing the response
         """
         pass
+
+    def is_stream_response(self) -> bool:
+        """
+        Indicates whether the decoder parses the response as it is received, in which case the request should be sent with `stream=True`
+        """
+        return False
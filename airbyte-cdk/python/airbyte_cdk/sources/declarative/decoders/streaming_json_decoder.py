@@ -0,0 +1,132 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+from dataclasses import InitVar, dataclass
+from typing import Any, Iterable, List, Mapping, Optional, Tuple
+
+import requests
+from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+except ImportError:
+    ijson = None  # type: ignore[assignment]
+
+
+@dataclass
+class StreamingJsonDecoder(JsonDecoder):
+    """
+    Decoder strategy that parses the json-encoded content of a response as it is received instead of loading the whole content in memory.
+
+    The values of the array found at a path are returned one at a time as soon as they are parsed, so the memory used is bounded by the
+    size of a single value regardless of the size of the response. Once the response is parsed, its content is replaced by the rest of the
+    document, with an empty array at the path, so that components decoding the response afterwards, like paginators, can still read the
+    other fields of the document.
+    """
+
+    parameters: InitVar[Mapping[str, Any]]
+
+    CHUNK_SIZE_IN_BYTES = 64 * 1024
+
+    def __post_init__(self, parameters: Mapping[str, Any]) -> None:
+        if ijson is None:
+            raise ImportError(
+                "ijson is required to use StreamingJsonDecoder. Please install it with `pip install airbyte-cdk[streaming-json]`"
+            )
+
+    def is_stream_response(self) -> bool:
+        return True
+
+    def decode_items(self, response: requests.Response, path: List[str]) -> Iterable[Any]:
+        """
+        Yields the values of the array found at the path as they are parsed. If the path points to another value, that value is returned
+        once the response is parsed if it is not empty.
+
+        :param response: the response to decode. It should be sent with `stream=True` for its content to be parsed as it is received
+        :param path: keys of the objects leading to the array
+        :return: the values found at the path
+        """
+        document = _StreamedDocument(path)
+        events = ijson.sendable_list()
+        parser = ijson.parse_coro(events, use_float=True)
+        try:
+            for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE_IN_BYTES):
+                parser.send(chunk)
+                yield from document.process(events)
+                del events[:]
+            parser.close()
+            yield from document.process(events)
+        except ijson.JSONError:
+            # Like JsonDecoder, a response without content has no records. Invalid content is only detected once some of it may already
+            # have been returned, so it fails the read
+            if document.started:
+                raise
+        response._content = json.dumps(document.remainder()).encode("utf-8")
+        response.encoding = "utf-8"
+
+        value = document.value_at_path()
+        if value and not isinstance(value, list):
+            yield value
+
+
+class _StreamedDocument:
+    """
+    Splits the parsing events of a JSON document between the values of the array found at a path, which are built one at a time, and the
+    rest of the document
+    """
+
+    def __init__(self, path: List[str]) -> None:
+        self._path = path
+        # ijson identifies the position of each event by the keys leading to it, with "item" standing for the values of arrays
+        self._prefix = ".".join(path)
+        self._item_prefix = f"{self._prefix}.item" if self._prefix else "item"
+        self._document = ObjectBuilder()
+        self._item: Optional[ObjectBuilder] = None
+        self._depth = 0
+        self._in_array = False
+        self.started = False
+
+    def process(self, events: Iterable[Tuple[str, str, Any]]) -> Iterable[Any]:
+        for prefix, event, value in events:
+            self.started = True
+            if self._item is not None:
+                self._item.event(event, value)
+                self._depth += self._depth_change(event)
+                if self._depth == 0:
+                    yield self._item.value
+                    self._item = None
+            elif self._in_array and prefix == self._item_prefix:
+                item = ObjectBuilder()
+                item.event(event, value)
+                self._depth = self._depth_change(event)
+                if self._depth == 0:
+                    yield item.value
+                else:
+                    self._item = item
+            else:
+                if prefix == self._prefix and event in ("start_array", "end_array"):
+                    self._in_array = event == "start_array"
+                self._document.event(event, value)
+
+    def remainder(self) -> Any:
+        # like JsonDecoder, a response without content is decoded as an empty object
+        return self._document.value if self.started else {}
+
+    def value_at_path(self) -> Any:
+        value = self.remainder()
+        for key in self._path:
+            if not isinstance(value, Mapping) or key not in value:
+                return None
+            value = value[key]
+        return value
+
+    @staticmethod
+    def _depth_change(event: str) -> int:
+        if event in ("start_map", "start_array"):
+            return 1
+        if event in ("end_map", "end_array"):
+            return -1
+        return 0
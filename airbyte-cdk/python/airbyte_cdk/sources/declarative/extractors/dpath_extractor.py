@@ -3,7 +3,7 @@
 #
 
 from dataclasses import InitVar, dataclass
-from typing import Any, List, Mapping, Union
+from typing import Any, Iterable, List, Mapping, Optional, Union
 
 import dpath.util
 import requests
@@ -11,8 +11,13 @@ from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
 from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
+from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
 from airbyte_cdk.sources.declarative.types import Config
 
+# Characters dpath interprets as a glob. Paths with other globs than a single "*" segment are still resolved with dpath.
+_GLOB_CHARACTERS = ("*", "?", "[")
+_WILDCARD = "*"
+
 
 @dataclass
 class DpathExtractor(RecordExtractor):
@@ -24,6 +29,8 @@ class DpathExtractor(RecordExtractor):
     If the field path points to an empty object, an empty array is returned.
     If the field path points to a non-existing path, an empty array is returned.
 
+    When the decoder parses the response as it is received, the field path can only contain keys of objects.
+
     Examples of instantiating this transform:
     ```
       extractor:
@@ -62,20 +69,103 @@ class DpathExtractor(RecordExtractor):
         for path_index in range(len(self.field_path)):
             if isinstance(self.field_path[path_index], str):
                 self.field_path[path_index] = InterpolatedString.create(self.field_path[path_index], parameters=parameters)
+        # Segments that are not templates evaluate to the same value for every response so they are only evaluated once
+        self._path = [
+            path.eval(self.config) if self._is_static(path) else path for path in self.field_path  # type: ignore # field_path is interpolated
+        ]
+        if self.decoder.is_stream_response():
+            self._validate_streamed_path([segment for segment in self._path if isinstance(segment, str)])
 
     def extract_records(self, response: requests.Response) -> List[Mapping[str, Any]]:
+        if self.decoder.is_stream_response():
+            return list(self.stream_records(response))
         response_body = self.decoder.decode(response)
         if len(self.field_path) == 0:
             extracted = response_body
         else:
-            path = [path.eval(self.config) for path in self.field_path]
-            if "*" in path:
-                extracted = dpath.util.values(response_body, path)
+            path = self._evaluate_path()
+            if not all(self._is_plain_segment(segment) for segment in path):
+                extracted = self._extract_with_dpath(response_body, path)
+            elif _WILDCARD in path:
+                extracted = _find(response_body, path)
             else:
-                extracted = dpath.util.get(response_body, path, default=[])
+                matches = _find(response_body, path)
+                extracted = matches[0] if matches else []
         if isinstance(extracted, list):
             return extracted
         elif extracted:
             return [extracted]
         else:
             return []
+
+    def stream_records(self, response: requests.Response) -> Iterable[Mapping[str, Any]]:
+        """
+        Yields the records one at a time as the response is decoded when the decoder parses the response as it is received, so that the
+        whole response is never loaded in memory
+        """
+        if self.decoder.is_stream_response():
+            path = self._evaluate_path()
+            self._validate_streamed_path(path)
+            yield from self.decoder.decode_items(response, path)  # type: ignore # only streaming decoders decode items
+        else:
+            yield from self.extract_records(response)
+
+    def _evaluate_path(self) -> List[Any]:
+        return [segment.eval(self.config) if isinstance(segment, InterpolatedString) else segment for segment in self._path]
+
+    def _validate_streamed_path(self, path: List[Any]) -> None:
+        if not all(isinstance(segment, str) and segment != _WILDCARD and self._is_plain_segment(segment) for segment in path):
+            raise ValueError(f"Records can only be extracted from a streamed response with a field path made of object keys. Got {path}")
+
+    @staticmethod
+    def _extract_with_dpath(response_body: Any, path: List[Any]) -> Any:
+        if _WILDCARD in path:
+            return dpath.util.values(response_body, path)
+        return dpath.util.get(response_body, path, default=[])
+
+    @staticmethod
+    def _is_static(path: InterpolatedString) -> bool:
+        return not any(marker in path.string for marker in JinjaInterpolation.TEMPLATE_MARKERS)
+
+    @staticmethod
+    def _is_plain_segment(segment: Any) -> bool:
+        if isinstance(segment, str):
+            return segment == _WILDCARD or not any(character in segment for character in _GLOB_CHARACTERS)
+        return isinstance(segment, int)
+
+
+def _find(response_body: Any, path: Iterable[Any]) -> List[Any]:
+    """
+    Returns the values found at the path in the order dpath would return them. A "*" segment matches every value of an object or an
+    array, any other segment matches the key of an object or the index of an array regardless of whether it is a string or an integer.
+    """
+    nodes = [response_body]
+    for segment in path:
+        children = []
+        for node in nodes:
+            if segment == _WILDCARD:
+                if isinstance(node, Mapping):
+                    children.extend(node.values())
+                elif isinstance(node, list):
+                    children.extend(node)
+            elif isinstance(node, Mapping):
+                if segment in node:
+                    children.append(node[segment])
+                elif isinstance(segment, int) and str(segment) in node:
+                    children.append(node[str(segment)])
+                elif isinstance(segment, str) and segment.isdecimal() and int(segment) in node:
+                    children.append(node[int(segment)])
+            elif isinstance(node, list):
+                index = _to_index(segment)
+                if index is not None and index < len(node):
+                    children.append(node[index])
+        nodes = children
+    return nodes
+
+
+def _to_index(segment: Any) -> Optional[int]:
+    if isinstance(segment, int) and not isinstance(segment, bool) and segment >= 0:
+        return segment
+    if isinstance(segment, str) and segment.isdecimal():
+        return int(segment)
+    return None
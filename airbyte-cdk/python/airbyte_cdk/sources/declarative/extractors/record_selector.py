@@ -3,9 +3,10 @@
 #
 
 from dataclasses import InitVar, dataclass, field
-from typing import Any, List, Mapping, Optional
+from typing import Any, Iterable, List, Mapping, Optional
 
 import requests
+from airbyte_cdk.sources.declarative.extractors.dpath_extractor import DpathExtractor
 from airbyte_cdk.sources.declarative.extractors.http_selector import HttpSelector
 from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
 from airbyte_cdk.sources.declarative.extractors.record_filter import RecordFilter
@@ -66,6 +67,40 @@ class RecordSelector(HttpSelector):
         self._normalize_by_schema(filtered_data, schema=records_schema)
         return [Record(data, stream_slice) for data in filtered_data]
 
+    def is_stream_response(self) -> bool:
+        """
+        Indicates whether the records are extracted as the response is received, in which case they should be selected with `stream_records`
+        """
+        return isinstance(self.extractor, DpathExtractor) and self.extractor.decoder.is_stream_response()
+
+    def stream_records(
+        self,
+        response: requests.Response,
+        stream_state: StreamState,
+        records_schema: Mapping[str, Any],
+        stream_slice: Optional[StreamSlice] = None,
+        next_page_token: Optional[Mapping[str, Any]] = None,
+    ) -> Iterable[Record]:
+        """
+        Selects the records one at a time as they are extracted from the response so that only one record is held in memory
+        :param response: The response to select the records from
+        :param stream_state: The stream state
+        :param records_schema: json schema of records to return
+        :param stream_slice: The stream slice
+        :param next_page_token: The paginator token
+        :return: Records selected from the response
+        """
+        records = (
+            self.extractor.stream_records(response)
+            if isinstance(self.extractor, DpathExtractor)
+            else self.extractor.extract_records(response)
+        )
+        for data in records:
+            for filtered_data in self._filter([data], stream_state, stream_slice, next_page_token):
+                self._transform([filtered_data], stream_state, stream_slice)
+                self._normalize_by_schema([filtered_data], schema=records_schema)
+                yield Record(filtered_data, stream_slice)
+
     def _normalize_by_schema(self, records: List[Mapping[str, Any]], schema: Optional[Mapping[str, Any]]) -> List[Mapping[str, Any]]:
         if schema:
             # record has type Mapping[str, Any], but dict[str, Any] expected
@@ -3,12 +3,16 @@
 #
 
 import json
-from typing import Any, Callable, Iterable, Mapping, MutableMapping, Optional, Union
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Mapping, Optional, Tuple, Union
 
 from airbyte_cdk.sources.declarative.incremental.cursor import Cursor
 from airbyte_cdk.sources.declarative.stream_slicers.stream_slicer import StreamSlicer
 from airbyte_cdk.sources.declarative.types import Record, StreamSlice, StreamState
 
+logger = logging.getLogger("airbyte")
+
 
 class PerPartitionKeySerializer:
     """
@@ -55,26 +59,52 @@ class PerPartitionCursor(Cursor):
     Between record #3 and #4 | Duplication | #1, #2
 
     Therefore, we need to manage state per partition.
+
+    For streams with a lot of partitions, `max_partitions` bounds the number of partitions tracked. Once the limit is reached, the
+    partition that was created first is evicted and its state collapses into a global state holding the lowest cursor value of all the
+    evicted partitions. Partitions that are not part of the incoming state start from that global state so they are synced again from
+    the low-water mark instead of from scratch. This keeps memory and the size of the state bounded at the cost of re-syncing records
+    of evicted partitions.
     """
 
     _NO_STATE: Mapping[str, Any] = {}
     _NO_CURSOR_STATE: Mapping[str, Any] = {}
     _KEY = 0
     _VALUE = 1
-
-    def __init__(self, cursor_factory: CursorFactory, partition_router: StreamSlicer):
+    _GLOBAL_STATE_KEY = "state"
+
+    # Partition keys are computed once per partition object. Observing a record or building request options for a slice reuses the key
+    # of the partition of the slice instead of serializing the partition again. Only the partitions of the most recent slices are kept.
+    _MAX_CACHED_PARTITION_KEYS = 1024
+
+    def __init__(self, cursor_factory: CursorFactory, partition_router: StreamSlicer, max_partitions: Optional[int] = None):
+        """
+        :param cursor_factory: factory creating the cursor of each partition
+        :param partition_router: router generating the partitions
+        :param max_partitions: maximum number of partitions tracked. Partitions are not evicted if not provided
+        """
+        if max_partitions is not None and max_partitions < 1:
+            raise ValueError(f"max_partitions should be at least 1 but was {max_partitions}")
         self._cursor_factory = cursor_factory
         self._partition_router = partition_router
-        self._cursor_per_partition: MutableMapping[str, Cursor] = {}
+        self._max_partitions = max_partitions
+        self._cursor_per_partition: OrderedDict[str, Cursor] = OrderedDict()
         self._partition_serializer = PerPartitionKeySerializer()
+        self._partition_keys: OrderedDict[int, Tuple[Mapping[str, Any], str]] = OrderedDict()
+        # state of the partitions that were evicted during this sync or previous ones
+        self._global_state: Optional[StreamState] = None
+        # state new partitions start from. It only comes from previous syncs as a partition evicted during this sync says nothing about
+        # the records of the partitions that were not synced yet
+        self._initial_global_state: Optional[StreamState] = None
 
     def stream_slices(self) -> Iterable[StreamSlice]:
         slices = self._partition_router.stream_slices()
         for partition in slices:
-            cursor = self._cursor_per_partition.get(self._to_partition_key(partition.partition))
+            partition_key = self._to_partition_key(partition.partition)
+            cursor = self._cursor_per_partition.get(partition_key)
             if not cursor:
-                cursor = self._create_cursor(self._NO_CURSOR_STATE)
-                self._cursor_per_partition[self._to_partition_key(partition.partition)] = cursor
+                cursor = self._create_cursor(self._initial_global_state or self._NO_CURSOR_STATE)
+                self._add_cursor(partition_key, cursor)
 
             for cursor_slice in cursor.stream_slices():
                 yield StreamSlice(partition=partition, cursor_slice=cursor_slice)
@@ -83,8 +113,12 @@ class PerPartitionCursor(Cursor):
         if not stream_state:
             return
 
+        if stream_state.get(self._GLOBAL_STATE_KEY):
+            self._global_state = stream_state[self._GLOBAL_STATE_KEY]
         for state in stream_state["states"]:
-            self._cursor_per_partition[self._to_partition_key(state["partition"])] = self._create_cursor(state["cursor"])
+            self._add_cursor(self._to_partition_key(state["partition"]), self._create_cursor(state["cursor"]))
+        # partitions evicted while loading the state are folded into the global state so they start from it instead of losing their state
+        self._initial_global_state = self._global_state
 
     def observe(self, stream_slice: StreamSlice, record: Record) -> None:
         self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].observe(
@@ -113,8 +147,17 @@ class PerPartitionCursor(Cursor):
                         "cursor": cursor_state,
                     }
                 )
+        if self._global_state:
+            return {"states": states, self._GLOBAL_STATE_KEY: self._global_state}
         return {"states": states}
 
+    def _add_cursor(self, partition_key: str, cursor: Cursor) -> None:
+        self._cursor_per_partition[partition_key] = cursor
+        if self._max_partitions is not None and len(self._cursor_per_partition) > self._max_partitions:
+            evicted_partition_key, evicted_cursor = self._cursor_per_partition.popitem(last=False)
+            logger.debug(f"The number of partitions exceeds {self._max_partitions}. Partition {evicted_partition_key} is no longer tracked")
+            self._global_state = self._lowest_state(self._global_state, evicted_cursor.get_stream_state())
+
     def _get_state_for_partition(self, partition: Mapping[str, Any]) -> Optional[StreamState]:
         cursor = self._cursor_per_partition.get(self._to_partition_key(partition))
         if cursor:
@@ -126,8 +169,28 @@ class PerPartitionCursor(Cursor):
     def _is_new_state(stream_state: Mapping[str, Any]) -> bool:
         return not bool(stream_state)
 
+    def _lowest_state(self, global_state: Optional[StreamState], evicted_state: StreamState) -> StreamState:
+        if global_state is None:
+            return evicted_state
+        if not global_state or not evicted_state:
+            # a partition without state needs to be synced from scratch so the global state can't be more recent than that
+            return self._NO_CURSOR_STATE
+        comparing_cursor = self._cursor_factory.create()
+        if comparing_cursor.is_greater_than_or_equal(Record(evicted_state, None), Record(global_state, None)):
+            return global_state
+        return evicted_state
+
     def _to_partition_key(self, partition: Mapping[str, Any]) -> str:
-        return self._partition_serializer.to_partition_key(partition)
+        cached_partition_key = self._partition_keys.get(id(partition))
+        # the partition is stored along with its key so that its id can't be reused by another object while the key is cached
+        if cached_partition_key and cached_partition_key[0] is partition:
+            return cached_partition_key[1]
+
+        partition_key = self._partition_serializer.to_partition_key(partition)
+        self._partition_keys[id(partition)] = (partition, partition_key)
+        if len(self._partition_keys) > self._MAX_CACHED_PARTITION_KEYS:
+            self._partition_keys.popitem(last=False)
+        return partition_key
 
     def _to_dict(self, partition_key: str) -> Mapping[str, Any]:
         return self._partition_serializer.to_partition(partition_key)
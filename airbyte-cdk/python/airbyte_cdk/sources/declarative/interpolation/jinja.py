@@ -3,17 +3,30 @@
 #
 
 import ast
-from typing import Any, Mapping, Optional, Tuple, Type
+from functools import lru_cache
+from typing import Any, FrozenSet, Mapping, NamedTuple, Optional, Tuple, Type
 
 from airbyte_cdk.sources.declarative.interpolation.filters import filters
 from airbyte_cdk.sources.declarative.interpolation.interpolation import Interpolation
 from airbyte_cdk.sources.declarative.interpolation.macros import macros
 from airbyte_cdk.sources.declarative.types import Config
 from jinja2 import meta
+from jinja2.environment import Template
 from jinja2.exceptions import UndefinedError
 from jinja2.sandbox import Environment
 
 
+class TemplateCacheInfo(NamedTuple):
+    """
+    Statistics of the compiled template cache, as returned by functools.lru_cache
+    """
+
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
 class JinjaInterpolation(Interpolation):
     """
     Interpolation strategy using the Jinja2 template engine.
@@ -48,6 +61,13 @@ class JinjaInterpolation(Interpolation):
     # Please add a unit test to test_jinja.py when adding a restriction.
     RESTRICTED_BUILTIN_FUNCTIONS = ["range"]  # The range function can cause very expensive computations
 
+    # Markers opening a jinja block. A string without any of them is rendered as itself so it does not need to go through jinja.
+    TEMPLATE_MARKERS = ("{{", "{%", "{#")
+
+    # Maximum number of compiled templates kept per instance. Templates are evaluated for every request and every record, so compiling
+    # them once and reusing the result avoids re-parsing the same string over and over.
+    MAX_CACHED_TEMPLATES = 256
+
     def __init__(self) -> None:
         self._environment = Environment()
         self._environment.filters.update(**filters)
@@ -58,6 +78,14 @@ class JinjaInterpolation(Interpolation):
         for builtin in self.RESTRICTED_BUILTIN_FUNCTIONS:
             self._environment.globals.pop(builtin, None)
 
+        self._compile = lru_cache(maxsize=self.MAX_CACHED_TEMPLATES)(self._compile_template)
+
+    def cache_info(self) -> TemplateCacheInfo:
+        """
+        Return the hits, misses and size of the compiled template cache
+        """
+        return TemplateCacheInfo(*self._compile.cache_info())
+
     def eval(
         self,
         input_str: str,
@@ -100,14 +128,24 @@ class JinjaInterpolation(Interpolation):
         return result
 
     def _eval(self, s: Optional[str], context: Mapping[str, Any]) -> Optional[str]:
-        try:
-            ast = self._environment.parse(s)  # type: ignore # parse is able to handle None
-            undeclared = meta.find_undeclared_variables(ast)
-            undeclared_not_in_context = {var for var in undeclared if var not in context}
-            if undeclared_not_in_context:
-                raise ValueError(f"Jinja macro has undeclared variables: {undeclared_not_in_context}. Context: {context}")
-            return self._environment.from_string(s).render(context)  # type: ignore # from_string is able to handle None
-        except TypeError:
+        if not isinstance(s, str) or self._is_static(s):
             # The string is a static value, not a jinja template
             # It can be returned as is
             return s
+        template, undeclared = self._compile(s)
+        undeclared_not_in_context = {var for var in undeclared if var not in context}
+        if undeclared_not_in_context:
+            raise ValueError(f"Jinja macro has undeclared variables: {undeclared_not_in_context}. Context: {context}")
+        try:
+            return template.render(context)
+        except TypeError:
+            return s
+
+    def _is_static(self, s: str) -> bool:
+        # jinja drops a single trailing newline when rendering so those strings still need to be rendered to keep the same output
+        return not any(marker in s for marker in self.TEMPLATE_MARKERS) and not s.endswith("\n")
+
+    def _compile_template(self, s: str) -> Tuple[Template, FrozenSet[str]]:
+        ast = self._environment.parse(s)
+        undeclared = frozenset(meta.find_undeclared_variables(ast))
+        return self._environment.from_string(ast), undeclared
@@ -0,0 +1,27 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from typing import Any, Dict, Mapping, Optional
+
+from airbyte_cdk.utils.json_file_cache import JsonFileCache
+
+
+class ManifestCache:
+    """
+    Caches manifests once their references are resolved, their types and parameters are propagated and they are validated against the
+    declarative component schema so that these steps are skipped the next time a source is created from the same manifest.
+
+    Entries are keyed by a hash of the manifest along with the version of the CDK, so a manifest is processed again as soon as it or the
+    CDK changes. The cache can be populated when building the image of a connector by running any command with the cache directory set.
+    """
+
+    def __init__(self, directory: str, max_entries: int = JsonFileCache.DEFAULT_MAX_ENTRIES) -> None:
+        self._cache = JsonFileCache(directory, max_entries)
+
+    def get(self, manifest: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+        return self._cache.get(manifest)  # type: ignore  # the cache only contains manifests
+
+    def set(self, manifest: Mapping[str, Any], resolved_manifest: Mapping[str, Any]) -> None:
+        # manifests with values that can't be serialized (e.g. dates parsed from YAML) are not cached
+        self._cache.set(manifest, resolved_manifest)
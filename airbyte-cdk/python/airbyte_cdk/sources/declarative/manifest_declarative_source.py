@@ -4,11 +4,12 @@
 
 import json
 import logging
+import os
 import pkgutil
 import re
 from copy import deepcopy
 from importlib import metadata
-from typing import Any, Dict, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
+from typing import AbstractSet, Any, Dict, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 import yaml
 from airbyte_cdk.models import (
@@ -20,16 +21,20 @@ from airbyte_cdk.models import (
 )
 from airbyte_cdk.sources.declarative.checks.connection_checker import ConnectionChecker
 from airbyte_cdk.sources.declarative.declarative_source import DeclarativeSource
+from airbyte_cdk.sources.declarative.manifest_cache import ManifestCache
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import CheckStream as CheckStreamModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import DeclarativeStream as DeclarativeStreamModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import Spec as SpecModel
 from airbyte_cdk.sources.declarative.parsers.manifest_component_transformer import ManifestComponentTransformer
 from airbyte_cdk.sources.declarative.parsers.manifest_reference_resolver import ManifestReferenceResolver
 from airbyte_cdk.sources.declarative.parsers.model_to_component_factory import ModelToComponentFactory
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_store import ParentRecordStore
 from airbyte_cdk.sources.declarative.types import ConnectionDefinition
 from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.streams.core import Stream
+from airbyte_cdk.sources.streams.http.async_transport import AsyncHttpTransport
 from airbyte_cdk.sources.utils.slice_logger import AlwaysLogSliceLogger, DebugSliceLogger, SliceLogger
+from airbyte_cdk.utils.constants import ENV_ASYNC_HTTP_TRANSPORT, ENV_MANIFEST_CACHE_PATH, ENV_REQUEST_CACHE_PATH
 from jsonschema.exceptions import ValidationError
 from jsonschema.validators import validate
 
@@ -45,11 +50,14 @@ class ManifestDeclarativeSource(DeclarativeSource):
         debug: bool = False,
         emit_connector_builder_messages: bool = False,
         component_factory: Optional[ModelToComponentFactory] = None,
+        manifest_cache_directory: Optional[str] = None,
     ):
         """
         :param source_config(Mapping[str, Any]): The manifest of low-code components that describe the source connector
         :param debug(bool): True if debug mode is enabled
         :param component_factory(ModelToComponentFactory): optional factory if ModelToComponentFactory's default behaviour needs to be tweaked
+        :param manifest_cache_directory(Optional[str]): directory where the resolved and validated manifest is cached. Defaults to the
+         MANIFEST_CACHE_PATH environment variable. The manifest is not cached if neither is set
         """
         self.logger = logging.getLogger(f"airbyte.{self.name}")
 
@@ -58,16 +66,28 @@ class ManifestDeclarativeSource(DeclarativeSource):
         if "type" not in manifest:
             manifest["type"] = "DeclarativeSource"
 
-        resolved_source_config = ManifestReferenceResolver().preprocess_manifest(manifest)
-        propagated_source_config = ManifestComponentTransformer().propagate_types_and_parameters("", resolved_source_config, {})
-        self._source_config = propagated_source_config
+        manifest_cache_directory = manifest_cache_directory or os.getenv(ENV_MANIFEST_CACHE_PATH)
+        manifest_cache = ManifestCache(manifest_cache_directory) if manifest_cache_directory else None
+        cached_source_config = manifest_cache.get(manifest) if manifest_cache else None
+        if cached_source_config is not None:
+            self._source_config = cached_source_config
+        else:
+            resolved_source_config = ManifestReferenceResolver().preprocess_manifest(manifest)
+            propagated_source_config = ManifestComponentTransformer().propagate_types_and_parameters("", resolved_source_config, {})
+            self._source_config = propagated_source_config
         self._debug = debug
         self._emit_connector_builder_messages = emit_connector_builder_messages
         self._constructor = component_factory if component_factory else ModelToComponentFactory(emit_connector_builder_messages)
         self._message_repository = self._constructor.get_message_repository()
         self._slice_logger: SliceLogger = AlwaysLogSliceLogger() if emit_connector_builder_messages else DebugSliceLogger()
+        # The names of the streams selected in the catalog of the read in progress, if any
+        self._selected_stream_names: AbstractSet[str] = frozenset()
 
-        self._validate_source()
+        # cached manifests were validated before being cached and validation only depends on the manifest and the CDK version
+        if cached_source_config is None:
+            self._validate_source()
+            if manifest_cache:
+                manifest_cache.set(manifest, self._source_config)
 
     @property
     def resolved_manifest(self) -> Mapping[str, Any]:
@@ -93,24 +113,33 @@ class ManifestDeclarativeSource(DeclarativeSource):
     def streams(self, config: Mapping[str, Any]) -> List[Stream]:
         self._emit_manifest_debug_message(extra_args={"source_name": self.name, "parsed_config": json.dumps(self._source_config)})
         stream_configs = self._stream_configs(self._source_config)
+        # Child streams created by this call share the values read from their parent streams. A new store is used for every call so
+        # that the values of one read are not reused by another one
+        self._constructor.set_parent_record_store(ParentRecordStore(os.getenv(ENV_REQUEST_CACHE_PATH)))
 
         source_streams = [
             self._constructor.create_component(
                 DeclarativeStreamModel, stream_config, config, emit_connector_builder_messages=self._emit_connector_builder_messages
             )
-            for stream_config in self._initialize_cache_for_parent_streams(deepcopy(stream_configs))
+            for stream_config in self._initialize_cache_for_parent_streams(deepcopy(stream_configs), self._selected_stream_names)
         ]
 
         return source_streams
 
     @staticmethod
-    def _initialize_cache_for_parent_streams(stream_configs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _initialize_cache_for_parent_streams(
+        stream_configs: List[Dict[str, Any]], selected_stream_names: AbstractSet[str] = frozenset()
+    ) -> List[Dict[str, Any]]:
+        # The values read from the parents of substream partition routers are shared between their children through the
+        # ParentRecordStore. Those parents are only cached when they are also selected, so that they are not requested again when the
+        # parent stream itself is read
         parent_streams = set()
 
         def update_with_cache_parent_configs(parent_configs: list[dict[str, Any]]) -> None:
             for parent_config in parent_configs:
-                parent_streams.add(parent_config["stream"]["name"])
-                parent_config["stream"]["retriever"]["requester"]["use_cache"] = True
+                if parent_config["stream"]["name"] in selected_stream_names:
+                    parent_streams.add(parent_config["stream"]["name"])
+                    parent_config["stream"]["retriever"]["requester"]["use_cache"] = True
 
         for stream_config in stream_configs:
             if stream_config.get("incremental_sync", {}).get("parent_stream"):
@@ -164,7 +193,18 @@ class ManifestDeclarativeSource(DeclarativeSource):
         state: Optional[Union[List[AirbyteStateMessage], MutableMapping[str, Any]]] = None,
     ) -> Iterator[AirbyteMessage]:
         self._configure_logger_level(logger)
-        yield from super().read(logger, config, catalog, state)
+        # The requests of all the streams of the read share the connections of a single transport when the ASYNC_HTTP_TRANSPORT environment
+        # variable is set. The transport is closed once the read is done
+        http_transport = AsyncHttpTransport() if os.getenv(ENV_ASYNC_HTTP_TRANSPORT) else None
+        self._constructor.set_http_transport(http_transport)
+        self._selected_stream_names = frozenset(configured_stream.stream.name for configured_stream in catalog.streams)
+        try:
+            yield from super().read(logger, config, catalog, state)
+        finally:
+            self._selected_stream_names = frozenset()
+            self._constructor.set_http_transport(None)
+            if http_transport:
+                http_transport.close()
 
     def _configure_logger_level(self, logger: logging.Logger) -> None:
         """
@@ -481,6 +481,10 @@ class JsonDecoder(BaseModel):
     type: Literal['JsonDecoder']
 
 
+class StreamingJsonDecoder(BaseModel):
+    type: Literal['StreamingJsonDecoder']
+
+
 class MinMaxDatetime(BaseModel):
     type: Literal['MinMaxDatetime']
     datetime: str = Field(
@@ -1050,7 +1054,7 @@ class DpathExtractor(BaseModel):
         ],
         title='Field Path',
     )
-    decoder: Optional[JsonDecoder] = Field(
+    decoder: Optional[Union[JsonDecoder, StreamingJsonDecoder]] = Field(
         None,
         description='Component decoding the response so records can be extracted.',
         title='Decoder',
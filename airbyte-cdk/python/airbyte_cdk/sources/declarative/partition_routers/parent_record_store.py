@@ -0,0 +1,138 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import os
+import pickle
+import tempfile
+import weakref
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+# The partition of the parent slice a record comes from along with the value of the parent key of the record
+ParentPartitionValue = Tuple[Mapping[str, Any], Any]
+
+
+class ParentRecordStore:
+    """
+    Stores the values extracted from the records of parent streams so that child streams sharing the same parent only read it once.
+
+    Only the value of the parent key of each record and the partition of the parent slice it comes from are kept, not the records or
+    the HTTP responses they come from. If a directory is provided, the values are written to a file in that directory instead of being
+    kept in memory. Values are only reused once the parent stream has been read until the end, so a read that was interrupted is done
+    again by the next child stream.
+    """
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        """
+        :param directory: directory the values are written to. Values are kept in memory if not provided
+        """
+        self._directory = directory
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._entries: Dict[str, "_Entry"] = {}
+        self._files: List[str] = []
+        # the files are removed once the store is not used anymore
+        weakref.finalize(self, _remove_files, self._files)
+
+    def read(self, key: str, read_parent: Callable[[], Iterable[ParentPartitionValue]]) -> Iterable[ParentPartitionValue]:
+        """
+        Return the values stored for the key if the parent was already read until the end. Otherwise, read the parent and store its values.
+
+        :param key: identifies the parent stream and how the values are extracted from its records
+        :param read_parent: function reading the values from the parent stream
+        """
+        stored_entry = self._entries.get(key)
+        if stored_entry:
+            yield from stored_entry.values()
+            return
+
+        entry = _FileEntry(self._directory, self._files) if self._directory else _InMemoryEntry()
+        try:
+            for partition, value in read_parent():
+                entry.append(partition, value)
+                yield partition, value
+            if entry.is_storable:
+                self._entries[key] = entry
+        finally:
+            entry.close()
+
+
+class _Entry(ABC):
+    def __init__(self) -> None:
+        self.is_storable = True
+        # the records of a parent slice share the same partition so partitions are only stored once per slice
+        self._partitions: List[Mapping[str, Any]] = []
+
+    def append(self, partition: Mapping[str, Any], value: Any) -> None:
+        if not self.is_storable:
+            return
+        if not self._partitions or self._partitions[-1] is not partition:
+            self._partitions.append(partition)
+        self._append(len(self._partitions) - 1, value)
+
+    def values(self) -> Iterable[ParentPartitionValue]:
+        for partition_index, value in self._values():
+            yield self._partitions[partition_index], value
+
+    def close(self) -> None:
+        pass
+
+    @abstractmethod
+    def _append(self, partition_index: int, value: Any) -> None:
+        pass
+
+    @abstractmethod
+    def _values(self) -> Iterable[Tuple[int, Any]]:
+        pass
+
+
+class _InMemoryEntry(_Entry):
+    def __init__(self) -> None:
+        super().__init__()
+        self._stored_values: List[Tuple[int, Any]] = []
+
+    def _append(self, partition_index: int, value: Any) -> None:
+        self._stored_values.append((partition_index, value))
+
+    def _values(self) -> Iterable[Tuple[int, Any]]:
+        yield from self._stored_values
+
+
+class _FileEntry(_Entry):
+    # Values are pickled rather than serialized as JSON so that they are read back with the same types as when they are kept in memory,
+    # e.g. tuples don't become lists and integer keys don't become strings
+    def __init__(self, directory: Optional[str], files: List[str]) -> None:
+        super().__init__()
+        fd, self._path = tempfile.mkstemp(dir=directory, prefix="parent_records_", suffix=".pickle")
+        files.append(self._path)
+        self._file = os.fdopen(fd, "wb")
+
+    def _append(self, partition_index: int, value: Any) -> None:
+        try:
+            entry = pickle.dumps((partition_index, value), protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # values that can't be serialized are not stored, the parent will be read again by the next child stream
+            self.is_storable = False
+            return
+        self._file.write(entry)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def _values(self) -> Iterable[Tuple[int, Any]]:
+        with open(self._path, "rb") as values_file:
+            while True:
+                try:
+                    partition_index, value = pickle.load(values_file)
+                except EOFError:
+                    return
+                yield partition_index, value
+
+
+def _remove_files(files: List[str]) -> None:
+    for path in files:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
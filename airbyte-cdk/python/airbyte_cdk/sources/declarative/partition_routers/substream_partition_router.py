@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any, Iterable, List, Mapping, Optional, Union
 import dpath.util
 from airbyte_cdk.models import AirbyteMessage, SyncMode, Type
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_store import ParentPartitionValue, ParentRecordStore
 from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
 from airbyte_cdk.sources.declarative.stream_slicers.stream_slicer import StreamSlicer
 from airbyte_cdk.sources.declarative.types import Config, Record, StreamSlice, StreamState
@@ -25,6 +26,9 @@ class ParentStreamConfig:
     parent_key: The key of the parent stream's records that will be the stream slice key
     partition_field: The partition key
     request_option: How to inject the slice value on an outgoing HTTP request
+    parent_record_store: Store sharing the values read from the parent stream with other partition routers
+    parent_record_store_key: Identifies the parent stream in the parent_record_store. Partition routers using parent streams with the same
+     key reuse the values read from the parent instead of reading it again
     """
 
     stream: "DeclarativeStream"  # Parent streams must be DeclarativeStream because we can't know which part of the stream slice is a partition for regular Stream
@@ -33,6 +37,8 @@ class ParentStreamConfig:
     config: Config
     parameters: InitVar[Mapping[str, Any]]
     request_option: Optional[RequestOption] = None
+    parent_record_store: Optional[ParentRecordStore] = None
+    parent_record_store_key: Optional[str] = None
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         self.parent_key = InterpolatedString.create(self.parent_key, parameters=parameters)
@@ -124,35 +130,38 @@ class SubstreamPartitionRouter(StreamSlicer):
             yield from []
         else:
             for parent_stream_config in self.parent_stream_configs:
-                parent_stream = parent_stream_config.stream
                 parent_field = parent_stream_config.parent_key.eval(self.config)  # type: ignore # parent_key is always casted to an interpolated string
                 partition_field = parent_stream_config.partition_field.eval(self.config)  # type: ignore # partition_field is always casted to an interpolated string
-                for parent_stream_slice in parent_stream.stream_slices(
-                    sync_mode=SyncMode.full_refresh, cursor_field=None, stream_state=None
-                ):
-                    empty_parent_slice = True
-                    parent_partition = parent_stream_slice.partition if parent_stream_slice else {}
-
-                    for parent_record in parent_stream.read_records(
-                        sync_mode=SyncMode.full_refresh, cursor_field=None, stream_slice=parent_stream_slice, stream_state=None
-                    ):
-                        # Skip non-records (eg AirbyteLogMessage)
-                        if isinstance(parent_record, AirbyteMessage):
-                            if parent_record.type == Type.RECORD:
-                                parent_record = parent_record.record.data
-                            else:
-                                continue
-                        elif isinstance(parent_record, Record):
-                            parent_record = parent_record.data
-                        try:
-                            partition_value = dpath.util.get(parent_record, parent_field)
-                        except KeyError:
-                            pass
-                        else:
-                            empty_parent_slice = False
-                            yield StreamSlice(
-                                partition={partition_field: partition_value, "parent_slice": parent_partition}, cursor_slice={}
-                            )
-                    # If the parent slice contains no records,
-                    if empty_parent_slice:
-                        yield from []
+                for parent_partition, partition_value in self._read_partition_values(parent_stream_config, parent_field):
+                    yield StreamSlice(partition={partition_field: partition_value, "parent_slice": parent_partition}, cursor_slice={})
+
+    def _read_partition_values(self, parent_stream_config: ParentStreamConfig, parent_field: str) -> Iterable[ParentPartitionValue]:
+        if parent_stream_config.parent_record_store and parent_stream_config.parent_record_store_key:
+            return parent_stream_config.parent_record_store.read(
+                f"{parent_stream_config.parent_record_store_key}/{parent_field}",
+                lambda: self._read_partition_values_from_parent(parent_stream_config.stream, parent_field),
+            )
+        return self._read_partition_values_from_parent(parent_stream_config.stream, parent_field)
+
+    @staticmethod
+    def _read_partition_values_from_parent(parent_stream: "DeclarativeStream", parent_field: str) -> Iterable[ParentPartitionValue]:
+        for parent_stream_slice in parent_stream.stream_slices(sync_mode=SyncMode.full_refresh, cursor_field=None, stream_state=None):
+            parent_partition = parent_stream_slice.partition if parent_stream_slice else {}
+
+            for parent_record in parent_stream.read_records(
+                sync_mode=SyncMode.full_refresh, cursor_field=None, stream_slice=parent_stream_slice, stream_state=None
+            ):
+                # Skip non-records (eg AirbyteLogMessage)
+                if isinstance(parent_record, AirbyteMessage):
+                    if parent_record.type == Type.RECORD:
+                        parent_record = parent_record.record.data
+                    else:
+                        continue
+                elif isinstance(parent_record, Record):
+                    parent_record = parent_record.data
+                try:
+                    partition_value = dpath.util.get(parent_record, parent_field)
+                except KeyError:
+                    pass
+                else:
+                    yield parent_partition, partition_value
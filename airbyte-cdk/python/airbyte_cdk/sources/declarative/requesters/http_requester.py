@@ -28,6 +28,7 @@ from airbyte_cdk.sources.declarative.requesters.requester import HttpMethod, Req
 from airbyte_cdk.sources.declarative.types import Config, StreamSlice, StreamState
 from airbyte_cdk.sources.http_config import MAX_CONNECTION_POOL_SIZE
 from airbyte_cdk.sources.message import MessageRepository, NoopMessageRepository
+from airbyte_cdk.sources.streams.http.async_transport import AsyncHttpTransport
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
 from airbyte_cdk.sources.streams.http.http import BODY_REQUEST_METHODS
 from airbyte_cdk.sources.streams.http.rate_limiting import default_backoff_handler, user_defined_backoff_handler
@@ -51,6 +52,8 @@ class HttpRequester(Requester):
         error_handler (Optional[ErrorHandler]): Error handler defining how to detect and handle errors
         config (Config): The user-provided configuration as specified by the source's spec
         use_cache (bool): Indicates that data should be cached for this stream
+        http_transport (Optional[AsyncHttpTransport]): Transport sending the requests, shared with the other requesters of the source
+        stream_response (bool): Indicates that the content of the responses is read as it is parsed instead of being loaded before returning
     """
 
     name: str
@@ -65,6 +68,8 @@ class HttpRequester(Requester):
     disable_retries: bool = False
     message_repository: MessageRepository = NoopMessageRepository()
     use_cache: bool = False
+    http_transport: Optional[AsyncHttpTransport] = None
+    stream_response: bool = False
 
     _DEFAULT_MAX_RETRY = 5
     _DEFAULT_RETRY_FACTOR = 5
@@ -88,6 +93,8 @@ class HttpRequester(Requester):
         self._session.mount(
             "https://", requests.adapters.HTTPAdapter(pool_connections=MAX_CONNECTION_POOL_SIZE, pool_maxsize=MAX_CONNECTION_POOL_SIZE)
         )
+        if self.http_transport:
+            self.http_transport.mount(self._session)
 
         if isinstance(self._authenticator, AuthBase):
             self._session.auth = self._authenticator
@@ -531,8 +538,10 @@ class HttpRequester(Requester):
         self.logger.debug(
             "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
         )
-        response: requests.Response = self._session.send(request)
-        self.logger.debug("Receiving response", extra={"headers": response.headers, "status": response.status_code, "body": response.text})
+        response: requests.Response = self._session.send(request, stream=self.stream_response)
+        # The body of streamed responses is not logged as it would load the whole content in memory
+        body = None if self.stream_response else response.text
+        self.logger.debug("Receiving response", extra={"headers": response.headers, "status": response.status_code, "body": body})
         if log_formatter:
             formatter = log_formatter
             self.message_repository.log_message(
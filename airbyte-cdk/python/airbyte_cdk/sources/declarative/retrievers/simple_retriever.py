@@ -10,6 +10,7 @@ from typing import Any, Callable, Iterable, List, Mapping, Optional, Set, Tuple,
 import requests
 from airbyte_cdk.models import AirbyteMessage
 from airbyte_cdk.sources.declarative.extractors.http_selector import HttpSelector
+from airbyte_cdk.sources.declarative.extractors.record_selector import RecordSelector
 from airbyte_cdk.sources.declarative.incremental.cursor import Cursor
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
 from airbyte_cdk.sources.declarative.partition_routers.single_partition_router import SinglePartitionRouter
@@ -227,6 +228,8 @@ class SimpleRetriever(Retriever):
             return []
 
         self._last_response = response
+        if isinstance(self.record_selector, RecordSelector) and self.record_selector.is_stream_response():
+            return self._stream_records(response, stream_state, records_schema, stream_slice, next_page_token)
         records = self.record_selector.select_records(
             response=response,
             stream_state=stream_state,
@@ -237,6 +240,26 @@ class SimpleRetriever(Retriever):
         self._records_from_last_response = records
         return records
 
+    def _stream_records(
+        self,
+        response: requests.Response,
+        stream_state: StreamState,
+        records_schema: Mapping[str, Any],
+        stream_slice: Optional[StreamSlice],
+        next_page_token: Optional[Mapping[str, Any]],
+    ) -> Iterable[Record]:
+        # Records of streamed responses are not kept in memory so the paginator only gets the last record of the page
+        self._records_from_last_response = []
+        for record in self.record_selector.stream_records(  # type: ignore # the record selector is a RecordSelector when streaming
+            response=response,
+            stream_state=stream_state,
+            records_schema=records_schema,
+            stream_slice=stream_slice,
+            next_page_token=next_page_token,
+        ):
+            self._records_from_last_response = [record]
+            yield record
+
     @property  # type: ignore
     def primary_key(self) -> Optional[Union[str, List[str], List[List[str]]]]:
         """The stream's primary key"""
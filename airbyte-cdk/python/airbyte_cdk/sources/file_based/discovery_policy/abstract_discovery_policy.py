@@ -3,6 +3,7 @@
 #
 
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
 
@@ -10,7 +11,8 @@ from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeP
 class AbstractDiscoveryPolicy(ABC):
     """
     Used during discovery; allows the developer to configure the number of concurrent
-    requests to send to the source, and the number of files to use for schema discovery.
+    requests to send to the source, the number of files to use for schema discovery,
+    how many threads infer the schemas of the files and where these schemas are cached.
     """
 
     @property
@@ -21,3 +23,19 @@ class AbstractDiscoveryPolicy(ABC):
     @abstractmethod
     def get_max_n_files_for_schema_inference(self, parser: FileTypeParser) -> int:
         ...
+
+    @property
+    def n_schema_inference_workers(self) -> int:
+        """
+        Number of threads inferring the schemas of files in parallel. Parsers infer schemas synchronously, so if this is 0, the schemas
+        are inferred one file at a time.
+        """
+        return 0
+
+    @property
+    def schema_inference_cache_directory(self) -> Optional[str]:
+        """
+        Local directory where the schemas inferred for each file are cached so a repeated discover only infers the schemas of the files
+        that changed. Schemas are not cached if None.
+        """
+        return None
@@ -0,0 +1,32 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from typing import List, Optional
+
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.schema_helpers import SchemaType
+from airbyte_cdk.utils.json_file_cache import JsonFileCache
+
+
+class FileSchemaCache:
+    """
+    Caches the schemas inferred for files in a local directory.
+
+    Entries are keyed by the uri, last modification time and etag of the file along with a description of how the file is parsed (e.g. the
+    format options of the stream) and the version of the CDK, so a schema is inferred again as soon as the file, the way it is parsed or the
+    CDK changes. The least recently used schemas are removed once the directory holds more than `max_entries` schemas.
+    """
+
+    def __init__(self, directory: str, max_entries: int = JsonFileCache.DEFAULT_MAX_ENTRIES) -> None:
+        self._cache = JsonFileCache(directory, max_entries)
+
+    def get(self, file: RemoteFile, parsing_key: str) -> Optional[SchemaType]:
+        return self._cache.get(self._key(file, parsing_key))  # type: ignore  # the cache only contains schemas
+
+    def set(self, file: RemoteFile, parsing_key: str, schema: SchemaType) -> None:
+        self._cache.set(self._key(file, parsing_key), schema)
+
+    @staticmethod
+    def _key(file: RemoteFile, parsing_key: str) -> List[Optional[str]]:
+        return [file.uri, file.last_modified.isoformat(), file.etag, parsing_key]
@@ -8,10 +8,13 @@ import logging
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from functools import partial
-from io import IOBase
+from io import IOBase, RawIOBase
+from itertools import islice
 from typing import Any, Callable, Dict, Generator, Iterable, List, Mapping, Optional, Set, Tuple
 from uuid import uuid4
 
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from airbyte_cdk.models import FailureType
 from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat, CsvHeaderAutogenerated, CsvHeaderUserProvided, InferenceType
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
@@ -37,28 +40,11 @@ class _CsvReader:
         config_format = _extract_format(config)
         lineno = 0
 
-        # Formats are configured individually per-stream so a unique dialect should be registered for each stream.
-        # We don't unregister the dialect because we are lazily parsing each csv file to generate records
-        # Give each stream's dialect a unique name; otherwise, when we are doing a concurrent sync we can end up
-        # with a race condition where a thread attempts to use a dialect before a separate thread has finished
-        # registering it.
-        dialect_name = f"{config.name}_{str(uuid4())}_{DIALECT_NAME}"
-        csv.register_dialect(
-            dialect_name,
-            delimiter=config_format.delimiter,
-            quotechar=config_format.quote_char,
-            escapechar=config_format.escape_char,
-            doublequote=config_format.double_quote,
-            quoting=csv.QUOTE_MINIMAL,
-        )
+        dialect_name = self._register_dialect(config, config_format)
         with stream_reader.open_file(file, file_read_mode, config_format.encoding, logger) as fp:
             headers = self._get_headers(fp, config_format, dialect_name)
 
-            rows_to_skip = (
-                config_format.skip_rows_before_header
-                + (1 if config_format.header_definition.has_header_row() else 0)
-                + config_format.skip_rows_after_header
-            )
+            rows_to_skip = self._get_rows_to_skip(config_format)
             self._skip_rows(fp, rows_to_skip)
             lineno += rows_to_skip
 
@@ -90,6 +76,32 @@ class _CsvReader:
                 # due to RecordParseError or GeneratorExit
                 csv.unregister_dialect(dialect_name)
 
+    @staticmethod
+    def _register_dialect(config: FileBasedStreamConfig, config_format: CsvFormat) -> str:
+        # Formats are configured individually per-stream so a unique dialect should be registered for each stream.
+        # We don't unregister the dialect because we are lazily parsing each csv file to generate records
+        # Give each stream's dialect a unique name; otherwise, when we are doing a concurrent sync we can end up
+        # with a race condition where a thread attempts to use a dialect before a separate thread has finished
+        # registering it.
+        dialect_name = f"{config.name}_{str(uuid4())}_{DIALECT_NAME}"
+        csv.register_dialect(
+            dialect_name,
+            delimiter=config_format.delimiter,
+            quotechar=config_format.quote_char,
+            escapechar=config_format.escape_char,
+            doublequote=config_format.double_quote,
+            quoting=csv.QUOTE_MINIMAL,
+        )
+        return dialect_name
+
+    @staticmethod
+    def _get_rows_to_skip(config_format: CsvFormat) -> int:
+        return (
+            config_format.skip_rows_before_header
+            + (1 if config_format.header_definition.has_header_row() else 0)
+            + config_format.skip_rows_after_header
+        )
+
     def _get_headers(self, fp: IOBase, config_format: CsvFormat, dialect_name: str) -> List[str]:
         """
         Assumes the fp is pointing to the beginning of the files and will reset it as such
@@ -128,11 +140,94 @@ class _CsvReader:
             fp.readline()
 
 
+class _ArrowCsvReader(_CsvReader):
+    """
+    Reads the rows of a csv file in batches of columns using pyarrow's csv reader.
+
+    Headers and the rows to skip are handled by _CsvReader so both readers agree on where the data starts. pyarrow only parses the
+    rows after that and raises a pyarrow.ArrowException if it can't, for example when a row does not have as many values as there
+    are headers.
+    """
+
+    # Number of bytes pyarrow parses at once. Each block is converted to one batch of columns.
+    BLOCK_SIZE = 1 << 20
+
+    def read_columns(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        file_read_mode: FileReadMode,
+    ) -> Generator[Tuple[List[str], List[List[str]]], None, None]:
+        """
+        Yields the headers along with the values of each column for every batch of rows in the file.
+        """
+        config_format = _extract_format(config)
+        dialect_name = self._register_dialect(config, config_format)
+        try:
+            with stream_reader.open_file(file, file_read_mode, config_format.encoding, logger) as fp:
+                headers = self._get_headers(fp, config_format, dialect_name)
+                self._skip_rows(fp, self._get_rows_to_skip(config_format))
+
+                reader = pa_csv.open_csv(
+                    _Utf8Stream(fp),
+                    read_options=pa_csv.ReadOptions(column_names=headers, block_size=self.BLOCK_SIZE),
+                    parse_options=pa_csv.ParseOptions(
+                        delimiter=config_format.delimiter,
+                        quote_char=config_format.quote_char,
+                        double_quote=config_format.double_quote,
+                        escape_char=config_format.escape_char or False,
+                        newlines_in_values=True,
+                    ),
+                    # Values are kept as strings so they are cast the same way as the values read by _CsvReader
+                    convert_options=pa_csv.ConvertOptions(
+                        column_types={header: pa.string() for header in headers}, strings_can_be_null=False
+                    ),
+                )
+                for batch in reader:
+                    # going through numpy is an order of magnitude faster than Array.to_pylist() for strings
+                    yield headers, [column.to_numpy(zero_copy_only=False).tolist() for column in batch.columns]
+        finally:
+            csv.unregister_dialect(dialect_name)
+
+
+class _Utf8Stream(RawIOBase):
+    """
+    Exposes a file opened in text mode as an utf-8 encoded binary stream. The stream readers open csv files in text mode, which takes
+    care of the encoding of the file and of its newlines, while pyarrow only reads utf-8 encoded bytes.
+    """
+
+    def __init__(self, fp: IOBase) -> None:
+        self._fp = fp
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        size = len(buffer)
+        while len(self._pending) < size:
+            chunk = self._fp.read(size)
+            if not chunk:
+                break
+            self._pending += chunk.encode("utf-8", "surrogatepass") if isinstance(chunk, str) else chunk
+        data, self._pending = self._pending[:size], self._pending[size:]
+        buffer[: len(data)] = data
+        return len(data)
+
+
 class CsvParser(FileTypeParser):
     _MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE = 1_000_000
 
-    def __init__(self, csv_reader: Optional[_CsvReader] = None):
+    def __init__(self, csv_reader: Optional[_CsvReader] = None, use_pyarrow: bool = False):
+        """
+        :param csv_reader: reader used to infer schemas and, unless use_pyarrow is set, to read records
+        :param use_pyarrow: read records with pyarrow's csv reader. If pyarrow fails to parse a file, the rest of the file is read with
+            csv_reader so invalid rows are reported the same way
+        """
         self._csv_reader = csv_reader if csv_reader else _CsvReader()
+        self._arrow_csv_reader = _ArrowCsvReader() if use_pyarrow else None
 
     def check_config(self, config: FileBasedStreamConfig) -> Tuple[bool, Optional[str]]:
         """
@@ -190,6 +285,7 @@ class CsvParser(FileTypeParser):
         discovered_schema: Optional[Mapping[str, SchemaType]],
     ) -> Iterable[Dict[str, Any]]:
         line_no = 0
+        data_generator: Optional[Generator[Dict[str, Any], None, None]] = None
         try:
             config_format = _extract_format(config)
             if discovered_schema:
@@ -197,9 +293,25 @@ class CsvParser(FileTypeParser):
                 deduped_property_types = CsvParser._pre_propcess_property_types(property_types)
             else:
                 deduped_property_types = {}
+
+            if self._arrow_csv_reader:
+                arrow_rows = self._read_rows_with_arrow(self._arrow_csv_reader, config, file, stream_reader, logger, deduped_property_types)
+                try:
+                    for row in arrow_rows:
+                        line_no += 1
+                        yield row
+                    return
+                except pa.ArrowException as exc:
+                    logger.debug(
+                        f"pyarrow could not parse {file.uri} after line {line_no}, reading the rest of the file with python: {exc}"
+                    )
+                finally:
+                    arrow_rows.close()
+
             cast_fn = CsvParser._get_cast_function(deduped_property_types, config_format, logger, config.schemaless)
             data_generator = self._csv_reader.read_data(config, file, stream_reader, logger, self.file_read_mode)
-            for row in data_generator:
+            # rows already read with pyarrow are skipped
+            for row in islice(data_generator, line_no, None):
                 line_no += 1
                 yield CsvParser._to_nullable(
                     cast_fn(row), deduped_property_types, config_format.null_values, config_format.strings_can_be_null
@@ -207,7 +319,37 @@ class CsvParser(FileTypeParser):
         except RecordParseError as parse_err:
             raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=line_no) from parse_err
         finally:
-            data_generator.close()
+            if data_generator:
+                data_generator.close()
+
+    def _read_rows_with_arrow(
+        self,
+        arrow_csv_reader: _ArrowCsvReader,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        deduped_property_types: Mapping[str, str],
+    ) -> Generator[Dict[str, Any], None, None]:
+        config_format = _extract_format(config)
+        should_cast = bool(deduped_property_types) and not config.schemaless
+        for headers, columns in arrow_csv_reader.read_columns(config, file, stream_reader, logger, self.file_read_mode):
+            num_rows = len(columns[0]) if columns else 0
+            # as with csv.DictReader, the last value wins if a header is duplicated
+            values_by_header = dict(zip(headers, columns))
+            warnings_by_row: Mapping[int, List[str]] = {}
+            if should_cast:
+                values_by_header, warnings_by_row = CsvParser._cast_columns(values_by_header, deduped_property_types, config_format)
+            values_by_header = CsvParser._columns_to_nullable(
+                values_by_header, deduped_property_types, config_format.null_values, config_format.strings_can_be_null
+            )
+
+            names = list(values_by_header.keys())
+            rows = zip(*values_by_header.values()) if names else ((),) * num_rows
+            for row_index, values in enumerate(rows):
+                if row_index in warnings_by_row:
+                    logger.warning(f"{FileBasedSourceError.ERROR_CASTING_VALUE.value}: {','.join(warnings_by_row[row_index])}")
+                yield dict(zip(names, values))
 
     @property
     def file_read_mode(self) -> FileReadMode:
@@ -234,6 +376,24 @@ class CsvParser(FileTypeParser):
         }
         return nullable
 
+    @staticmethod
+    def _columns_to_nullable(
+        values_by_header: Mapping[str, List[Any]],
+        deduped_property_types: Mapping[str, str],
+        null_values: Set[str],
+        strings_can_be_null: bool,
+    ) -> Dict[str, List[Any]]:
+        """
+        Same as _to_nullable but for a batch of rows stored as columns
+        """
+        nullable = {}
+        for key, values in values_by_header.items():
+            if strings_can_be_null or deduped_property_types.get(key) != "string":
+                nullable[key] = [None if value in null_values else value for value in values]
+            else:
+                nullable[key] = values
+        return nullable
+
     @staticmethod
     def _value_is_none(value: Any, deduped_property_type: Optional[str], null_values: Set[str], strings_can_be_null: bool) -> bool:
         return value in null_values and (strings_can_be_null or deduped_property_type != "string")
@@ -284,43 +444,14 @@ class CsvParser(FileTypeParser):
 
         for key, value in row.items():
             prop_type = deduped_property_types.get(key)
-            cast_value: Any = value
 
             if prop_type in TYPE_PYTHON_MAPPING and prop_type is not None:
                 _, python_type = TYPE_PYTHON_MAPPING[prop_type]
-
-                if python_type is None:
-                    if value == "":
-                        cast_value = None
-                    else:
-                        warnings.append(_format_warning(key, value, prop_type))
-
-                elif python_type == bool:
-                    try:
-                        cast_value = _value_to_bool(value, config_format.true_values, config_format.false_values)
-                    except ValueError:
-                        warnings.append(_format_warning(key, value, prop_type))
-
-                elif python_type == dict:
-                    try:
-                        # we don't re-use _value_to_object here because we type the column as object as long as there is only one object
-                        cast_value = json.loads(value)
-                    except json.JSONDecodeError:
-                        warnings.append(_format_warning(key, value, prop_type))
-
-                elif python_type == list:
-                    try:
-                        cast_value = _value_to_list(value)
-                    except (ValueError, json.JSONDecodeError):
-                        warnings.append(_format_warning(key, value, prop_type))
-
-                elif python_type:
-                    try:
-                        cast_value = _value_to_python_type(value, python_type)
-                    except ValueError:
-                        warnings.append(_format_warning(key, value, prop_type))
-
-                result[key] = cast_value
+                try:
+                    result[key] = _cast_value(value, python_type, config_format)
+                except ValueError:
+                    warnings.append(_format_warning(key, value, prop_type))
+                    result[key] = value
 
         if warnings:
             logger.warning(
@@ -328,6 +459,44 @@ class CsvParser(FileTypeParser):
             )
         return result
 
+    @staticmethod
+    def _cast_columns(
+        values_by_header: Mapping[str, List[str]], deduped_property_types: Mapping[str, str], config_format: CsvFormat
+    ) -> Tuple[Dict[str, List[Any]], Mapping[int, List[str]]]:
+        """
+        Same as _cast_types but for a batch of rows stored as columns. The warnings are returned by row index instead of being logged.
+        """
+        warnings_by_row: Dict[int, List[str]] = defaultdict(list)
+        result: Dict[str, List[Any]] = {}
+
+        for key, values in values_by_header.items():
+            prop_type = deduped_property_types.get(key)
+            if prop_type not in TYPE_PYTHON_MAPPING or prop_type is None:
+                continue
+
+            _, python_type = TYPE_PYTHON_MAPPING[prop_type]
+            if python_type == str:
+                result[key] = values
+                continue
+            if python_type in (int, float):
+                # numeric columns usually cast without errors so the whole column is cast at once before going value by value
+                try:
+                    result[key] = list(map(python_type, values))
+                    continue
+                except ValueError:
+                    pass
+
+            cast_values = []
+            for row_index, value in enumerate(values):
+                try:
+                    cast_values.append(_cast_value(value, python_type, config_format))
+                except ValueError:
+                    warnings_by_row[row_index].append(_format_warning(key, value, prop_type))
+                    cast_values.append(value)
+            result[key] = cast_values
+
+        return result, warnings_by_row
+
 
 class _TypeInferrer(ABC):
     @abstractmethod
@@ -419,6 +588,26 @@ class _JsonTypeInferrer(_TypeInferrer):
             return False
 
 
+def _cast_value(value: str, python_type: Optional[type], config_format: CsvFormat) -> Any:
+    """
+    Casts a csv value to python_type. Array and object types are only handled if the value can be deserialized as JSON.
+
+    :raises ValueError: if the value can't be cast
+    """
+    if python_type is None:
+        if value == "":
+            return None
+        raise ValueError(f"Value {value} is not a valid null value")
+    elif python_type == bool:
+        return _value_to_bool(value, config_format.true_values, config_format.false_values)
+    elif python_type == dict:
+        # we don't re-use _value_to_object here because we type the column as object as long as there is only one object
+        return json.loads(value)
+    elif python_type == list:
+        return _value_to_list(value)
+    return _value_to_python_type(value, python_type)
+
+
 def _value_to_bool(value: str, true_values: Set[str], false_values: Set[str]) -> bool:
     if value in true_values:
         return True
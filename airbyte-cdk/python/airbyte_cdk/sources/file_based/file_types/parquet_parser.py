@@ -5,7 +5,7 @@
 import json
 import logging
 import os
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 from urllib.parse import unquote
 
 import pyarrow as pa
@@ -22,6 +22,9 @@ from pyarrow import DictionaryArray, Scalar
 class ParquetParser(FileTypeParser):
 
     ENCODING = None
+    # Number of rows read at once. Records are built from batches of rows so the memory used is bounded by the batch size rather than by
+    # the size of the row groups.
+    BATCH_SIZE = 10_000
 
     def check_config(self, config: FileBasedStreamConfig) -> Tuple[bool, Optional[str]]:
         """
@@ -66,25 +69,22 @@ class ParquetParser(FileTypeParser):
             raise ConfigValidationError(FileBasedSourceError.CONFIG_VALIDATION_ERROR)
 
         line_no = 0
+        batch_no = 0
         try:
             with stream_reader.open_file(file, self.file_read_mode, self.ENCODING, logger) as fp:
                 reader = pq.ParquetFile(fp)
                 partition_columns = {x.split("=")[0]: x.split("=")[1] for x in self._extract_partitions(file.uri)}
-                for row_group in range(reader.num_row_groups):
-                    batch = reader.read_row_group(row_group)
-                    for row in range(batch.num_rows):
+                for batch_no, batch in enumerate(reader.iter_batches(batch_size=self.BATCH_SIZE)):
+                    # Values are converted column by column and records are only assembled at the end
+                    column_names = batch.schema.names
+                    columns = [ParquetParser._to_output_values(column, parquet_format) for column in batch.columns]
+                    for values in zip(*columns):
                         line_no += 1
-                        yield {
-                            **{
-                                column: ParquetParser._to_output_value(batch.column(column)[row], parquet_format)
-                                for column in batch.column_names
-                            },
-                            **partition_columns,
-                        }
+                        record = dict(zip(column_names, values))
+                        record.update(partition_columns)
+                        yield record
         except Exception as exc:
-            raise RecordParseError(
-                FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=f"{row_group=}, {line_no=}"
-            ) from exc
+            raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=f"{batch_no=}, {line_no=}") from exc
 
     @staticmethod
     def _extract_partitions(filepath: str) -> List[str]:
@@ -94,6 +94,51 @@ class ParquetParser(FileTypeParser):
     def file_read_mode(self) -> FileReadMode:
         return FileReadMode.READ_BINARY
 
+    @staticmethod
+    def _to_output_values(parquet_values: pa.Array, parquet_format: ParquetFormat) -> List[Any]:
+        """
+        Convert a column of a pyarrow record batch to values that can be output by the source. Each value is converted the same way as
+        `_to_output_value` would convert the scalar at the same position.
+        """
+        values = parquet_values.to_pylist()
+        convert = ParquetParser._get_python_value_converter(parquet_values.type, parquet_format)
+        if convert is None:
+            return values
+        return [None if value is None else convert(value) for value in values]
+
+    @staticmethod
+    def _get_python_value_converter(parquet_type: pa.DataType, parquet_format: ParquetFormat) -> Optional[Callable[[Any], Any]]:
+        """
+        Return the function converting the python value of a non-null pyarrow scalar of the given type to a value that can be output by the
+        source or None if the python value can be output as is. This follows the same rules as `_scalar_to_python_value`.
+        """
+        if pa.types.is_time(parquet_type) or pa.types.is_timestamp(parquet_type) or pa.types.is_date(parquet_type):
+            return lambda value: value.isoformat()
+        if parquet_type == pa.month_day_nano_interval():
+            return lambda value: json.loads(json.dumps(value))
+        if ParquetParser._is_binary(parquet_type):
+            return lambda value: value.decode("utf-8")
+        if pa.types.is_decimal(parquet_type):
+            return None if parquet_format.decimal_as_float else str
+        if pa.types.is_map(parquet_type):
+            return lambda value: {k: v for k, v in value}
+        if pa.types.is_duration(parquet_type):
+            unit = parquet_type.unit
+            if unit == "s":
+                return lambda value: value.total_seconds()
+            elif unit == "ms":
+                return lambda value: value.total_seconds() * 1000
+            elif unit == "us":
+                return lambda value: value.total_seconds() * 1_000_000
+            elif unit == "ns":
+                return lambda value: value.total_seconds() * 1_000_000_000 + value.nanoseconds
+
+            def raise_unknown_unit(value: Any) -> Any:
+                raise ValueError(f"Unknown duration unit: {unit}")
+
+            return raise_unknown_unit
+        return None
+
     @staticmethod
     def _to_output_value(parquet_value: Union[Scalar, DictionaryArray], parquet_format: ParquetFormat) -> Any:
         """
@@ -16,3 +16,5 @@ class RemoteFile(BaseModel):
     uri: str
     last_modified: datetime
     mime_type: Optional[str] = None
+    # Identifies the content of the file for stream readers that can provide it, e.g. the ETag of an S3 object
+    etag: Optional[str] = None
@@ -4,10 +4,12 @@
 
 import asyncio
 import itertools
+import json
 import traceback
+from concurrent.futures import Executor, ThreadPoolExecutor
 from copy import deepcopy
-from functools import cache
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Set, Union
+from functools import cache, partial
+from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Set, Tuple, Union
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, FailureType, Level
 from airbyte_cdk.models import Type as MessageType
@@ -21,10 +23,13 @@ from airbyte_cdk.sources.file_based.exceptions import (
     SchemaInferenceError,
     StopSyncPerValidationPolicy,
 )
+from airbyte_cdk.sources.file_based.file_schema_cache import FileSchemaCache
+from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import SchemaType, merge_schemas, schemaless_schema
 from airbyte_cdk.sources.file_based.stream import AbstractFileBasedStream
 from airbyte_cdk.sources.file_based.stream.cursor import AbstractFileBasedCursor
+from airbyte_cdk.sources.file_based.stream.file_prefetcher import FilePrefetcher
 from airbyte_cdk.sources.file_based.types import StreamSlice
 from airbyte_cdk.sources.streams import IncrementalMixin
 from airbyte_cdk.sources.streams.core import JsonSchema
@@ -43,8 +48,13 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
     ab_file_name_col = "_ab_source_file_url"
     airbyte_columns = [ab_last_mod_col, ab_file_name_col]
 
-    def __init__(self, **kwargs: Any):
+    def __init__(self, n_prefetched_files: int = 0, **kwargs: Any):
+        """
+        :param n_prefetched_files: number of files opened and parsed ahead of the file whose records are being read. Files are read one
+            after the other if 0.
+        """
         super().__init__(**kwargs)
+        self._n_prefetched_files = n_prefetched_files
 
     @property
     def state(self) -> MutableMapping[str, Any]:
@@ -90,13 +100,13 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
             raise MissingSchemaError(FileBasedSourceError.MISSING_SCHEMA, stream=self.name)
         # The stream only supports a single file type, so we can use the same parser for all files
         parser = self.get_parser()
-        for file in stream_slice["files"]:
+        for file, records in self._read_files(parser, stream_slice["files"], schema):
             # only serialize the datetime once
             file_datetime_string = file.last_modified.strftime(self.DATE_TIME_FORMAT)
             n_skipped = line_no = 0
 
             try:
-                for record in parser.parse_records(self.config, file, self.stream_reader, self.logger, schema):
+                for record in records:
                     line_no += 1
                     if self.config.schemaless:
                         record = {"data": record}
@@ -156,6 +166,21 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
                         ),
                     )
 
+    def _read_files(
+        self, parser: FileTypeParser, files: List[RemoteFile], schema: Mapping[str, Any]
+    ) -> Iterable[Tuple[RemoteFile, Iterable[Dict[str, Any]]]]:
+        """
+        Return each file along with its records. Records are parsed lazily so errors are raised while iterating over them, whether the
+        files are prefetched or not.
+        """
+        if self._n_prefetched_files:
+            parse_file = partial(self._parse_file, parser, schema=schema)
+            return FilePrefetcher(self._n_prefetched_files).read(files, parse_file)
+        return ((file, self._parse_file(parser, file, schema)) for file in files)
+
+    def _parse_file(self, parser: FileTypeParser, file: RemoteFile, schema: Mapping[str, Any]) -> Iterable[Dict[str, Any]]:
+        yield from parser.parse_records(self.config, file, self.stream_reader, self.logger, schema)
+
     @property
     def cursor_field(self) -> Union[str, List[str]]:
         """
@@ -253,30 +278,58 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
 
         Each file type has a corresponding `infer_schema` handler.
         Dispatch on file type.
+
+        Depending on the discovery policy, the handlers run in a pool of threads and the schema of each file is cached on disk.
         """
         base_schema: SchemaType = {}
         pending_tasks: Set[asyncio.tasks.Task[SchemaType]] = set()
 
+        n_workers = self._discovery_policy.n_schema_inference_workers
+        executor = ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="schema_inference") if n_workers else None
+        cache_directory = self._discovery_policy.schema_inference_cache_directory
+        schema_cache = FileSchemaCache(cache_directory) if cache_directory else None
+
         n_started, n_files = 0, len(files)
         files_iterator = iter(files)
-        while pending_tasks or n_started < n_files:
-            while len(pending_tasks) <= self._discovery_policy.n_concurrent_requests and (file := next(files_iterator, None)):
-                pending_tasks.add(asyncio.create_task(self._infer_file_schema(file)))
-                n_started += 1
-            # Return when the first task is completed so that we can enqueue a new task as soon as the
-            # number of concurrent tasks drops below the number allowed.
-            done, pending_tasks = await asyncio.wait(pending_tasks, return_when=asyncio.FIRST_COMPLETED)
-            for task in done:
-                try:
-                    base_schema = merge_schemas(base_schema, task.result())
-                except Exception as exc:
-                    self.logger.error(f"An error occurred inferring the schema. \n {traceback.format_exc()}", exc_info=exc)
+        try:
+            while pending_tasks or n_started < n_files:
+                while len(pending_tasks) <= self._discovery_policy.n_concurrent_requests and (file := next(files_iterator, None)):
+                    pending_tasks.add(asyncio.create_task(self._infer_file_schema(file, executor, schema_cache)))
+                    n_started += 1
+                # Return when the first task is completed so that we can enqueue a new task as soon as the
+                # number of concurrent tasks drops below the number allowed.
+                done, pending_tasks = await asyncio.wait(pending_tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        base_schema = merge_schemas(base_schema, task.result())
+                    except Exception as exc:
+                        self.logger.error(f"An error occurred inferring the schema. \n {traceback.format_exc()}", exc_info=exc)
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
 
         return base_schema
 
-    async def _infer_file_schema(self, file: RemoteFile) -> SchemaType:
+    async def _infer_file_schema(
+        self, file: RemoteFile, executor: Optional[Executor] = None, schema_cache: Optional[FileSchemaCache] = None
+    ) -> SchemaType:
         try:
-            return await self.get_parser().infer_schema(self.config, file, self.stream_reader, self.logger)
+            parsing_key = self._get_parsing_key() if schema_cache else ""
+            if schema_cache:
+                cached_schema = schema_cache.get(file, parsing_key)
+                if cached_schema is not None:
+                    return cached_schema
+
+            inference = self.get_parser().infer_schema(self.config, file, self.stream_reader, self.logger)
+            if executor:
+                # parsers are synchronous so the coroutine is run to completion in its own event loop on one of the executor's threads
+                schema = await asyncio.get_running_loop().run_in_executor(executor, asyncio.run, inference)
+            else:
+                schema = await inference
+
+            if schema_cache:
+                self._cache_schema(schema_cache, file, parsing_key, schema)
+            return schema
         except Exception as exc:
             raise SchemaInferenceError(
                 FileBasedSourceError.SCHEMA_INFERENCE_ERROR,
@@ -284,3 +337,22 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
                 format=str(self.config.format),
                 stream=self.name,
             ) from exc
+
+    def _get_parsing_key(self) -> str:
+        """
+        Describes how files are parsed so cached schemas are not used once the format options of the stream change.
+        """
+        format_options = json.dumps(self.config.format.dict(), sort_keys=True, default=_to_json_serializable)
+        return f"{type(self.get_parser()).__name__}:{format_options}"
+
+    def _cache_schema(self, schema_cache: FileSchemaCache, file: RemoteFile, parsing_key: str, schema: SchemaType) -> None:
+        try:
+            schema_cache.set(file, parsing_key, schema)
+        except OSError as exc:
+            # failing to cache a schema only means it will be inferred again on the next discover
+            self.logger.warning(f"Could not cache the schema of file {file.uri}: {exc}")
+
+
+def _to_json_serializable(value: Any) -> Any:
+    # sets are sorted so the same options always serialize the same way
+    return sorted(value) if isinstance(value, (set, frozenset)) else str(value)
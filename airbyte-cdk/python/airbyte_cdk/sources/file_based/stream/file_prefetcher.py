@@ -0,0 +1,130 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from queue import Empty, Full, Queue
+from typing import Any, Callable, Deque, Dict, Generator, Iterable, List, Tuple
+
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+
+_DONE = object()
+
+
+class _PrefetchedFile:
+    """
+    Records of a file being parsed by a worker. Exceptions raised while parsing are stored with the records so they are re-raised to the
+    consumer at the point the parser raised them.
+    """
+
+    # How long a worker waits on a full queue, or a consumer on an empty one, before checking if the read was cancelled
+    _TIMEOUT_IN_SECONDS = 0.1
+
+    def __init__(self, max_buffered_records: int) -> None:
+        self._queue: Queue[Any] = Queue(maxsize=max_buffered_records)
+        self._cancelled = threading.Event()
+
+    def parse(self, parse_file: Callable[[], Iterable[Dict[str, Any]]]) -> None:
+        records: Iterable[Dict[str, Any]] = []
+        try:
+            records = parse_file()
+            for record in records:
+                if not self._put(record):
+                    return
+        except BaseException as exc:
+            self._put(_ParsingError(exc))
+        else:
+            self._put(_DONE)
+        finally:
+            # release the file if the parsing was cancelled before the end of the file
+            if isinstance(records, Generator):
+                records.close()
+
+    def records(self) -> Generator[Dict[str, Any], None, None]:
+        while True:
+            try:
+                item = self._queue.get(timeout=self._TIMEOUT_IN_SECONDS)
+            except Empty:
+                if self._cancelled.is_set():
+                    return
+                continue
+            if item is _DONE:
+                return
+            if isinstance(item, _ParsingError):
+                raise item.exception
+            yield item
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def _put(self, item: Any) -> bool:
+        while not self._cancelled.is_set():
+            try:
+                self._queue.put(item, timeout=self._TIMEOUT_IN_SECONDS)
+                return True
+            except Full:
+                continue
+        return False
+
+
+class _ParsingError:
+    def __init__(self, exception: BaseException) -> None:
+        self.exception = exception
+
+
+class FilePrefetcher:
+    """
+    Parses the next files of a slice in a pool of threads while the records of the current file are consumed, so the time spent opening
+    and downloading a file overlaps with the processing of the previous ones.
+
+    Files are still consumed one after the other in order: records of a file are only available once the records of the previous files
+    have been consumed and exceptions raised by the parser are raised when the consumer reaches them. This means callers can handle each
+    file exactly like they would if they were parsing it themselves.
+    """
+
+    # Number of records buffered for each file being prefetched. This bounds the memory used by workers parsing ahead of the consumer.
+    MAX_BUFFERED_RECORDS_PER_FILE = 1000
+
+    def __init__(self, n_prefetched_files: int, max_buffered_records_per_file: int = MAX_BUFFERED_RECORDS_PER_FILE) -> None:
+        """
+        :param n_prefetched_files: number of files parsed ahead of the file being consumed
+        :param max_buffered_records_per_file: number of records a worker can parse ahead of the consumer for each file
+        """
+        if n_prefetched_files < 1:
+            raise ValueError(f"n_prefetched_files must be at least 1, got {n_prefetched_files}")
+        self._n_prefetched_files = n_prefetched_files
+        self._max_buffered_records_per_file = max_buffered_records_per_file
+
+    def read(
+        self, files: List[RemoteFile], parse_file: Callable[[RemoteFile], Iterable[Dict[str, Any]]]
+    ) -> Generator[Tuple[RemoteFile, Iterable[Dict[str, Any]]], None, None]:
+        """
+        Yields each file along with its records. The parsing of the files that are not consumed yet is cancelled when the generator is closed.
+        """
+        n_workers = min(self._n_prefetched_files + 1, len(files))
+        if n_workers == 0:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="file_prefetcher")
+        in_flight: Deque[Tuple[RemoteFile, _PrefetchedFile]] = deque()
+        files_iterator = iter(files)
+        try:
+            while True:
+                while len(in_flight) < n_workers and (file := next(files_iterator, None)):
+                    prefetched_file = _PrefetchedFile(self._max_buffered_records_per_file)
+                    executor.submit(prefetched_file.parse, partial(parse_file, file))
+                    in_flight.append((file, prefetched_file))
+                if not in_flight:
+                    return
+                file, prefetched_file = in_flight[0]
+                yield file, prefetched_file.records()
+                # the consumer can move on to the next file without consuming all the records of this one
+                in_flight.popleft()
+                prefetched_file.cancel()
+        finally:
+            for _, prefetched_file in in_flight:
+                prefetched_file.cancel()
+            executor.shutdown(wait=False)
@@ -7,13 +7,16 @@ import dataclasses
 import datetime
 import logging
 import time
+from collections import deque
 from datetime import timedelta
-from threading import RLock
-from typing import TYPE_CHECKING, Any, Mapping, Optional
+from threading import Condition, Lock, RLock
+from typing import TYPE_CHECKING, Any, Deque, Mapping, Optional
 from urllib import parse
 
 import requests
 import requests_cache
+from airbyte_cdk.models import Level
+from airbyte_cdk.sources.message import MessageRepository
 from pyrate_limiter import InMemoryBucket, Limiter
 from pyrate_limiter import Rate as PyRateRate
 from pyrate_limiter import RateItem, TimeClock
@@ -339,6 +342,146 @@ class MovingWindowCallRatePolicy(BaseCallRatePolicy):
         #     ts = call_reset_ts.timestamp()
 
 
+class TokenBucketCallRatePolicy(BaseCallRatePolicy):
+    """
+    Policy allowing bursts of up to {rate.limit} calls while refilling call credits continuously at {rate.limit} per {rate.interval}.
+
+    Threads blocked on this policy are served in the order they started to wait: only the first waiting thread is woken up when credits
+    are available instead of all of them retrying at once. The policy can be shared by all the streams of a source calling the same API.
+
+    When the API tells how many calls are left until the next reset, the refill rate is adjusted to spread these calls evenly until the
+    reset, raising or lowering it as needed, so that concurrent streams use most of the quota without hitting the limit.
+    """
+
+    def __init__(self, rate: Rate, matchers: list[RequestMatcher]):
+        """Constructor
+
+        :param rate: burst size and the rate at which call credits are refilled when the API does not tell otherwise
+        :param matchers:
+        """
+        if rate.limit <= 0 or rate.interval.total_seconds() <= 0:
+            raise ValueError("The rate limit and interval must be positive")
+
+        self._capacity = float(rate.limit)
+        self._default_refill_rate = rate.limit / rate.interval.total_seconds()
+        self._refill_rate = self._default_refill_rate
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._reset_at: Optional[float] = None
+        self._lock = Lock()
+        # one condition per waiting thread so that only the first one is woken up
+        self._waiters: Deque[Condition] = deque()
+        super().__init__(matchers=matchers)
+
+    def try_acquire(self, request: Any, weight: int) -> None:
+        self._validate(request, weight)
+
+        with self._lock:
+            # threads already waiting are served first
+            if self._waiters or self._time_to_wait(weight) > 0:
+                raise self._limit_hit(request, weight, self._time_to_wait(weight * (len(self._waiters) + 1)))
+            self._tokens -= weight
+
+    def acquire(self, request: Any, weight: int, timeout: Optional[float] = None) -> None:
+        """Block until call credits are available, waiting for the threads that started to wait before this one
+
+        :param request:
+        :param weight: number of requests to deduct from credit
+        :param timeout: if set, maximum time in seconds to wait for credits
+        :raises: CallRateLimitHit - when timeout is set and no credits were available within timeout
+        """
+        self._validate(request, weight)
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        with self._lock:
+            waiter = Condition(self._lock)
+            self._waiters.append(waiter)
+            try:
+                while True:
+                    time_to_wait: Optional[float] = None
+                    if self._waiters[0] is waiter:
+                        time_to_wait = self._time_to_wait(weight)
+                        if time_to_wait == 0:
+                            self._tokens -= weight
+                            return
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise self._limit_hit(request, weight, time_to_wait or 0)
+                        time_to_wait = remaining if time_to_wait is None else min(time_to_wait, remaining)
+                    waiter.wait(time_to_wait)
+            finally:
+                self._waiters.remove(waiter)
+                self._notify_first_waiter()
+
+    def update(self, available_calls: Optional[int], call_reset_ts: Optional[datetime.datetime]) -> None:
+        """Sync call credits with the API. When the reset time is known, the available calls are spread evenly until the reset
+
+        :param available_calls:
+        :param call_reset_ts:
+        """
+        if available_calls is None:
+            return
+
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._capacity, float(max(available_calls, 0)))
+            if call_reset_ts is not None:
+                seconds_until_reset = (call_reset_ts - datetime.datetime.now()).total_seconds()
+                if seconds_until_reset > 0:
+                    self._reset_at = time.monotonic() + seconds_until_reset
+                    self._refill_rate = max(available_calls - self._tokens, 0) / seconds_until_reset
+                    logger.debug(
+                        "got rate limit update from api, %s calls available, refilling %.2f calls per second until reset in %.0fs",
+                        available_calls,
+                        self._refill_rate,
+                        seconds_until_reset,
+                    )
+            self._notify_first_waiter()
+
+    def _validate(self, request: Any, weight: int) -> None:
+        if weight > self._capacity:
+            raise ValueError("Weight can not exceed the call limit")
+        if not self.matches(request):
+            raise ValueError("Request does not match the policy")
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if self._reset_at is not None and now >= self._reset_at:
+            logger.debug("call rate was reset, %s calls available now", self._capacity)
+            self._tokens = self._capacity
+            self._refill_rate = self._default_refill_rate
+            self._reset_at = None
+        else:
+            self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._refill_rate)
+        self._last_refill = now
+
+    def _time_to_wait(self, weight: int) -> float:
+        """Number of seconds until the credits for weight calls are available. Must be called with the lock acquired"""
+        self._refill()
+        missing_tokens = weight - self._tokens
+        if missing_tokens <= 0:
+            return 0
+        time_to_wait = missing_tokens / self._refill_rate if self._refill_rate > 0 else float("inf")
+        if self._reset_at is not None:
+            time_to_wait = min(time_to_wait, self._reset_at - time.monotonic())
+        return max(time_to_wait, 0)
+
+    def _notify_first_waiter(self) -> None:
+        if self._waiters:
+            self._waiters[0].notify()
+
+    def _limit_hit(self, request: Any, weight: int, time_to_wait: float) -> CallRateLimitHit:
+        rate = f"{self._capacity:.0f} burst, {self._refill_rate:.2f} per second"
+        return CallRateLimitHit(
+            error=f"reached maximum number of allowed calls ({rate}), {len(self._waiters)} calls waiting",
+            item=request,
+            weight=weight,
+            rate=rate,
+            time_to_wait=timedelta(seconds=time_to_wait),
+        )
+
+
 class AbstractAPIBudget(abc.ABC):
     """Interface to some API where a client allowed to have N calls per T interval.
 
@@ -375,16 +518,31 @@ class AbstractAPIBudget(abc.ABC):
 class APIBudget(AbstractAPIBudget):
     """Default APIBudget implementation"""
 
-    def __init__(self, policies: list[AbstractCallRatePolicy], maximum_attempts_to_acquire: int = 100000) -> None:
+    # acquiring a call credit is not considered waiting below this duration
+    MINIMUM_WAIT_TIME_IN_SECONDS = 0.001
+
+    def __init__(
+        self,
+        policies: list[AbstractCallRatePolicy],
+        maximum_attempts_to_acquire: int = 100000,
+        message_repository: Optional[MessageRepository] = None,
+        metrics_emission_interval_in_seconds: float = 60.0,
+    ) -> None:
         """Constructor
 
         :param policies: list of policies in this budget
         :param maximum_attempts_to_acquire: number of attempts before throwing hit ratelimit exception, we put some big number here
          to avoid situations when many threads compete with each other for a few lots over a significant amount of time
+        :param message_repository: if provided, the time spent waiting for call credits is logged through this repository
+        :param metrics_emission_interval_in_seconds: minimum number of seconds between two logs of the wait time metrics
         """
 
         self._policies = policies
         self._maximum_attempts_to_acquire = maximum_attempts_to_acquire
+        self._message_repository = message_repository
+        self._metrics_emission_interval_in_seconds = metrics_emission_interval_in_seconds
+        self._metrics_lock = Lock()
+        self._reset_metrics(time.monotonic())
 
     def get_matching_policy(self, request: Any) -> Optional[AbstractCallRatePolicy]:
         for policy in self._policies:
@@ -405,7 +563,12 @@ class APIBudget(AbstractAPIBudget):
 
         policy = self.get_matching_policy(request)
         if policy:
-            self._do_acquire(request=request, policy=policy, block=block, timeout=timeout)
+            start = time.monotonic()
+            try:
+                self._do_acquire(request=request, policy=policy, block=block, timeout=timeout)
+            finally:
+                if self._message_repository:
+                    self._record_wait_time(time.monotonic() - start)
         elif self._policies:
             logger.info("no policies matched with requests, allow call by default")
 
@@ -425,6 +588,10 @@ class APIBudget(AbstractAPIBudget):
         :param block:
         :param timeout:
         """
+        if block and isinstance(policy, TokenBucketCallRatePolicy):
+            policy.acquire(request, weight=1, timeout=timeout)
+            return
+
         last_exception = None
         # sometimes we spend all budget before a second attempt, so we have few more here
         for attempt in range(1, self._maximum_attempts_to_acquire):
@@ -449,6 +616,35 @@ class APIBudget(AbstractAPIBudget):
             logger.info("we used all %s attempts to acquire and failed", self._maximum_attempts_to_acquire)
             raise last_exception
 
+    def _record_wait_time(self, wait_time_in_seconds: float) -> None:
+        with self._metrics_lock:
+            self._calls += 1
+            if wait_time_in_seconds >= self.MINIMUM_WAIT_TIME_IN_SECONDS:
+                self._waiting_calls += 1
+                self._total_wait_time_in_seconds += wait_time_in_seconds
+                self._max_wait_time_in_seconds = max(self._max_wait_time_in_seconds, wait_time_in_seconds)
+
+            now = time.monotonic()
+            if now - self._metrics_start < self._metrics_emission_interval_in_seconds:
+                return
+            metrics = {
+                "interval_in_seconds": round(now - self._metrics_start, 3),
+                "calls": self._calls,
+                "waiting_calls": self._waiting_calls,
+                "total_wait_time_in_seconds": round(self._total_wait_time_in_seconds, 3),
+                "max_wait_time_in_seconds": round(self._max_wait_time_in_seconds, 3),
+            }
+            self._reset_metrics(now)
+
+        self._message_repository.log_message(Level.INFO, lambda: {"message": "API budget wait time", "api_budget": metrics})  # type: ignore  # the repository is verified before recording metrics
+
+    def _reset_metrics(self, now: float) -> None:
+        self._metrics_start = now
+        self._calls = 0
+        self._waiting_calls = 0
+        self._total_wait_time_in_seconds = 0.0
+        self._max_wait_time_in_seconds = 0.0
+
 
 class HttpAPIBudget(APIBudget):
     """Implementation of AbstractAPIBudget for HTTP"""
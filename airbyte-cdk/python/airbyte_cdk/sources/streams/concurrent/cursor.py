@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 import functools
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any, List, Mapping, MutableMapping, Optional, Protocol, Tuple
@@ -12,6 +13,7 @@ from airbyte_cdk.sources.streams import FULL_REFRESH_SENTINEL_STATE_KEY
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
 from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
 from airbyte_cdk.sources.streams.concurrent.state_converters.abstract_stream_state_converter import AbstractStreamStateConverter
+from airbyte_cdk.sources.streams.concurrent.state_converters.interval_set import IntervalSet
 
 
 def _extract_value(mapping: Mapping[str, Any], path: List[str]) -> Any:
@@ -105,6 +107,15 @@ class FinalStateCursor(Cursor):
 
 
 class ConcurrentCursor(Cursor):
+    """
+    Cursor tracking the intervals of the partitions that were successfully processed.
+
+    By default, a state message is emitted every time a partition is closed. For streams with a lot of partitions, state emission can be
+    throttled so that a state message is only emitted every `state_emission_partition_interval` closed partitions or every
+    `state_emission_time_interval_in_seconds` seconds. The first time the cursor value of the state advances, the state is emitted right
+    away, and the final state is always emitted by `ensure_at_least_one_state_emitted`.
+    """
+
     _START_BOUNDARY = 0
     _END_BOUNDARY = 1
 
@@ -119,6 +130,8 @@ class ConcurrentCursor(Cursor):
         cursor_field: CursorField,
         slice_boundary_fields: Optional[Tuple[str, str]],
         start: Optional[Any],
+        state_emission_partition_interval: int = 1,
+        state_emission_time_interval_in_seconds: Optional[float] = None,
     ) -> None:
         self._stream_name = stream_name
         self._stream_namespace = stream_namespace
@@ -132,6 +145,13 @@ class ConcurrentCursor(Cursor):
         self._most_recent_record: Optional[Record] = None
         self._has_closed_at_least_one_slice = False
         self.start, self._concurrent_state = self._get_concurrent_state(stream_state)
+        self._intervals: Optional[IntervalSet] = None
+        self._state_emission_partition_interval = state_emission_partition_interval
+        self._state_emission_time_interval_in_seconds = state_emission_time_interval_in_seconds
+        self._partitions_closed_since_last_state = 0
+        self._last_state_emission_time = time.monotonic()
+        self._cursor_value_advanced = False
+        self._has_emitted_cursor_value_advance = False
 
     @property
     def state(self) -> MutableMapping[str, Any]:
@@ -156,25 +176,25 @@ class ConcurrentCursor(Cursor):
         return self._connector_state_converter.parse_value(self._cursor_field.extract_value(record))
 
     def close_partition(self, partition: Partition) -> None:
-        slice_count_before = len(self.state.get("slices", []))
-        self._add_slice_to_state(partition)
-        if slice_count_before < len(self.state["slices"]):  # only emit if at least one slice has been processed
-            self._merge_partitions()
-            self._emit_state_message()
+        if self._add_slice_to_state(partition):  # only emit if at least one slice has been processed
+            self._partitions_closed_since_last_state += 1
+            if self._should_emit_state():
+                self._emit_state_message()
         self._has_closed_at_least_one_slice = True
 
-    def _add_slice_to_state(self, partition: Partition) -> None:
+    def _add_slice_to_state(self, partition: Partition) -> bool:
         if self._slice_boundary_fields:
             if "slices" not in self.state:
                 raise RuntimeError(
                     f"The state for stream {self._stream_name} should have at least one slice to delineate the sync start time, but no slices are present. This is unexpected. Please contact Support."
                 )
-            self.state["slices"].append(
+            self._add_interval(
                 {
                     "start": self._extract_from_slice(partition, self._slice_boundary_fields[self._START_BOUNDARY]),
                     "end": self._extract_from_slice(partition, self._slice_boundary_fields[self._END_BOUNDARY]),
                 }
             )
+            return True
         elif self._most_recent_record:
             if self._has_closed_at_least_one_slice:
                 # If we track state value using records cursor field, we can only do that if there is one partition. This is because we save
@@ -192,12 +212,36 @@ class ConcurrentCursor(Cursor):
                     "expected. Please contact the Airbyte team."
                 )
 
-            self.state["slices"].append(
+            self._add_interval(
                 {
                     self._connector_state_converter.START_KEY: self.start,
                     self._connector_state_converter.END_KEY: self._extract_cursor_value(self._most_recent_record),
                 }
             )
+            return True
+        return False
+
+    def _add_interval(self, interval: MutableMapping[str, Any]) -> None:
+        if self._intervals is None:
+            # The slices of the incoming state are merged once. After that, the slices are kept merged as each interval is added
+            self._intervals = self._connector_state_converter.create_interval_set(self.state["slices"])
+            self.state["slices"] = self._intervals.intervals
+        cursor_value_before = self._intervals.intervals[0][self._connector_state_converter.END_KEY] if self._intervals.intervals else None
+        self._intervals.add(interval)
+        if cursor_value_before != self._intervals.intervals[0][self._connector_state_converter.END_KEY]:
+            self._cursor_value_advanced = True
+
+    def _should_emit_state(self) -> bool:
+        if self._cursor_value_advanced and not self._has_emitted_cursor_value_advance:
+            # the first progress of the sync is always checkpointed
+            self._has_emitted_cursor_value_advance = True
+            return True
+        if self._partitions_closed_since_last_state >= self._state_emission_partition_interval:
+            return True
+        return (
+            self._state_emission_time_interval_in_seconds is not None
+            and time.monotonic() - self._last_state_emission_time >= self._state_emission_time_interval_in_seconds
+        )
 
     def _emit_state_message(self) -> None:
         self._connector_state_manager.update_state_for_stream(
@@ -210,9 +254,8 @@ class ConcurrentCursor(Cursor):
         #  int before emitting state
         state_message = self._connector_state_manager.create_state_message(self._stream_name, self._stream_namespace)
         self._message_repository.emit_message(state_message)
-
-    def _merge_partitions(self) -> None:
-        self.state["slices"] = self._connector_state_converter.merge_intervals(self.state["slices"])
+        self._partitions_closed_since_last_state = 0
+        self._last_state_emission_time = time.monotonic()
 
     def _extract_from_slice(self, partition: Partition, key: str) -> Comparable:
         try:
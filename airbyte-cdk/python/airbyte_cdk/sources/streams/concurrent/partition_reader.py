@@ -2,8 +2,10 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 from queue import Queue
+from typing import List
 
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
 from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, QueueItem
 
 
@@ -12,11 +14,16 @@ class PartitionReader:
     Generates records from a partition and puts them in a queue.
     """
 
-    def __init__(self, queue: Queue[QueueItem]) -> None:
+    def __init__(self, queue: Queue[QueueItem], batch_size: int = 1) -> None:
         """
         :param queue: The queue to put the records in.
+        :param batch_size: The maximum number of records put in the queue as a single list. With a batch size of 1, records are put in the
+        queue one by one. Larger batches reduce the contention on the queue when many workers are reading partitions concurrently.
         """
+        if batch_size < 1:
+            raise ValueError(f"The batch size must be at least 1 but was {batch_size}")
         self._queue = queue
+        self._batch_size = batch_size
 
     def process_partition(self, partition: Partition) -> None:
         """
@@ -30,9 +37,27 @@ class PartitionReader:
         :param partition: The partition to read data from
         :return: None
         """
+        if self._batch_size == 1:
+            try:
+                for record in partition.read():
+                    self._queue.put(record)
+                self._queue.put(PartitionCompleteSentinel(partition))
+            except Exception as e:
+                self._queue.put(e)
+            return
+
+        batch: List[Record] = []
         try:
             for record in partition.read():
-                self._queue.put(record)
+                batch.append(record)
+                if len(batch) >= self._batch_size:
+                    self._queue.put(batch)
+                    batch = []
+            if batch:
+                self._queue.put(batch)
             self._queue.put(PartitionCompleteSentinel(partition))
         except Exception as e:
+            # records read before the failure are still emitted so that the order of the items in the queue is the same as without batching
+            if batch:
+                self._queue.put(batch)
             self._queue.put(e)
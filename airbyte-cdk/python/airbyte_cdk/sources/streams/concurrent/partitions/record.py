@@ -10,6 +10,9 @@ class Record:
     Represents a record read from a stream.
     """
 
+    # Records are created for every row read from a partition so attributes are stored in slots to limit the memory allocated per record
+    __slots__ = ("data", "stream_name")
+
     def __init__(self, data: Mapping[str, Any], stream_name: str):
         self.data = data
         self.stream_name = stream_name
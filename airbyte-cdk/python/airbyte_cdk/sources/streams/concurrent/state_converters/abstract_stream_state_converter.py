@@ -6,6 +6,8 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from typing import TYPE_CHECKING, Any, List, MutableMapping, Tuple
 
+from airbyte_cdk.sources.streams.concurrent.state_converters.interval_set import IntervalSet
+
 if TYPE_CHECKING:
     from airbyte_cdk.sources.streams.concurrent.cursor import CursorField
 
@@ -76,6 +78,14 @@ class AbstractStreamStateConverter(ABC):
         """
         ...
 
+    def create_interval_set(self, intervals: List[MutableMapping[str, Any]]) -> IntervalSet:
+        """
+        Merge the intervals and return them as an IntervalSet in which new intervals can be added and merged one at a time.
+
+        The list of intervals held by the IntervalSet is kept merged as intervals are added.
+        """
+        return IntervalSet(self.merge_intervals(intervals), self.START_KEY, self.END_KEY, self.increment)
+
     @abstractmethod
     def parse_value(self, value: Any) -> Any:
         """
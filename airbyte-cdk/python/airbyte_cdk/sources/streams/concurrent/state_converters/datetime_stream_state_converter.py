@@ -133,9 +133,14 @@ class DateTimeStreamStateConverter(AbstractStreamStateConverter):
         if not slices:
             raise RuntimeError("Expected at least one slice but there were none. This is unexpected; please contact Support.")
 
-        merged_intervals = self.merge_intervals(slices)
-        first_interval = merged_intervals[0]
-        return first_interval[self.END_KEY]
+        # Only the first merged interval is needed so intervals are not merged past the first gap
+        sorted_intervals = sorted(slices, key=lambda x: (x[self.START_KEY], x[self.END_KEY]))
+        latest_complete_time = sorted_intervals[0][self.END_KEY]
+        for interval in sorted_intervals[1:]:
+            if not self._compare_intervals(latest_complete_time, interval[self.START_KEY]):
+                break
+            latest_complete_time = max(latest_complete_time, interval[self.END_KEY])
+        return latest_complete_time
 
 
 class EpochValueConcurrentStreamStateConverter(DateTimeStreamStateConverter):
@@ -0,0 +1,53 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from bisect import bisect_right
+from typing import Any, Callable, List, MutableMapping
+
+
+class IntervalSet:
+    """
+    Sorted list of disjoint intervals in which intervals are added one at a time.
+
+    Adding an interval finds its position with a binary search and only coalesces it with the neighbouring intervals it touches, so the list
+    never needs to be sorted and scanned again. Two intervals are coalesced if the start of the second one is at most one increment after
+    the end of the first one, which is how `AbstractStreamStateConverter.merge_intervals` merges intervals.
+    """
+
+    def __init__(
+        self, merged_intervals: List[MutableMapping[str, Any]], start_key: str, end_key: str, increment: Callable[[Any], Any]
+    ) -> None:
+        """
+        :param merged_intervals: intervals sorted by start and already merged. The list is updated in place as intervals are added
+        :param start_key: key of the start of the intervals
+        :param end_key: key of the end of the intervals
+        :param increment: function incrementing a boundary by a single unit
+        """
+        self.intervals = merged_intervals
+        self._start_key = start_key
+        self._end_key = end_key
+        self._increment = increment
+        self._starts = [interval[start_key] for interval in merged_intervals]
+
+    def add(self, interval: MutableMapping[str, Any]) -> None:
+        start = interval[self._start_key]
+        index = bisect_right(self._starts, start)
+        if index > 0 and self._touches(self.intervals[index - 1], start):
+            index -= 1
+            merged = self.intervals[index]
+            merged[self._end_key] = max(merged[self._end_key], interval[self._end_key])
+        else:
+            self.intervals.insert(index, interval)
+            self._starts.insert(index, start)
+            merged = interval
+
+        next_index = index + 1
+        while next_index < len(self.intervals) and self._touches(merged, self._starts[next_index]):
+            merged[self._end_key] = max(merged[self._end_key], self.intervals[next_index][self._end_key])
+            next_index += 1
+        del self.intervals[index + 1 : next_index]
+        del self._starts[index + 1 : next_index]
+
+    def _touches(self, interval: MutableMapping[str, Any], start: Any) -> bool:
+        return bool(self._increment(interval[self._end_key]) >= start)
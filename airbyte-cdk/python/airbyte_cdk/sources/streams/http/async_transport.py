@@ -0,0 +1,308 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import asyncio
+import datetime
+import ssl
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Coroutine, Iterator, Mapping, Optional, Tuple, TypeVar, Union
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+if TYPE_CHECKING:
+    import aiohttp
+
+RequestsTimeout = Union[None, float, Tuple[Optional[float], Optional[float]]]
+T = TypeVar("T")
+
+
+class AsyncHttpTransport:
+    """
+    Sends HTTP requests through a single pool of keep-alive connections, with limits on the number of connections open globally and by host.
+    A single transport is meant to be shared by all the streams of a source so that they reuse the same connections.
+
+    Requests and responses are `requests` objects: the transport is used through AsyncHttpAdapter by the sessions of HttpStream and
+    HttpRequester, which keeps their error handling, backoff and APIBudget behavior unchanged. Requests are sent from an event loop running
+    in a background thread. Each caller waits for its own response, so the threads reading partitions of a ConcurrentSource have one request
+    in flight each, all of them sharing the same connection pool.
+
+    Responses are read entirely before being returned unless they are streamed, in which case their content is read from the event loop as
+    it is consumed. The transport can't be used anymore once it is closed.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_connections_per_host: int = 10,
+        keepalive_timeout_in_seconds: float = 15.0,
+    ) -> None:
+        """
+        :param max_connections: maximum number of connections open at the same time across all hosts
+        :param max_connections_per_host: maximum number of connections open at the same time to the same host
+        :param keepalive_timeout_in_seconds: number of seconds an idle connection is kept open to be reused
+        """
+        # aiohttp is imported when a transport is created as it is an optional dependency which takes a significant time to import
+        try:
+            import aiohttp
+        except ImportError as exception:
+            raise ImportError(
+                "aiohttp is required to use AsyncHttpTransport. Please install it with `pip install airbyte-cdk[async-http]`"
+            ) from exception
+        self._aiohttp = aiohttp
+        self._max_connections = max_connections
+        self._max_connections_per_host = max_connections_per_host
+        self._keepalive_timeout_in_seconds = keepalive_timeout_in_seconds
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._closed = False
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        timeout: RequestsTimeout = None,
+        verify: Union[bool, str] = True,
+        proxies: Optional[Mapping[str, str]] = None,
+        allow_redirects: bool = True,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        Send the request and wait for the response
+
+        :param request: request to send
+        :param timeout: timeout in seconds as accepted by requests, either a single value or a (connect timeout, read timeout) tuple
+        :param verify: False to skip the verification of the TLS certificate of the server
+        :param proxies: proxy url by scheme as accepted by requests
+        :param allow_redirects: False to return redirection responses instead of following them
+        :param stream: True to read the content of the response as it is consumed instead of before returning the response. The connection
+         is only released once the content is read entirely or the response is closed
+        :return: the response
+        :raises requests.exceptions.RequestException: the requests exception corresponding to the error
+        """
+        return self._run(self._send(request, timeout, verify, proxies, allow_redirects, stream))
+
+    def mount(self, session: requests.Session) -> None:
+        """
+        Send the requests of the session through this transport instead of the connection pool of the session
+        """
+        adapter = AsyncHttpAdapter(self)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            loop, thread = self._loop, self._thread
+            self._loop, self._thread = None, None
+        if loop and thread:
+            asyncio.run_coroutine_threadsafe(self._close_session(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def _run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        try:
+            loop = self._get_loop()
+        except RuntimeError:
+            coroutine.close()
+            raise
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    def _release(self, client_response: "aiohttp.ClientResponse") -> None:
+        with self._lock:
+            loop = self._loop
+        if loop:
+            # aiohttp objects are not thread safe so the response is released from the loop thread
+            loop.call_soon_threadsafe(client_response.release)
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("AsyncHttpTransport is closed")
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="async_http_transport", daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        # the session is bound to the event loop so it is created from the loop thread
+        if self._session is None:
+            connector = self._aiohttp.TCPConnector(
+                limit=self._max_connections,
+                limit_per_host=self._max_connections_per_host,
+                keepalive_timeout=self._keepalive_timeout_in_seconds,
+            )
+            # cookies are handled by the requests session which sends them as headers
+            self._session = self._aiohttp.ClientSession(
+                connector=connector, cookie_jar=self._aiohttp.DummyCookieJar(), auto_decompress=True
+            )
+        return self._session
+
+    async def _close_session(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _send(
+        self,
+        request: requests.PreparedRequest,
+        timeout: RequestsTimeout,
+        verify: Union[bool, str],
+        proxies: Optional[Mapping[str, str]],
+        allow_redirects: bool,
+        stream: bool,
+    ) -> requests.Response:
+        start = datetime.datetime.now()
+        url = str(request.url)
+        with self._translate_errors(request):
+            client_response = await self._get_session().request(
+                str(request.method),
+                url,
+                headers=dict(request.headers),
+                data=request.body,
+                allow_redirects=allow_redirects,
+                timeout=self._to_client_timeout(timeout),
+                # content types are set by requests when preparing the request
+                skip_auto_headers=("Content-Type",),
+                ssl=self._to_ssl(verify),
+                proxy=self._get_proxy(url, proxies),
+            )
+            try:
+                # reading the content entirely releases the connection
+                content = None if stream else await client_response.read()
+            except BaseException:
+                client_response.release()
+                raise
+
+        response = self._to_requests_response(request, client_response, datetime.datetime.now() - start)
+        if content is None:
+            response.raw = _StreamedContent(self, client_response, request)
+        else:
+            response._content = content
+            response._content_consumed = True
+        return response
+
+    @contextmanager
+    def _translate_errors(self, request: requests.PreparedRequest) -> Iterator[None]:
+        """
+        Raise the requests exceptions corresponding to the aiohttp errors so that the error handling of the callers is unchanged
+        """
+        try:
+            yield
+        except self._aiohttp.ServerTimeoutError as exception:
+            raise requests.exceptions.ReadTimeout(str(exception), request=request) from exception
+        except asyncio.TimeoutError as exception:
+            raise requests.exceptions.ConnectTimeout(f"Timeout sending request to {request.url}", request=request) from exception
+        except self._aiohttp.ClientPayloadError as exception:
+            raise requests.exceptions.ChunkedEncodingError(str(exception), request=request) from exception
+        except self._aiohttp.ClientConnectionError as exception:
+            raise requests.exceptions.ConnectionError(str(exception), request=request) from exception
+        except self._aiohttp.ClientError as exception:
+            raise requests.exceptions.RequestException(str(exception), request=request) from exception
+
+    def _to_client_timeout(self, timeout: RequestsTimeout) -> "aiohttp.ClientTimeout":
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            return self._aiohttp.ClientTimeout(total=None, sock_connect=connect_timeout, sock_read=read_timeout)
+        return self._aiohttp.ClientTimeout(total=None, sock_connect=timeout, sock_read=timeout)
+
+    @staticmethod
+    def _to_ssl(verify: Union[bool, str]) -> Union[bool, ssl.SSLContext]:
+        if isinstance(verify, bool):
+            return verify
+        # requests accepts the path to a CA bundle
+        return ssl.create_default_context(cafile=verify)
+
+    @staticmethod
+    def _get_proxy(url: str, proxies: Optional[Mapping[str, str]]) -> Optional[str]:
+        if not proxies:
+            return None
+        return proxies.get(url.split(":", 1)[0]) or proxies.get("all")
+
+    @staticmethod
+    def _to_requests_response(
+        request: requests.PreparedRequest, client_response: "aiohttp.ClientResponse", elapsed: datetime.timedelta
+    ) -> requests.Response:
+        response = requests.Response()
+        response.status_code = client_response.status
+        response.reason = client_response.reason or ""
+        # headers with multiple values are joined like urllib3 does
+        headers: CaseInsensitiveDict[str] = CaseInsensitiveDict()
+        for name, value in client_response.headers.items():
+            headers[name] = f"{headers[name]}, {value}" if name in headers else value
+        response.headers = headers
+        response.encoding = get_encoding_from_headers(headers)
+        response.url = str(client_response.url)
+        response.request = request
+        response.elapsed = elapsed
+        return response
+
+
+class _StreamedContent:
+    """
+    Raw content of a streamed response. Reading it reads the content of the aiohttp response from the event loop of the transport, so only
+    the chunks that are being consumed are held in memory.
+    """
+
+    def __init__(self, transport: AsyncHttpTransport, client_response: "aiohttp.ClientResponse", request: requests.PreparedRequest) -> None:
+        self._transport = transport
+        self._client_response = client_response
+        self._request = request
+        self._closed = False
+
+    def read(self, amt: Optional[int] = None, **kwargs: Any) -> bytes:
+        """
+        Read up to `amt` bytes of the content, or the rest of it if `amt` is not provided. An empty result means the content was read entirely
+        """
+        if self._closed:
+            return b""
+        if self._transport._closed:
+            # the aiohttp response is bound to the event loop of the transport, which is stopped once the transport is closed
+            raise RuntimeError("The content of the response can't be read as its AsyncHttpTransport is closed")
+        with self._transport._translate_errors(self._request):
+            chunk = self._transport._run(self._client_response.content.read(-1 if amt is None else amt))
+        if not chunk:
+            self.close()
+        return chunk
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._transport._release(self._client_response)
+
+
+class AsyncHttpAdapter(BaseAdapter):
+    """
+    requests transport adapter sending the requests of a session through an AsyncHttpTransport. The transport is not closed with the
+    session as it is shared with other sessions.
+    """
+
+    def __init__(self, transport: AsyncHttpTransport) -> None:
+        super().__init__()
+        self._transport = transport
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: RequestsTimeout = None,
+        verify: Union[bool, str] = True,
+        cert: Any = None,
+        proxies: Optional[Mapping[str, str]] = None,
+    ) -> requests.Response:
+        if cert:
+            raise ValueError("Client certificates are not supported by AsyncHttpAdapter")
+        # redirections are handled by the requests session
+        response = self._transport.send(request, timeout=timeout, verify=verify, proxies=proxies, allow_redirects=False, stream=stream)
+        response.connection = self
+        return response
+
+    def close(self) -> None:
+        pass
@@ -18,6 +18,7 @@ from airbyte_cdk.sources.http_config import MAX_CONNECTION_POOL_SIZE
 from airbyte_cdk.sources.streams.availability_strategy import AvailabilityStrategy
 from airbyte_cdk.sources.streams.call_rate import APIBudget, CachedLimiterSession, LimiterSession
 from airbyte_cdk.sources.streams.core import Stream, StreamData
+from airbyte_cdk.sources.streams.http.async_transport import AsyncHttpTransport
 from airbyte_cdk.sources.streams.http.availability_strategy import HttpAvailabilityStrategy
 from airbyte_cdk.sources.utils.types import JsonType
 from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
@@ -40,12 +41,24 @@ class HttpStream(Stream, ABC):
     page_size: Optional[int] = None  # Use this variable to define page size for API http requests with pagination support
 
     # TODO: remove legacy HttpAuthenticator authenticator references
-    def __init__(self, authenticator: Optional[Union[AuthBase, HttpAuthenticator]] = None, api_budget: Optional[APIBudget] = None):
+    def __init__(
+        self,
+        authenticator: Optional[Union[AuthBase, HttpAuthenticator]] = None,
+        api_budget: Optional[APIBudget] = None,
+        http_transport: Optional[AsyncHttpTransport] = None,
+    ):
+        """
+        :param authenticator: authenticator adding the credentials to the requests
+        :param api_budget: call rate limits applied to the requests
+        :param http_transport: if provided, requests are sent through this transport which can be shared by all the streams of a source
+        """
         self._api_budget: APIBudget = api_budget or APIBudget(policies=[])
         self._session = self.request_session()
         self._session.mount(
             "https://", requests.adapters.HTTPAdapter(pool_connections=MAX_CONNECTION_POOL_SIZE, pool_maxsize=MAX_CONNECTION_POOL_SIZE)
         )
+        if http_transport:
+            http_transport.mount(self._session)
         self._authenticator: HttpAuthenticator = NoAuth()
         if isinstance(authenticator, AuthBase):
             self._session.auth = authenticator
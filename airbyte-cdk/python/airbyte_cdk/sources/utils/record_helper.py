@@ -2,7 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-import datetime
+import time
 from typing import Any, Mapping
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, AirbyteRecordMessage, AirbyteTraceMessage
@@ -17,19 +17,29 @@ def stream_data_to_airbyte_message(
     transformer: TypeTransformer = TypeTransformer(TransformConfig.NoTransform),
     schema: Mapping[str, Any] = None,
 ) -> AirbyteMessage:
+    """
+    Wrap the data of a stream in an AirbyteMessage. When the transformer does not modify the records, a record that is a plain dict is not
+    copied: the message holds the dict that was passed, which must therefore not be modified by the stream once it has been returned. Other
+    mappings, including dict subclasses like defaultdict, are converted to a plain dict.
+    """
     if schema is None:
         schema = {}
 
     if isinstance(data_or_message, Mapping):
-        data = dict(data_or_message)
-        now_millis = int(datetime.datetime.now().timestamp() * 1000)
-        # Transform object fields according to config. Most likely you will
-        # need it to normalize values against json schema. By default no action
-        # taken unless configured. See
-        # docs/connector-development/cdk-python/schemas.md for details.
-        transformer.transform(data, schema)  # type: ignore
-        message = AirbyteRecordMessage(stream=stream_name, data=data, emitted_at=now_millis)
-        return AirbyteMessage(type=MessageType.RECORD, record=message)
+        now_millis = int(time.time() * 1000)
+        if isinstance(transformer, TypeTransformer) and transformer.is_no_op() and type(data_or_message) is dict:
+            # The record is not modified so there is no need to copy it
+            data = data_or_message
+        else:
+            data = dict(data_or_message)
+            # Transform object fields according to config. Most likely you will
+            # need it to normalize values against json schema. By default no action
+            # taken unless configured. See
+            # docs/connector-development/cdk-python/schemas.md for details.
+            transformer.transform(data, schema)  # type: ignore
+        # Records are emitted for every row read so the models are built without validation: the values are known to have the right types
+        message = AirbyteRecordMessage.construct(stream=stream_name, data=data, emitted_at=now_millis)
+        return AirbyteMessage.construct(type=MessageType.RECORD, record=message)
     elif isinstance(data_or_message, AirbyteTraceMessage):
         return AirbyteMessage(type=MessageType.TRACE, trace=data_or_message)
     elif isinstance(data_or_message, AirbyteLogMessage):
@@ -2,12 +2,14 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
 import logging
-from distutils.util import strtobool
+import threading
+from collections import OrderedDict
 from enum import Flag, auto
-from typing import Any, Callable, Dict, Mapping, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
-from jsonschema import Draft7Validator, ValidationError, validators
+from jsonschema import Draft7Validator, RefResolutionError, RefResolver, ValidationError, validators
 
 json_to_python_simple = {"string": str, "number": float, "integer": int, "boolean": bool, "null": type(None)}
 json_to_python = {**json_to_python_simple, **{"object": dict, "array": list}}
@@ -15,6 +17,29 @@ python_to_json = {v: k for k, v in json_to_python.items()}
 
 logger = logging.getLogger("airbyte")
 
+_TRUE_VALUES = {"y", "yes", "t", "true", "on", "1"}
+_FALSE_VALUES = {"n", "no", "f", "false", "off", "0"}
+
+# A compiled schema node is called with the instance to normalize and its path in the record. To avoid allocating a list for every value
+# visited, the path is represented as nested tuples `(parent_path, key)` and is only flattened when a warning needs to be logged.
+_Path = Optional[Tuple[Any, Any]]
+_CompiledNode = Callable[[Any, _Path], None]
+
+
+def strtobool(value: str) -> int:
+    """
+    Convert a string representation of truth to 1 or 0 like `distutils.util.strtobool`. distutils is deprecated and takes a significant
+    part of the time spent importing the CDK.
+
+    :raises ValueError: if the value is not a representation of truth
+    """
+    lowered_value = value.lower()
+    if lowered_value in _TRUE_VALUES:
+        return 1
+    if lowered_value in _FALSE_VALUES:
+        return 0
+    raise ValueError(f"invalid truth value {value!r}")
+
 
 class TransformConfig(Flag):
     """
@@ -42,14 +67,26 @@ class TypeTransformer:
 
     _custom_normalizer: Optional[Callable[[Any, Dict[str, Any]], Any]] = None
 
-    def __init__(self, config: TransformConfig):
+    # Maximum number of distinct schemas kept compiled by a transformer
+    MAX_COMPILED_SCHEMAS = 32
+
+    def __init__(self, config: TransformConfig, compile_schemas: bool = True):
         """
         Initialize TypeTransformer instance.
         :param config Transform config that would be applied to object
+        :param compile_schemas If True, each schema is compiled once into a plan of conversions per property path which is then applied
+        to every record without going through jsonschema. Schemas that can't be compiled are normalized using jsonschema.
         """
         if TransformConfig.NoTransform in config and config != TransformConfig.NoTransform:
             raise Exception("NoTransform option cannot be combined with other flags.")
         self._config = config
+        self._compile_schemas = compile_schemas
+        # Compiled schemas are indexed by their content so that callers building a new schema object for every slice or record reuse the
+        # same compiled schema, and the least recently used ones are evicted. A compiled node of None means the schema can't be compiled.
+        self._compiled_schemas: "OrderedDict[str, Optional[_CompiledNode]]" = OrderedDict()
+        self._compiled_schemas_lock = threading.Lock()
+        # The last schema transformed along with its compiled node, so that records of the same schema object are not serialized
+        self._last_compiled_schema: Optional[Tuple[Mapping[str, Any], Optional[_CompiledNode]]] = None
         all_validators = {
             key: self.__get_normalizer(key, orig_validator)
             for key, orig_validator in Draft7Validator.VALIDATORS.items()
@@ -58,6 +95,12 @@ class TypeTransformer:
         }
         self._normalizer = validators.create(meta_schema=Draft7Validator.META_SCHEMA, validators=all_validators)
 
+    def is_no_op(self) -> bool:
+        """
+        :return True if `transform` leaves the objects untouched.
+        """
+        return self._config == TransformConfig.NoTransform
+
     def registerCustomTransform(self, normalization_callback: Callable[[Any, Dict[str, Any]], Any]) -> Callable:
         """
         Register custom normalization callback.
@@ -70,6 +113,10 @@ class TypeTransformer:
         if TransformConfig.CustomSchemaNormalization not in self._config:
             raise Exception("Please set TransformConfig.CustomSchemaNormalization config before registering custom normalizer")
         self._custom_normalizer = normalization_callback
+        # compiled schemas embed the normalization callback
+        with self._compiled_schemas_lock:
+            self._compiled_schemas.clear()
+            self._last_compiled_schema = None
         return normalization_callback
 
     def __normalize(self, original_item: Any, subschema: Dict[str, Any]) -> Any:
@@ -180,6 +227,11 @@ class TypeTransformer:
         """
         if TransformConfig.NoTransform in self._config:
             return
+        if self._compile_schemas:
+            compiled_schema = self._get_compiled_schema(schema)
+            if compiled_schema:
+                compiled_schema(record, None)
+                return
         normalizer = self._normalizer(schema)
         for e in normalizer.iter_errors(record):
             """
@@ -189,8 +241,261 @@ class TypeTransformer:
             logger.warning(self.get_error_message(e))
 
     def get_error_message(self, e: ValidationError) -> str:
-        instance_json_type = python_to_json[type(e.instance)]
-        key_path = "." + ".".join(map(str, e.path))
-        return (
-            f"Failed to transform value {repr(e.instance)} of type '{instance_json_type}' to '{e.validator_value}', key path: '{key_path}'"
-        )
+        return self._format_error_message(e.instance, e.validator_value, e.path)
+
+    @staticmethod
+    def _format_error_message(instance: Any, expected_type: Any, path: Any) -> str:
+        instance_json_type = python_to_json[type(instance)]
+        key_path = "." + ".".join(map(str, path))
+        return f"Failed to transform value {repr(instance)} of type '{instance_json_type}' to '{expected_type}', key path: '{key_path}'"
+
+    def _get_compiled_schema(self, schema: Mapping[str, Any]) -> Optional[_CompiledNode]:
+        last_compiled_schema = self._last_compiled_schema
+        if last_compiled_schema is not None and last_compiled_schema[0] is schema:
+            return last_compiled_schema[1]
+
+        key = json.dumps(schema, sort_keys=True, default=str)
+        with self._compiled_schemas_lock:
+            if key in self._compiled_schemas:
+                self._compiled_schemas.move_to_end(key)
+                compiled_node = self._compiled_schemas[key]
+            else:
+                try:
+                    compiled_node = _SchemaCompiler(self, schema).compile()
+                except Exception as exception:
+                    logger.debug(f"Schema can't be compiled, jsonschema will be used to normalize records: {exception}")
+                    compiled_node = None
+                self._compiled_schemas[key] = compiled_node
+                if len(self._compiled_schemas) > self.MAX_COMPILED_SCHEMAS:
+                    self._compiled_schemas.popitem(last=False)
+            self._last_compiled_schema = (schema, compiled_node)
+        return compiled_node
+
+    def _compile_conversion(self, subschema: Dict[str, Any]) -> Callable[[Any], Any]:
+        """
+        Returns a function applying the same conversion as `__normalize` for the given subschema.
+        """
+        conversions: List[Callable[[Any], Any]] = []
+        if TransformConfig.DefaultSchemaNormalization in self._config:
+            if type(self).default_convert is TypeTransformer.default_convert:
+                conversions.append(_compile_default_convert(subschema))
+            else:
+                # default_convert was overridden so it needs to be called for every value
+                conversions.append(lambda item: self.default_convert(item, subschema))
+        custom_normalizer = self._custom_normalizer
+        if custom_normalizer:
+            conversions.append(lambda item: custom_normalizer(item, subschema))  # type: ignore # custom_normalizer is not None
+
+        if len(conversions) == 1:
+            return conversions[0]
+
+        def convert(item: Any) -> Any:
+            for conversion in conversions:
+                item = conversion(item)
+            return item
+
+        return convert
+
+
+def _identity(item: Any) -> Any:
+    return item
+
+
+def _compile_default_convert(subschema: Dict[str, Any]) -> Callable[[Any], Any]:
+    """
+    Returns a function equivalent to `TypeTransformer.default_convert(item, subschema)` where the target type is resolved only once.
+    """
+    target_type = subschema.get("type", [])
+    null_is_allowed = "null" in target_type
+    if isinstance(target_type, list):
+        target_type = [t for t in target_type if t != "null"]
+        if len(target_type) != 1:
+            return _identity
+        target_type = target_type[0]
+
+    cast: Callable[[Any], Any]
+    if target_type == "string":
+        cast = str
+    elif target_type == "number":
+        cast = float
+    elif target_type == "integer":
+        cast = int
+    elif target_type == "boolean":
+
+        def cast(item: Any) -> Any:
+            if isinstance(item, str):
+                return strtobool(item) == 1
+            return bool(item)
+
+    elif target_type == "array":
+        item_types = set(subschema.get("items", {}).get("type", set()))
+        if not item_types.issubset(json_to_python_simple):
+            return _identity
+        simple_types = tuple(json_to_python_simple.values())
+
+        def cast(item: Any) -> Any:
+            if type(item) in simple_types:
+                return [item]
+            return item
+
+    else:
+        return _identity
+
+    def convert(item: Any) -> Any:
+        if item is None and null_is_allowed:
+            return None
+        try:
+            return cast(item)
+        except (ValueError, TypeError):
+            return item
+
+    return convert
+
+
+def _raise(error: Exception) -> Callable[..., Any]:
+    def raise_error(*args: Any) -> Any:
+        raise error
+
+    return raise_error
+
+
+def _flatten_path(path: _Path) -> List[Any]:
+    keys = []
+    while path is not None:
+        path, key = path
+        keys.append(key)
+    return keys[::-1]
+
+
+class _SchemaCompiler:
+    """
+    Compiles a json schema into nested functions that normalize a record the same way the jsonschema based normalizer of TypeTransformer
+    does: values are converted when visiting the `properties` and `items` keywords, `$ref` are followed and `type` is checked once the
+    value was converted to log a warning for values that could not be converted. Other keywords are ignored like they are by the
+    jsonschema normalizer. `$ref` are resolved once at compilation time instead of once per record.
+    """
+
+    def __init__(self, transformer: TypeTransformer, schema: Mapping[str, Any]) -> None:
+        self._transformer = transformer
+        self._schema = schema
+        self._resolver = RefResolver.from_schema(schema, id_of=Draft7Validator.ID_OF)
+        self._compiled_references: Dict[str, _CompiledNode] = {}
+
+    def compile(self) -> _CompiledNode:
+        return self._compile_node(self._schema)
+
+    def _compile_node(self, schema: Mapping[str, Any]) -> _CompiledNode:
+        if not isinstance(schema, Mapping):
+            raise ValueError(f"Only object schemas can be compiled, got {schema}")
+
+        scope = Draft7Validator.ID_OF(schema)
+        if scope:
+            self._resolver.push_scope(scope)
+        try:
+            if "$ref" in schema:
+                # like jsonschema, other keywords are ignored when $ref is defined
+                return self._compile_reference(schema["$ref"])
+
+            steps: List[_CompiledNode] = []
+            for keyword, value in schema.items():
+                if keyword == "type":
+                    steps.append(self._compile_type(value))
+                elif keyword == "properties":
+                    steps.append(self._compile_properties(value))
+                elif keyword == "items":
+                    steps.append(self._compile_items(value))
+        finally:
+            if scope:
+                self._resolver.pop_scope()
+
+        if len(steps) == 1:
+            return steps[0]
+
+        def node(instance: Any, path: _Path) -> None:
+            for step in steps:
+                step(instance, path)
+
+        return node
+
+    def _compile_reference(self, reference: str) -> _CompiledNode:
+        url, resolved = self._resolver.resolve(reference)
+        if url in self._compiled_references:
+            return self._compiled_references[url]
+
+        # The reference is registered before being compiled so that recursive schemas do not recurse indefinitely
+        compiled: List[_CompiledNode] = []
+
+        def node(instance: Any, path: _Path) -> None:
+            compiled[0](instance, path)
+
+        self._compiled_references[url] = node
+        self._resolver.push_scope(url)
+        try:
+            compiled.append(self._compile_node(resolved))
+        finally:
+            self._resolver.pop_scope()
+        return node
+
+    def _resolve_once(self, subschema: Mapping[str, Any]) -> Dict[str, Any]:
+        # Values are converted using the subschema with only one level of reference resolved, like the jsonschema normalizer does
+        if "$ref" in subschema:
+            _, resolved = self._resolver.resolve(subschema["$ref"])
+            return resolved  # type: ignore # resolved schemas are dicts
+        return subschema  # type: ignore # subschemas are dicts
+
+    def _compile_type(self, expected_type: Any) -> _CompiledNode:
+        types = [expected_type] if isinstance(expected_type, str) else expected_type
+        is_type = Draft7Validator.TYPE_CHECKER.is_type
+        for json_type in types:
+            # fail at compilation time on unknown types
+            is_type(None, json_type)
+
+        def node(instance: Any, path: _Path) -> None:
+            if not any(is_type(instance, json_type) for json_type in types):
+                logger.warning(TypeTransformer._format_error_message(instance, expected_type, _flatten_path(path)))
+
+        return node
+
+    def _compile_properties(self, properties: Mapping[str, Any]) -> _CompiledNode:
+        compiled_properties = []
+        for name, subschema in properties.items():
+            if not isinstance(subschema, Mapping):
+                raise ValueError(f"Only object schemas can be compiled, got {subschema} for property {name}")
+            try:
+                convert = self._transformer._compile_conversion(self._resolve_once(subschema))
+                compiled_property = self._compile_node(subschema)
+            except RefResolutionError as error:
+                # like with jsonschema, an invalid reference only fails the records that have a value for this property
+                convert = compiled_property = _raise(error)
+            compiled_properties.append((name, convert, compiled_property))
+
+        def node(instance: Any, path: _Path) -> None:
+            if not isinstance(instance, dict):
+                return
+            for name, convert, _ in compiled_properties:
+                if name in instance:
+                    instance[name] = convert(instance[name])
+            for name, _, compiled_property in compiled_properties:
+                if name in instance:
+                    compiled_property(instance[name], (path, name))
+
+        return node
+
+    def _compile_items(self, items: Any) -> _CompiledNode:
+        if not isinstance(items, Mapping):
+            raise ValueError(f"Only object schemas can be compiled for items, got {items}")
+        try:
+            convert = self._transformer._compile_conversion(self._resolve_once(items))
+            compiled_item = self._compile_node(items)
+        except RefResolutionError as error:
+            convert = compiled_item = _raise(error)
+
+        def node(instance: Any, path: _Path) -> None:
+            if not isinstance(instance, list):
+                return
+            for index, item in enumerate(instance):
+                instance[index] = convert(item)
+            for index, item in enumerate(instance):
+                compiled_item(item, (path, index))
+
+        return node
@@ -0,0 +1,35 @@
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+
+"""
+Benchmarks measure the throughput or the duration of an operation on a large input, and log their measures so that they can be compared
+between changes. As they are slow and their measures depend on the machine running them, they are skipped unless the RUN_BENCHMARKS
+environment variable is set, e.g. `RUN_BENCHMARKS=1 pytest -o log_cli=true <test file>`.
+"""
+
+import logging
+import os
+from typing import Any, Callable, TypeVar
+
+RUN_BENCHMARKS_ENVIRONMENT_VARIABLE = "RUN_BENCHMARKS"
+
+logger = logging.getLogger("airbyte.benchmark")
+
+TestFunction = TypeVar("TestFunction", bound=Callable[..., Any])
+
+
+def benchmark(test: TestFunction) -> TestFunction:
+    """
+    Mark a test as a benchmark, which only runs when the RUN_BENCHMARKS environment variable is set
+    """
+    # pytest is only available when running the tests
+    import pytest
+
+    skip_unless_requested = pytest.mark.skipif(
+        not os.environ.get(RUN_BENCHMARKS_ENVIRONMENT_VARIABLE),
+        reason=f"Benchmarks only run when the {RUN_BENCHMARKS_ENVIRONMENT_VARIABLE} environment variable is set",
+    )
+    return skip_unless_requested(test)  # type: ignore[no-any-return]
+
+
+def log_measure(message: str) -> None:
+    logger.info(message)
@@ -2,8 +2,17 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+from typing import TYPE_CHECKING
+
+from airbyte_cdk.lazy_imports import lazy_imports
+
 from .is_cloud_environment import is_cloud_environment
-from .schema_inferrer import SchemaInferrer
 from .traced_exception import AirbyteTracedException
 
+if TYPE_CHECKING:
+    from .schema_inferrer import SchemaInferrer
+
+# SchemaInferrer is imported when it is first accessed as it is only used by the connector builder
+__getattr__, __dir__ = lazy_imports(__name__, {"SchemaInferrer": ".schema_inferrer"})
+
 __all__ = ["AirbyteTracedException", "SchemaInferrer", "is_cloud_environment"]
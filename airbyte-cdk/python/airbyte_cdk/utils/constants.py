@@ -3,3 +3,5 @@
 #
 
 ENV_REQUEST_CACHE_PATH = "REQUEST_CACHE_PATH"
+ENV_MANIFEST_CACHE_PATH = "MANIFEST_CACHE_PATH"
+ENV_ASYNC_HTTP_TRANSPORT = "ASYNC_HTTP_TRANSPORT"
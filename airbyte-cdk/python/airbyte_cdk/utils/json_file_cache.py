@@ -0,0 +1,101 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from importlib import metadata
+from typing import Any, List, Optional
+
+_ENTRY_SUFFIX = ".json"
+
+
+class JsonFileCache:
+    """
+    Caches JSON values in the files of a local directory.
+
+    Entries are keyed by a hash of a JSON serializable key along with the version of the CDK, so that entries written by another version of
+    the CDK are never read. The least recently used entries are removed once the directory holds more than `max_entries` entries.
+    """
+
+    DEFAULT_MAX_ENTRIES = 1_000
+
+    def __init__(self, directory: str, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self._directory = directory
+        self._max_entries = max_entries
+        self._cdk_version = metadata.version("airbyte_cdk")
+        os.makedirs(directory, exist_ok=True)
+        # The directory is only listed again once the number of entries written since it was last listed could exceed the maximum
+        self._lock = threading.Lock()
+        self._number_of_entries = len(self._entries())
+
+    def get(self, key: Any) -> Optional[Any]:
+        path = self._path(key)
+        if not path:
+            return None
+        try:
+            with open(path, "r") as cache_file:
+                value = json.load(cache_file)
+            # the modification time of the entries is used to evict the least recently used ones
+            os.utime(path)
+            return value
+        except (OSError, ValueError):
+            # missing or corrupted entries are considered cache misses
+            return None
+
+    def set(self, key: Any, value: Any) -> None:
+        path = self._path(key)
+        if not path:
+            return
+        try:
+            content = json.dumps(value)
+        except (TypeError, ValueError):
+            # values that can't be serialized (e.g. dates parsed from YAML) are not cached
+            return
+
+        # Entries are written to a temporary file first so concurrent readers never see a partially written entry
+        fd, temporary_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as cache_file:
+                cache_file.write(content)
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+        with self._lock:
+            self._number_of_entries += 1
+            if self._number_of_entries > self._max_entries:
+                self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for entry in self._entries():
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                # the entry was removed by another process sharing the directory
+                pass
+        entries.sort()
+        # a tenth of the entries are freed so that the directory is not listed again on every write once it is full
+        number_of_entries_to_keep = self._max_entries - self._max_entries // 10
+        for _, path in entries[: max(len(entries) - number_of_entries_to_keep, 0)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._number_of_entries = min(len(entries), number_of_entries_to_keep)
+
+    def _entries(self) -> List["os.DirEntry[str]"]:
+        with os.scandir(self._directory) as entries:
+            return [entry for entry in entries if entry.name.endswith(_ENTRY_SUFFIX)]
+
+    def _path(self, key: Any) -> Optional[str]:
+        try:
+            serialized_key = json.dumps([self._cdk_version, key], sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+        return os.path.join(self._directory, f"{hashlib.sha256(serialized_key.encode('utf-8')).hexdigest()}{_ENTRY_SUFFIX}")
@@ -0,0 +1,150 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+from airbyte_cdk.destinations.vector_db_based.config import (
+    FakeEmbeddingConfigModel,
+    FromFieldEmbeddingConfigModel,
+    OpenAIEmbeddingConfigModel,
+    ProcessingConfigModel,
+)
+from airbyte_cdk.destinations.vector_db_based.embedder import (
+    CachedEmbedder,
+    Document,
+    Embedder,
+    FakeEmbedder,
+    FromFieldEmbedder,
+    create_from_config,
+)
+from airbyte_cdk.destinations.vector_db_based.embedding_cache import SqliteEmbeddingCache, hash_text
+from airbyte_cdk.models.airbyte_protocol import AirbyteRecordMessage
+
+
+def _documents(*texts: str):
+    return [Document(page_content=text, record=AirbyteRecordMessage(stream="mystream", data={}, emitted_at=0)) for text in texts]
+
+
+def _embedder() -> MagicMock:
+    embedder = MagicMock(spec=Embedder)
+    embedder.embed_documents.side_effect = lambda documents: [[float(len(document.page_content)), 0.5] for document in documents]
+    return embedder
+
+
+@pytest.fixture(name="cache")
+def cache_fixture(tmp_path):
+    cache = SqliteEmbeddingCache(str(tmp_path / "cache" / "embeddings.db"))
+    yield cache
+    cache.close()
+
+
+def test_sqlite_embedding_cache_round_trip(tmp_path):
+    path = str(tmp_path / "embeddings.db")
+    cache = SqliteEmbeddingCache(path)
+    cache.set("model", {hash_text("a"): [0.1, -2.5], hash_text("b"): [3.0, 4.0]})
+    cache.close()
+
+    cache = SqliteEmbeddingCache(path)
+    assert cache.get("model", [hash_text("a"), hash_text("b"), hash_text("c")]) == {hash_text("a"): [0.1, -2.5], hash_text("b"): [3.0, 4.0]}
+    assert cache.get("other_model", [hash_text("a")]) == {}
+    cache.close()
+
+
+def test_sqlite_embedding_cache_get_more_keys_than_query_batch_size(cache):
+    embeddings = {hash_text(str(i)): [float(i)] for i in range(SqliteEmbeddingCache.QUERY_BATCH_SIZE * 2 + 1)}
+    cache.set("model", embeddings)
+
+    assert cache.get("model", embeddings.keys()) == embeddings
+
+
+def test_cached_embedder_embeds_only_misses_in_a_single_batch(cache):
+    embedder = _embedder()
+    cached_embedder = CachedEmbedder(embedder, cache, "model")
+
+    assert cached_embedder.embed_documents(_documents("a", "bb")) == [[1.0, 0.5], [2.0, 0.5]]
+    assert cached_embedder.embed_documents(_documents("bb", "ccc", "a", "ccc", "dddd")) == [
+        [2.0, 0.5],
+        [3.0, 0.5],
+        [1.0, 0.5],
+        [3.0, 0.5],
+        [4.0, 0.5],
+    ]
+
+    assert [[document.page_content for document in call.args[0]] for call in embedder.embed_documents.call_args_list] == [
+        ["a", "bb"],
+        ["ccc", "dddd"],
+    ]
+    assert (cached_embedder.hits, cached_embedder.misses) == (3, 4)
+    assert cached_embedder.hit_rate == pytest.approx(3 / 7)
+
+
+def test_cached_embedder_does_not_call_embedder_when_all_chunks_are_cached(cache):
+    CachedEmbedder(_embedder(), cache, "model").embed_documents(_documents("a", "b"))
+    embedder = _embedder()
+
+    assert CachedEmbedder(embedder, cache, "model").embed_documents(_documents("b", "a")) == [[1.0, 0.5], [1.0, 0.5]]
+    embedder.embed_documents.assert_not_called()
+
+
+def test_cached_embedder_does_not_reuse_embeddings_of_other_model(cache):
+    CachedEmbedder(_embedder(), cache, "model").embed_documents(_documents("a"))
+    embedder = _embedder()
+
+    CachedEmbedder(embedder, cache, "other_model").embed_documents(_documents("a"))
+
+    embedder.embed_documents.assert_called_once()
+
+
+def test_cached_embedder_does_not_cache_missing_embeddings(cache):
+    embedder = MagicMock(spec=Embedder)
+    embedder.embed_documents.return_value = [None]
+    cached_embedder = CachedEmbedder(embedder, cache, "model")
+
+    assert cached_embedder.embed_documents(_documents("a")) == [None]
+    assert cached_embedder.embed_documents(_documents("a")) == [None]
+    assert embedder.embed_documents.call_count == 2
+
+
+def test_cached_embedder_logs_hit_rate_once_per_interval(cache, caplog):
+    cached_embedder = CachedEmbedder(_embedder(), cache, "model", metrics_emission_interval_in_seconds=3600)
+
+    with caplog.at_level(logging.INFO, logger="airbyte.embedding_cache"):
+        cached_embedder.embed_documents(_documents("a", "b"))
+        cached_embedder.embed_documents(_documents("a", "b"))
+
+    assert [record.getMessage() for record in caplog.records] == [
+        "Embedding cache hit rate for model model: 0.0% (0 chunks served from the cache, 2 embedded)"
+    ]
+
+
+def test_cached_embedder_delegates_check_and_dimensions(cache):
+    embedder = _embedder()
+    embedder.check.return_value = "error"
+    embedder.embedding_dimensions = 2
+    cached_embedder = CachedEmbedder(embedder, cache, "model")
+
+    assert cached_embedder.check() == "error"
+    assert cached_embedder.embedding_dimensions == 2
+
+
+@pytest.mark.parametrize(
+    "embedding_config, expected_embedder_class, expected_model",
+    (
+        (OpenAIEmbeddingConfigModel(mode="openai", openai_key="abc"), CachedEmbedder, "openai:text-embedding-ada-002"),
+        (FakeEmbeddingConfigModel(mode="fake"), CachedEmbedder, "fake"),
+        (FromFieldEmbeddingConfigModel(mode="from_field", dimensions=2, field_name="a"), FromFieldEmbedder, None),
+    ),
+)
+def test_create_from_config_with_embedding_cache(cache, embedding_config, expected_embedder_class, expected_model):
+    embedder = create_from_config(embedding_config, ProcessingConfigModel(chunk_size=1000), embedding_cache=cache)
+
+    assert isinstance(embedder, expected_embedder_class)
+    if expected_model:
+        assert embedder.model == expected_model
+
+
+def test_create_from_config_without_embedding_cache():
+    assert isinstance(create_from_config(FakeEmbeddingConfigModel(mode="fake"), ProcessingConfigModel(chunk_size=1000)), FakeEmbedder)
@@ -0,0 +1,112 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+import logging
+import time
+from typing import Any, Iterable, List, Mapping, Optional
+from unittest.mock import Mock
+
+import pytest
+from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.concurrent_source.concurrent_source import ConcurrentSource
+from airbyte_cdk.sources.message import InMemoryMessageRepository
+from airbyte_cdk.sources.streams.concurrent.availability_strategy import StreamAvailable
+from airbyte_cdk.sources.streams.concurrent.cursor import FinalStateCursor
+from airbyte_cdk.sources.streams.concurrent.default_stream import DefaultStream
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.partition_generator import PartitionGenerator
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger
+from airbyte_cdk.test.benchmark import benchmark, log_measure
+
+# Benchmark of the number of records per second going through the ConcurrentSource queue depending on the number of workers and on the
+# size of the record batches
+
+_STREAM_NAME = "stream"
+_NUMBER_OF_PARTITIONS = 32
+_RECORDS_PER_PARTITION = 1_000
+
+logger = logging.getLogger("airbyte")
+
+
+class _InMemoryPartition(Partition):
+    def __init__(self, partition_id: int, records: List[Record]) -> None:
+        self._partition_id = partition_id
+        self._records = records
+        self._is_closed = False
+
+    def read(self) -> Iterable[Record]:
+        yield from self._records
+
+    def to_slice(self) -> Optional[Mapping[str, Any]]:
+        return {"partition": self._partition_id}
+
+    def stream_name(self) -> str:
+        return _STREAM_NAME
+
+    def close(self) -> None:
+        self._is_closed = True
+
+    def is_closed(self) -> bool:
+        return self._is_closed
+
+    def __hash__(self) -> int:
+        return hash(self._partition_id)
+
+
+class _InMemoryPartitionGenerator(PartitionGenerator):
+    def __init__(self, partitions: List[Partition]) -> None:
+        self._partitions = partitions
+
+    def generate(self) -> Iterable[Partition]:
+        yield from self._partitions
+
+
+def _stream() -> DefaultStream:
+    partitions: List[Partition] = [
+        _InMemoryPartition(
+            partition_id,
+            [
+                Record({"id": partition_id * _RECORDS_PER_PARTITION + i, "name": "a name"}, _STREAM_NAME)
+                for i in range(_RECORDS_PER_PARTITION)
+            ],
+        )
+        for partition_id in range(_NUMBER_OF_PARTITIONS)
+    ]
+    availability_strategy = Mock()
+    availability_strategy.check_availability.return_value = StreamAvailable()
+    message_repository = InMemoryMessageRepository()
+    return DefaultStream(
+        _InMemoryPartitionGenerator(partitions),
+        _STREAM_NAME,
+        {},
+        availability_strategy,
+        [],
+        None,
+        logger,
+        FinalStateCursor(stream_name=_STREAM_NAME, stream_namespace=None, message_repository=message_repository),
+    )
+
+
+@benchmark
+@pytest.mark.parametrize("num_workers", [1, 4, 16])
+@pytest.mark.parametrize("record_batch_size", [1, 1_000])
+def test_concurrent_source_throughput(num_workers: int, record_batch_size: int) -> None:
+    concurrent_source = ConcurrentSource.create(
+        num_workers + 1,  # one thread is dedicated to generating partitions
+        1,
+        logger,
+        DebugSliceLogger(),
+        InMemoryMessageRepository(),
+        record_batch_size=record_batch_size,
+    )
+    stream = _stream()
+
+    start = time.perf_counter()
+    number_of_records = sum(1 for message in concurrent_source.read([stream]) if message.type == MessageType.RECORD)
+    elapsed = time.perf_counter() - start
+
+    assert number_of_records == _NUMBER_OF_PARTITIONS * _RECORDS_PER_PARTITION
+    log_measure(
+        f"{num_workers} workers, batches of {record_batch_size} records: {number_of_records / elapsed:.0f} records/sec ({elapsed:.2f}s)"
+    )
@@ -2,8 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+from unittest.mock import patch
+
 import pytest
 import requests
+from airbyte_cdk.sources.declarative.decoders import json_decoder
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
 
 
@@ -14,3 +17,22 @@ def test_json_decoder(requests_mock, response_body, expected_json):
     requests_mock.register_uri("GET", "https://airbyte.io/", text=response_body)
     response = requests.get("https://airbyte.io/")
     assert JsonDecoder(parameters={}).decode(response) == expected_json
+
+
+@pytest.mark.parametrize(
+    "response_body, expected_json",
+    (
+        ("", {}),
+        ('{"id": 1, "name": "caf\u00e9"}', {"id": 1, "name": "caf\u00e9"}),
+        ('{"big_integer": 123456789012345678901234567890}', {"big_integer": 123456789012345678901234567890}),
+        ('{"not_a_number": NaN}', {"not_a_number": float("nan")}),
+    ),
+)
+def test_given_orjson_not_installed_when_decode_then_decode_with_standard_library(requests_mock, response_body, expected_json):
+    requests_mock.register_uri("GET", "https://airbyte.io/", text=response_body)
+    response = requests.get("https://airbyte.io/")
+
+    with patch.object(json_decoder, "orjson", None):
+        decoded = JsonDecoder(parameters={}).decode(response)
+
+    assert str(decoded) == str(expected_json)
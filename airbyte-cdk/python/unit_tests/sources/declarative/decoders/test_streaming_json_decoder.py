@@ -0,0 +1,107 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+from typing import List
+from unittest.mock import patch
+
+import pytest
+import requests
+from airbyte_cdk.sources.declarative.decoders import streaming_json_decoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
+
+# ijson is an optional dependency installed with the streaming-json extra
+pytest.importorskip("ijson")
+
+
+class ChunkedBody:
+    """
+    Raw content of a response which keeps track of the number of bytes read
+    """
+
+    def __init__(self, content: bytes) -> None:
+        self._content = content
+        self.bytes_read = 0
+
+    def read(self, size: int) -> bytes:
+        chunk = self._content[self.bytes_read : self.bytes_read + size]
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+def create_response(content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = ChunkedBody(content)
+    return response
+
+
+@pytest.mark.parametrize(
+    "body, path, expected_items, expected_remainder",
+    [
+        pytest.param({"data": [{"id": 1}, {"id": 2}]}, ["data"], [{"id": 1}, {"id": 2}], {"data": []}, id="test_array_at_path"),
+        pytest.param(
+            {"meta": {"next": "cursor"}, "data": {"records": [{"id": 1, "tags": [[1.5], {"a": None}]}]}, "total": 1},
+            ["data", "records"],
+            [{"id": 1, "tags": [[1.5], {"a": None}]}],
+            {"meta": {"next": "cursor"}, "data": {"records": []}, "total": 1},
+            id="test_nested_array_at_path",
+        ),
+        pytest.param([{"id": 1}, 2, "three"], [], [{"id": 1}, 2, "three"], [], id="test_array_at_root"),
+        pytest.param({"data": {"id": 1}}, ["data"], [{"id": 1}], {"data": {"id": 1}}, id="test_object_at_path"),
+        pytest.param({"data": {}}, ["data"], [], {"data": {}}, id="test_empty_object_at_path"),
+        pytest.param({"other": [{"id": 1}]}, ["data"], [], {"other": [{"id": 1}]}, id="test_missing_path"),
+        pytest.param(
+            {"items": [{"data": [1]}], "data": [2]}, ["data"], [2], {"items": [{"data": [1]}], "data": []}, id="test_same_key_nested"
+        ),
+    ],
+)
+def test_decode_items(body, path: List[str], expected_items, expected_remainder):
+    response = create_response(json.dumps(body).encode("utf-8"))
+
+    items = list(StreamingJsonDecoder(parameters={}).decode_items(response, path))
+
+    assert items == expected_items
+    assert response.json() == expected_remainder
+
+
+def test_given_large_response_when_decode_items_then_yield_items_before_reading_whole_response():
+    content = json.dumps({"data": [{"id": i, "value": "x" * 100} for i in range(10000)]}).encode("utf-8")
+    response = create_response(content)
+
+    items = StreamingJsonDecoder(parameters={}).decode_items(response, ["data"])
+
+    assert next(items) == {"id": 0, "value": "x" * 100}
+    assert response.raw.bytes_read <= StreamingJsonDecoder.CHUNK_SIZE_IN_BYTES < len(content)
+    assert len(list(items)) == 9999
+    assert response.raw.bytes_read == len(content)
+
+
+def test_given_empty_response_when_decode_items_then_no_items():
+    response = create_response(b"")
+
+    assert list(StreamingJsonDecoder(parameters={}).decode_items(response, ["data"])) == []
+    assert response.json() == {}
+
+
+def test_given_truncated_response_when_decode_items_then_raise():
+    response = create_response(b'{"data": [{"id": 1}, {"id"')
+
+    with pytest.raises(streaming_json_decoder.ijson.JSONError):
+        list(StreamingJsonDecoder(parameters={}).decode_items(response, ["data"]))
+
+
+def test_given_content_already_loaded_when_decode_items_then_decode_loaded_content(requests_mock):
+    requests_mock.register_uri("GET", "https://airbyte.io/", json={"data": [{"id": 1}], "next": 2})
+    response = requests.get("https://airbyte.io/")
+    assert response.json()["next"] == 2
+
+    assert list(StreamingJsonDecoder(parameters={}).decode_items(response, ["data"])) == [{"id": 1}]
+    assert StreamingJsonDecoder(parameters={}).decode(response) == {"data": [], "next": 2}
+
+
+def test_given_ijson_not_installed_when_create_decoder_then_raise():
+    with patch.object(streaming_json_decoder, "ijson", None):
+        with pytest.raises(ImportError):
+            StreamingJsonDecoder(parameters={})
@@ -2,12 +2,16 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import io
 import json
+from unittest.mock import patch
 
 import pytest
 import requests
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors.dpath_extractor import DpathExtractor
+from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 
 config = {"field": "record_array"}
 parameters = {"parameters_field": "record_array"}
@@ -38,6 +42,20 @@ decoder = JsonDecoder(parameters={})
             {"data": [{"list": {"data2": [{"id": 1}, {"id": 2}]}}, {"list": {"data2": [{"id": 3}, {"id": 4}]}}]},
             [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}],
         ),
+        ("test_index_in_list", ["data", "1"], {"data": [{"id": 1}, {"id": 2}]}, [{"id": 2}]),
+        ("test_index_out_of_list", ["data", "2"], {"data": [{"id": 1}, {"id": 2}]}, []),
+        ("test_integer_key", ["data", "1"], {"data": {1: {"id": 1}}}, [{"id": 1}]),
+        ("test_wildcard_over_object", ["data", "*", "id"], {"data": {"a": {"id": 1}, "b": {"id": 2}, "c": 3}}, [1, 2]),
+        ("test_wildcard_over_scalar", ["data", "*"], {"data": "a string"}, []),
+        ("test_field_in_scalar", ["data", "records"], {"data": "a string"}, []),
+        ("test_null_field", ["data"], {"data": None}, []),
+        ("test_glob", ["data", "rec*"], {"data": {"records": [{"id": 1}]}}, [{"id": 1}]),
+        (
+            "test_glob_with_wildcard",
+            ["*", "rec?rds"],
+            {"data": {"records": {"id": 1}}, "other": {"records": {"id": 2}}},
+            [{"id": 1}, {"id": 2}],
+        ),
     ],
 )
 def test_dpath_extractor(test_name, field_path, body, expected_records):
@@ -53,3 +71,60 @@ def create_response(body):
     response = requests.Response()
     response._content = json.dumps(body).encode("utf-8")
     return response
+
+
+def test_given_interpolated_field_path_when_extract_records_then_evaluate_path_on_every_response():
+    extractor_config = {"field": "record_array"}
+    extractor = DpathExtractor(
+        field_path=["data", "{{ config['field'] }}"], config=extractor_config, decoder=decoder, parameters=parameters
+    )
+
+    first_records = extractor.extract_records(create_response({"data": {"record_array": [{"id": 1}], "other_array": [{"id": 2}]}}))
+    extractor_config["field"] = "other_array"
+    second_records = extractor.extract_records(create_response({"data": {"record_array": [{"id": 1}], "other_array": [{"id": 2}]}}))
+
+    assert first_records == [{"id": 1}]
+    assert second_records == [{"id": 2}]
+
+
+def test_given_static_field_path_when_extract_records_then_only_evaluate_path_once():
+    field_path = InterpolatedString.create("data", parameters={})
+    extractor = DpathExtractor(field_path=[field_path], config=config, decoder=decoder, parameters=parameters)
+
+    with patch.object(InterpolatedString, "eval") as eval_mock:
+        records = [extractor.extract_records(create_response({"data": [{"id": i}]})) for i in range(3)]
+
+    assert records == [[{"id": 0}], [{"id": 1}], [{"id": 2}]]
+    eval_mock.assert_not_called()
+
+
+def test_given_streaming_decoder_when_extract_records_then_extract_records_as_response_is_parsed():
+    pytest.importorskip("ijson")
+    extractor = DpathExtractor(
+        field_path=["data", "{{ config['field'] }}"], config=config, decoder=StreamingJsonDecoder(parameters={}), parameters=parameters
+    )
+    response = requests.Response()
+    response.raw = io.BytesIO(json.dumps({"data": {"record_array": [{"id": 1}, {"id": 2}]}, "next": 2}).encode("utf-8"))
+
+    records = extractor.stream_records(response)
+
+    assert next(records) == {"id": 1}
+    assert list(records) == [{"id": 2}]
+    assert response.json() == {"data": {"record_array": []}, "next": 2}
+
+
+@pytest.mark.parametrize(
+    "field_path",
+    [
+        pytest.param(["data", "*"], id="test_wildcard"),
+        pytest.param(["data", "rec*"], id="test_glob"),
+        pytest.param(["{{ config['wildcard'] }}"], id="test_wildcard_in_config"),
+    ],
+)
+def test_given_streaming_decoder_and_field_path_not_made_of_keys_when_extract_records_then_raise(field_path):
+    pytest.importorskip("ijson")
+    with pytest.raises(ValueError):
+        extractor = DpathExtractor(
+            field_path=field_path, config={"wildcard": "*"}, decoder=StreamingJsonDecoder(parameters={}), parameters=parameters
+        )
+        list(extractor.stream_records(requests.Response()))
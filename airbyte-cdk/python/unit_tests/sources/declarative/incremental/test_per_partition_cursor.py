@@ -3,7 +3,7 @@
 #
 
 from collections import OrderedDict
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from airbyte_cdk.sources.declarative.incremental.cursor import Cursor
@@ -403,3 +403,118 @@ def test_get_request_body_json(mocked_cursor_factory, mocked_partition_router, s
     else:
         with pytest.raises(ValueError):
             cursor.get_request_body_json(stream_slice=stream_slice)
+
+
+def test_given_same_partition_when_observe_and_get_request_options_then_serialize_partition_once(
+    mocked_cursor_factory, mocked_partition_router
+):
+    mocked_partition_router.stream_slices.return_value = [StreamSlice(partition={"partition key": "first partition"}, cursor_slice={})]
+    mocked_partition_router.get_request_params.return_value = {}
+    mocked_cursor_factory.create.return_value = MockedCursorBuilder().with_stream_slices([{CURSOR_SLICE_FIELD: "a cursor value"}]).build()
+    mocked_cursor_factory.create.return_value.get_request_params.return_value = {}
+    cursor = PerPartitionCursor(mocked_cursor_factory, mocked_partition_router)
+
+    with patch.object(PerPartitionKeySerializer, "to_partition_key", wraps=PerPartitionKeySerializer.to_partition_key) as to_partition_key:
+        stream_slice = list(cursor.stream_slices())[0]
+        cursor.get_request_params(stream_slice=stream_slice)
+        cursor.observe(stream_slice, Record({}, stream_slice))
+        cursor.close_slice(stream_slice)
+
+    to_partition_key.assert_called_once()
+
+
+def _partition_slices(number_of_partitions):
+    return [StreamSlice(partition={"partition key": f"partition {i}"}, cursor_slice={}) for i in range(number_of_partitions)]
+
+
+def _cursor_with_state(cursor_value):
+    cursor = (
+        MockedCursorBuilder()
+        .with_stream_slices([{CURSOR_SLICE_FIELD: "a cursor value"}])
+        .with_stream_state({CURSOR_STATE_KEY: cursor_value})
+        .build()
+    )
+    cursor.is_greater_than_or_equal.side_effect = lambda first, second: first[CURSOR_STATE_KEY] >= second[CURSOR_STATE_KEY]
+    return cursor
+
+
+def test_given_max_partitions_when_stream_slices_then_evict_oldest_partitions_into_global_state(
+    mocked_cursor_factory, mocked_partition_router
+):
+    mocked_partition_router.stream_slices.return_value = _partition_slices(4)
+    # the last values are for the cursors created to compare the states of the evicted partitions
+    cursor_values = [3, 1, 4, 2, 0, 0]
+    mocked_cursor_factory.create.side_effect = lambda: _cursor_with_state(cursor_values.pop(0))
+    cursor = PerPartitionCursor(mocked_cursor_factory, mocked_partition_router, max_partitions=2)
+
+    slices = list(cursor.stream_slices())
+
+    assert len(slices) == 4
+    assert cursor.get_stream_state() == {
+        "states": [
+            {"partition": {"partition key": "partition 2"}, "cursor": {CURSOR_STATE_KEY: 4}},
+            {"partition": {"partition key": "partition 3"}, "cursor": {CURSOR_STATE_KEY: 2}},
+        ],
+        "state": {CURSOR_STATE_KEY: 1},
+    }
+
+
+def test_given_evicted_partition_without_state_when_get_stream_state_then_no_global_state(mocked_cursor_factory, mocked_partition_router):
+    mocked_partition_router.stream_slices.return_value = _partition_slices(2)
+    mocked_cursor_factory.create.side_effect = [MockedCursorBuilder().build(), _cursor_with_state(1)]
+    cursor = PerPartitionCursor(mocked_cursor_factory, mocked_partition_router, max_partitions=1)
+
+    list(cursor.stream_slices())
+
+    assert cursor.get_stream_state() == {"states": [{"partition": {"partition key": "partition 1"}, "cursor": {CURSOR_STATE_KEY: 1}}]}
+
+
+def test_given_global_state_when_stream_slices_then_unknown_partitions_start_from_global_state(
+    mocked_cursor_factory, mocked_partition_router
+):
+    mocked_partition_router.stream_slices.return_value = _partition_slices(2)
+    known_partition_cursor, unknown_partition_cursor = _cursor_with_state(5), _cursor_with_state(1)
+    mocked_cursor_factory.create.side_effect = [known_partition_cursor, unknown_partition_cursor]
+    cursor = PerPartitionCursor(mocked_cursor_factory, mocked_partition_router, max_partitions=2)
+
+    cursor.set_initial_state(
+        {"states": [{"partition": {"partition key": "partition 0"}, "cursor": {CURSOR_STATE_KEY: 5}}], "state": {CURSOR_STATE_KEY: 1}}
+    )
+    list(cursor.stream_slices())
+
+    known_partition_cursor.set_initial_state.assert_called_once_with({CURSOR_STATE_KEY: 5})
+    unknown_partition_cursor.set_initial_state.assert_called_once_with({CURSOR_STATE_KEY: 1})
+    assert cursor.get_stream_state()["state"] == {CURSOR_STATE_KEY: 1}
+
+
+def test_given_partitions_evicted_when_set_initial_state_then_evicted_partitions_start_from_global_state(
+    mocked_cursor_factory, mocked_partition_router
+):
+    mocked_partition_router.stream_slices.return_value = _partition_slices(1)
+    evicted_partition_cursor = _cursor_with_state(1)
+    # the last value is for the cursor created to compare the states of the evicted partitions
+    mocked_cursor_factory.create.side_effect = [
+        _cursor_with_state(3),
+        _cursor_with_state(5),
+        evicted_partition_cursor,
+        _cursor_with_state(0),
+    ]
+    cursor = PerPartitionCursor(mocked_cursor_factory, mocked_partition_router, max_partitions=1)
+
+    cursor.set_initial_state(
+        {
+            "states": [
+                {"partition": {"partition key": "partition 0"}, "cursor": {CURSOR_STATE_KEY: 3}},
+                {"partition": {"partition key": "partition 1"}, "cursor": {CURSOR_STATE_KEY: 5}},
+            ]
+        }
+    )
+    list(cursor.stream_slices())
+
+    evicted_partition_cursor.set_initial_state.assert_called_once_with({CURSOR_STATE_KEY: 3})
+    assert cursor.get_stream_state()["state"] == {CURSOR_STATE_KEY: 3}
+
+
+def test_given_max_partitions_lower_than_one_when_create_then_raise_error(mocked_cursor_factory, mocked_partition_router):
+    with pytest.raises(ValueError):
+        PerPartitionCursor(mocked_cursor_factory, mocked_partition_router, max_partitions=0)
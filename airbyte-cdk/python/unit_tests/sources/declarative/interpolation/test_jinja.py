@@ -261,3 +261,39 @@ def test_macros_examples(template_string, expected_value):
     # If you change the expected output, you must also change the expected output in declarative_component_schema.yaml
     now_utc = interpolation.eval(template_string, {})
     assert now_utc == expected_value
+
+
+def test_templates_are_compiled_once():
+    jinja_interpolation = JinjaInterpolation()
+    s = "{{ config['date'] }}"
+
+    assert jinja_interpolation.eval(s, {"date": "2022-01-01"}) == "2022-01-01"
+    assert jinja_interpolation.eval(s, {"date": "2023-01-01"}) == "2023-01-01"
+
+    cache_info = jinja_interpolation.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
+
+
+@pytest.mark.parametrize(
+    "s, expected_value",
+    [
+        pytest.param("hello world", "hello world", id="test_static_string"),
+        pytest.param("{ not a template }", "{ not a template }", id="test_static_string_with_braces"),
+        pytest.param("hello\n", "hello", id="test_trailing_newline_is_rendered"),
+    ],
+)
+def test_static_strings_skip_compilation(s, expected_value):
+    jinja_interpolation = JinjaInterpolation()
+
+    assert jinja_interpolation.eval(s, {}) == expected_value
+    assert jinja_interpolation.cache_info().currsize == (0 if s == expected_value else 1)
+
+
+def test_undeclared_variables_are_checked_on_cached_templates():
+    jinja_interpolation = JinjaInterpolation()
+    s = "{{ stream_slice['date'] }}"
+
+    assert jinja_interpolation.eval(s, {}, stream_slice={"date": "2022-01-01"}) == "2022-01-01"
+    with pytest.raises(ValueError):
+        jinja_interpolation.eval(s, {})
@@ -20,7 +20,7 @@ from airbyte_cdk.sources.declarative.auth.token_provider import SessionTokenProv
 from airbyte_cdk.sources.declarative.checks import CheckStream
 from airbyte_cdk.sources.declarative.datetime import MinMaxDatetime
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
-from airbyte_cdk.sources.declarative.decoders import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders import JsonDecoder, StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordFilter, RecordSelector
 from airbyte_cdk.sources.declarative.incremental import DatetimeBasedCursor, PerPartitionCursor
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
@@ -1761,6 +1761,65 @@ def test_simple_retriever_emit_log_messages():
     assert connector_builder_factory._message_repository._log_level == Level.DEBUG
 
 
+def test_given_streaming_json_decoder_when_create_simple_retriever_then_requester_streams_responses():
+    simple_retriever_model = {
+        "type": "SimpleRetriever",
+        "record_selector": {
+            "type": "RecordSelector",
+            "extractor": {"type": "DpathExtractor", "field_path": ["data"], "decoder": {"type": "StreamingJsonDecoder"}},
+        },
+        "requester": {"type": "HttpRequester", "name": "list", "url_base": "orange.com", "path": "/v1/api"},
+        "paginator": {
+            "type": "DefaultPaginator",
+            "pagination_strategy": {"type": "CursorPagination", "cursor_value": "{{ response.next }}"},
+        },
+    }
+
+    retriever = factory.create_component(
+        model_type=SimpleRetrieverModel,
+        component_definition=simple_retriever_model,
+        config={},
+        name="Test",
+        primary_key="id",
+        stream_slicer=None,
+        transformations=[],
+    )
+
+    assert isinstance(retriever.record_selector.extractor.decoder, StreamingJsonDecoder)
+    assert retriever.record_selector.is_stream_response()
+    assert retriever.requester.stream_response
+
+
+@pytest.mark.parametrize(
+    "pagination_strategy",
+    [
+        pytest.param({"type": "OffsetIncrement", "page_size": 100}, id="test_offset_increment"),
+        pytest.param({"type": "PageIncrement", "page_size": 100}, id="test_page_increment"),
+    ],
+)
+def test_given_streaming_json_decoder_and_pagination_counting_records_when_create_simple_retriever_then_raise(pagination_strategy):
+    simple_retriever_model = {
+        "type": "SimpleRetriever",
+        "record_selector": {
+            "type": "RecordSelector",
+            "extractor": {"type": "DpathExtractor", "field_path": ["data"], "decoder": {"type": "StreamingJsonDecoder"}},
+        },
+        "requester": {"type": "HttpRequester", "name": "list", "url_base": "orange.com", "path": "/v1/api"},
+        "paginator": {"type": "DefaultPaginator", "pagination_strategy": pagination_strategy},
+    }
+
+    with pytest.raises(ValueError):
+        factory.create_component(
+            model_type=SimpleRetrieverModel,
+            component_definition=simple_retriever_model,
+            config={},
+            name="Test",
+            primary_key="id",
+            stream_slicer=None,
+            transformations=[],
+        )
+
+
 def test_ignore_retry():
     requester_model = {
         "type": "HttpRequester",
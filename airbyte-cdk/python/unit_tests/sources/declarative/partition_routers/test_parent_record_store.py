@@ -0,0 +1,102 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import gc
+import os
+import threading
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_store import ParentRecordStore
+
+_FIRST_PARTITION = {"slice": "first"}
+_SECOND_PARTITION = {"slice": "second"}
+_PARTITION_VALUES = [(_FIRST_PARTITION, 1), (_FIRST_PARTITION, {"nested": "value"}), (_SECOND_PARTITION, [1, 2])]
+
+
+@pytest.fixture(params=[False, True], ids=["in-memory", "on-disk"])
+def store(request, tmp_path):
+    return ParentRecordStore(str(tmp_path) if request.param else None)
+
+
+def test_given_parent_read_when_read_again_then_return_stored_values_without_reading_parent(store):
+    read_parent = Mock(return_value=iter(_PARTITION_VALUES))
+
+    first_read = list(store.read("a key", read_parent))
+    second_read = list(store.read("a key", read_parent))
+
+    assert first_read == _PARTITION_VALUES
+    assert second_read == _PARTITION_VALUES
+    read_parent.assert_called_once()
+
+
+def test_given_different_keys_when_read_then_read_each_parent(store):
+    read_parent = Mock(side_effect=lambda: iter(_PARTITION_VALUES))
+
+    list(store.read("a key", read_parent))
+    list(store.read("another key", read_parent))
+
+    assert read_parent.call_count == 2
+
+
+def test_given_parent_read_interrupted_when_read_again_then_read_parent_again(store):
+    read_parent = Mock(side_effect=lambda: iter(_PARTITION_VALUES))
+
+    interrupted_read = store.read("a key", read_parent)
+    next(interrupted_read)
+    interrupted_read.close()
+
+    assert list(store.read("a key", read_parent)) == _PARTITION_VALUES
+    assert read_parent.call_count == 2
+
+
+def test_given_parent_raises_when_read_again_then_read_parent_again(store):
+    read_parent = Mock(side_effect=[ValueError("an error"), iter(_PARTITION_VALUES)])
+
+    with pytest.raises(ValueError):
+        list(store.read("a key", read_parent))
+
+    assert list(store.read("a key", read_parent)) == _PARTITION_VALUES
+
+
+def test_given_values_that_are_not_json_types_when_read_again_then_return_values_with_same_types(store):
+    partition_values = [(_FIRST_PARTITION, (1, 2)), (_FIRST_PARTITION, {1: "integer key"}), (_SECOND_PARTITION, datetime(2023, 1, 1))]
+    read_parent = Mock(return_value=iter(partition_values))
+
+    list(store.read("a key", read_parent))
+    second_read = list(store.read("a key", read_parent))
+
+    assert second_read == partition_values
+    assert type(second_read[0][1]) == tuple
+    read_parent.assert_called_once()
+
+
+def test_given_values_not_serializable_when_read_on_disk_then_do_not_store_values(tmp_path):
+    store = ParentRecordStore(str(tmp_path))
+    partition_values = [(_FIRST_PARTITION, threading.Lock())]
+    read_parent = Mock(side_effect=lambda: iter(partition_values))
+
+    assert list(store.read("a key", read_parent)) == partition_values
+    assert list(store.read("a key", read_parent)) == partition_values
+    assert read_parent.call_count == 2
+
+
+def test_given_values_on_disk_when_store_is_garbage_collected_then_remove_files(tmp_path):
+    store = ParentRecordStore(str(tmp_path))
+    list(store.read("a key", lambda: iter(_PARTITION_VALUES)))
+    assert os.listdir(tmp_path)
+
+    del store
+    gc.collect()
+
+    assert not os.listdir(tmp_path)
+
+
+def test_given_directory_does_not_exist_when_read_then_create_directory(tmp_path):
+    directory = os.path.join(str(tmp_path), "missing")
+    store = ParentRecordStore(directory)
+
+    assert list(store.read("a key", lambda: iter(_PARTITION_VALUES))) == _PARTITION_VALUES
+    assert os.listdir(directory)
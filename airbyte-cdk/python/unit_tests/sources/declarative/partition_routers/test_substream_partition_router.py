@@ -8,6 +8,7 @@ import pytest as pytest
 from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, SyncMode, Type
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
 from airbyte_cdk.sources.declarative.incremental.per_partition_cursor import StreamSlice
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_store import ParentRecordStore
 from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import ParentStreamConfig, SubstreamPartitionRouter
 from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
 from airbyte_cdk.sources.declarative.types import Record
@@ -106,20 +107,24 @@ class MockStream(DeclarativeStream):
             ],
         ),
         (
-                [
-                    ParentStreamConfig(
-                        stream=MockStream([StreamSlice(partition=p, cursor_slice={"start": 0, "end": 1}) for p in parent_slices], all_parent_data, "first_stream"),
-                        parent_key="id",
-                        partition_field="first_stream_id",
-                        parameters={},
-                        config={},
-                    )
-                ],
-                [
-                    {"parent_slice": {"slice": "first"}, "first_stream_id": 0},
-                    {"parent_slice": {"slice": "first"}, "first_stream_id": 1},
-                    {"parent_slice": {"slice": "second"}, "first_stream_id": 2},
-                ],
+            [
+                ParentStreamConfig(
+                    stream=MockStream(
+                        [StreamSlice(partition=p, cursor_slice={"start": 0, "end": 1}) for p in parent_slices],
+                        all_parent_data,
+                        "first_stream",
+                    ),
+                    parent_key="id",
+                    partition_field="first_stream_id",
+                    parameters={},
+                    config={},
+                )
+            ],
+            [
+                {"parent_slice": {"slice": "first"}, "first_stream_id": 0},
+                {"parent_slice": {"slice": "first"}, "first_stream_id": 1},
+                {"parent_slice": {"slice": "second"}, "first_stream_id": 2},
+            ],
         ),
         (
             [
@@ -402,3 +407,74 @@ def test_given_record_is_record_object_when_stream_slices_then_use_record_data()
 
     slices = list(partition_router.stream_slices())
     assert slices == [{"partition_field": "record value", "parent_slice": parent_slice}]
+
+
+class CountingMockStream(MockStream):
+    def __init__(self, slices, records, name):
+        super().__init__(slices, records, name)
+        self.read_count = 0
+
+    def read_records(self, *args: Any, **kwargs: Any) -> Iterable[Mapping[str, Any]]:
+        self.read_count += 1
+        yield from super().read_records(*args, **kwargs)
+
+
+@pytest.mark.parametrize("spill_to_disk", [False, True])
+def test_given_parent_record_store_when_sibling_routers_read_same_parent_then_read_parent_once(tmp_path, spill_to_disk):
+    parent_record_store = ParentRecordStore(str(tmp_path) if spill_to_disk else None)
+    parent_stream = CountingMockStream(parent_slices, all_parent_data, "first_stream")
+    routers = [
+        SubstreamPartitionRouter(
+            parent_stream_configs=[
+                ParentStreamConfig(
+                    stream=parent_stream,
+                    parent_key="id",
+                    partition_field=partition_field,
+                    parameters={},
+                    config={},
+                    parent_record_store=parent_record_store,
+                    parent_record_store_key="first_stream",
+                )
+            ],
+            parameters={},
+            config={},
+        )
+        for partition_field in ["first_stream_id", "another_field"]
+    ]
+
+    first_slices = list(routers[0].stream_slices())
+    second_slices = list(routers[1].stream_slices())
+
+    assert parent_stream.read_count == len(parent_slices)
+    assert first_slices == [
+        {"first_stream_id": 0, "parent_slice": {"slice": "first"}},
+        {"first_stream_id": 1, "parent_slice": {"slice": "first"}},
+        {"first_stream_id": 2, "parent_slice": {"slice": "second"}},
+    ]
+    assert second_slices == [
+        {"another_field": 0, "parent_slice": {"slice": "first"}},
+        {"another_field": 1, "parent_slice": {"slice": "first"}},
+        {"another_field": 2, "parent_slice": {"slice": "second"}},
+    ]
+
+
+def test_given_parent_read_interrupted_when_stream_slices_then_read_parent_again():
+    parent_record_store = ParentRecordStore()
+    parent_stream = CountingMockStream(parent_slices, all_parent_data, "first_stream")
+    parent_stream_config = ParentStreamConfig(
+        stream=parent_stream,
+        parent_key="id",
+        partition_field="first_stream_id",
+        parameters={},
+        config={},
+        parent_record_store=parent_record_store,
+        parent_record_store_key="first_stream",
+    )
+    router = SubstreamPartitionRouter(parent_stream_configs=[parent_stream_config], parameters={}, config={})
+
+    slices = router.stream_slices()
+    next(slices)
+    slices.close()
+    assert len(list(router.stream_slices())) == 3
+
+    assert parent_stream.read_count == 1 + len(parent_slices)
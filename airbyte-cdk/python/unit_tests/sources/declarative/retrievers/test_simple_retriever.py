@@ -540,3 +540,38 @@ def test_emit_log_request_response_messages(mocker):
 
     assert requester.send_request.call_args_list[0][1]["log_formatter"] is not None
     assert requester.send_request.call_args_list[0][1]["log_formatter"](response) == format_http_message_mock.return_value
+
+
+def test_given_record_selector_streaming_response_when_read_records_then_yield_records_lazily_and_give_last_record_to_paginator():
+    # imported here as importing the extractors before the other components changes how pydantic parses some of the models
+    from airbyte_cdk.sources.declarative.extractors import RecordSelector
+
+    first_record = Record({"id": 1}, {})
+    second_record = Record({"id": 2}, {})
+    record_selector = MagicMock(spec=RecordSelector)
+    record_selector.is_stream_response.return_value = True
+    record_selector.stream_records.return_value = iter([first_record, second_record])
+    paginator = MagicMock()
+    paginator.get_request_headers.return_value = {}
+    paginator.next_page_token.return_value = None
+    response = requests.Response()
+    response.status_code = 200
+    requester = MagicMock()
+    requester.send_request.return_value = response
+
+    retriever = SimpleRetriever(
+        name="stream_name",
+        primary_key=primary_key,
+        requester=requester,
+        paginator=paginator,
+        record_selector=record_selector,
+        parameters={},
+        config={},
+    )
+    records = retriever.read_records(stream_slice={}, records_schema={})
+
+    assert next(records) == first_record
+    paginator.next_page_token.assert_not_called()
+    assert list(records) == [second_record]
+    paginator.next_page_token.assert_called_once_with(response, [second_record])
+    record_selector.select_records.assert_not_called()
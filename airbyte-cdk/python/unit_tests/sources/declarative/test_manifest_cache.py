@@ -0,0 +1,54 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import os
+from datetime import date
+from unittest.mock import patch
+
+from airbyte_cdk.sources.declarative.manifest_cache import ManifestCache
+
+_MANIFEST = {"version": "0.29.3", "streams": [{"name": "a_stream"}]}
+_RESOLVED_MANIFEST = {"version": "0.29.3", "type": "DeclarativeSource", "streams": [{"type": "DeclarativeStream", "name": "a_stream"}]}
+
+
+def test_given_manifest_cached_when_get_then_return_resolved_manifest(tmp_path):
+    cache = ManifestCache(str(tmp_path))
+    cache.set(_MANIFEST, _RESOLVED_MANIFEST)
+
+    assert ManifestCache(str(tmp_path)).get(dict(_MANIFEST)) == _RESOLVED_MANIFEST
+
+
+def test_given_manifest_not_cached_when_get_then_return_none(tmp_path):
+    cache = ManifestCache(str(tmp_path))
+    cache.set(_MANIFEST, _RESOLVED_MANIFEST)
+
+    assert cache.get({**_MANIFEST, "version": "0.29.4"}) is None
+
+
+def test_given_cdk_version_changed_when_get_then_return_none(tmp_path):
+    with patch("airbyte_cdk.utils.json_file_cache.metadata.version", return_value="0.1.0"):
+        ManifestCache(str(tmp_path)).set(_MANIFEST, _RESOLVED_MANIFEST)
+
+    with patch("airbyte_cdk.utils.json_file_cache.metadata.version", return_value="0.2.0"):
+        assert ManifestCache(str(tmp_path)).get(_MANIFEST) is None
+
+
+def test_given_corrupted_entry_when_get_then_return_none(tmp_path):
+    cache = ManifestCache(str(tmp_path))
+    cache.set(_MANIFEST, _RESOLVED_MANIFEST)
+    for file_name in os.listdir(tmp_path):
+        with open(os.path.join(tmp_path, file_name), "w") as cache_file:
+            cache_file.write("{not json")
+
+    assert cache.get(_MANIFEST) is None
+
+
+def test_given_manifest_not_serializable_when_set_then_do_not_cache(tmp_path):
+    manifest = {**_MANIFEST, "start_date": date(2023, 1, 1)}
+    cache = ManifestCache(str(tmp_path))
+
+    cache.set(manifest, manifest)
+
+    assert cache.get(manifest) is None
+    assert os.listdir(tmp_path) == []
@@ -26,7 +26,9 @@ from airbyte_cdk.models import (
 )
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
 from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
+from airbyte_cdk.sources.declarative.parsers.manifest_reference_resolver import ManifestReferenceResolver
 from airbyte_cdk.sources.declarative.retrievers.simple_retriever import SimpleRetriever
+from airbyte_cdk.utils.constants import ENV_ASYNC_HTTP_TRANSPORT, ENV_MANIFEST_CACHE_PATH, ENV_REQUEST_CACHE_PATH
 from jsonschema.exceptions import ValidationError
 
 logger = logging.getLogger("airbyte")
@@ -740,7 +742,7 @@ class TestManifestDeclarativeSource:
         source = ManifestDeclarativeSource(source_config=any_valid_manifest, debug=True)
 
         debug_logger = logging.getLogger("logger.debug")
-        list(source.read(debug_logger, {}, {}, {}))
+        list(source.read(debug_logger, {}, ConfiguredAirbyteCatalog(streams=[]), {}))
 
         assert debug_logger.isEnabledFor(logging.DEBUG)
 
@@ -1127,7 +1129,7 @@ def test_read_manifest_declarative_source(test_name, manifest, pages, expected_r
         mock_retriever.assert_has_calls(expected_calls)
 
 
-def test_only_parent_streams_use_cache():
+def test_parent_streams_of_partition_routers_do_not_use_cache():
     applications_stream = {
         "type": "DeclarativeStream",
         "$parameters": {"name": "applications", "primary_key": "id", "url_base": "https://harvest.greenhouse.io/v1/"},
@@ -1229,23 +1231,78 @@ def test_only_parent_streams_use_cache():
     streams = source.streams({})
     assert len(streams) == 3
 
-    # Main stream with caching (parent for substream `applications_interviews`)
+    # Parent of a partition router: the values read from it are shared through the parent record store instead of the HTTP cache
     assert streams[0].name == "applications"
-    assert streams[0].retriever.requester.use_cache
+    assert not streams[0].retriever.requester.use_cache
 
     # Substream
     assert streams[1].name == "applications_interviews"
     assert not streams[1].retriever.requester.use_cache
 
     # Parent stream created for substream
-    assert streams[1].retriever.stream_slicer.parent_stream_configs[0].stream.name == "applications"
-    assert streams[1].retriever.stream_slicer.parent_stream_configs[0].stream.retriever.requester.use_cache
+    parent_stream_config = streams[1].retriever.stream_slicer.parent_stream_configs[0]
+    assert parent_stream_config.stream.name == "applications"
+    assert not parent_stream_config.stream.retriever.requester.use_cache
+    assert parent_stream_config.parent_record_store
+    assert parent_stream_config.parent_record_store_key
 
     # Main stream without caching
     assert streams[2].name == "jobs"
     assert not streams[2].retriever.requester.use_cache
 
 
+@pytest.mark.parametrize("stream_names", [["lists", "contacts"], ["contacts", "lists"]])
+def test_given_parent_stream_selected_when_read_then_request_parent_once(requests_mock, tmp_path, stream_names):
+    lists_requester = {"url_base": "https://api.sendgrid.com", "path": "/v3/marketing/lists"}
+    lists_stream = {
+        "type": "DeclarativeStream",
+        "$parameters": {"name": "lists", "primary_key": "id"},
+        "retriever": {"requester": lists_requester, "record_selector": {"extractor": {"field_path": ["result"]}}},
+    }
+    manifest = {
+        "version": "0.29.3",
+        "definitions": {},
+        "streams": [
+            deepcopy(lists_stream),
+            {
+                "type": "DeclarativeStream",
+                "$parameters": {"name": "contacts", "primary_key": "id"},
+                "retriever": {
+                    "requester": {
+                        "url_base": "https://api.sendgrid.com",
+                        "path": "/v3/marketing/lists/{{ stream_partition.list_id }}/contacts",
+                    },
+                    "record_selector": {"extractor": {"field_path": ["result"]}},
+                    "partition_router": {
+                        "type": "SubstreamPartitionRouter",
+                        "parent_stream_configs": [{"parent_key": "id", "partition_field": "list_id", "stream": deepcopy(lists_stream)}],
+                    },
+                },
+            },
+        ],
+        "check": {"type": "CheckStream", "stream_names": ["lists"]},
+    }
+    lists_request = requests_mock.get("https://api.sendgrid.com/v3/marketing/lists", json={"result": [{"id": 1}, {"id": 2}]})
+    requests_mock.get("https://api.sendgrid.com/v3/marketing/lists/1/contacts", json={"result": [{"id": 10}]})
+    requests_mock.get("https://api.sendgrid.com/v3/marketing/lists/2/contacts", json={"result": [{"id": 20}]})
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name=stream_name, json_schema={}, supported_sync_modes=[SyncMode.full_refresh]),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.append,
+            )
+            for stream_name in stream_names
+        ]
+    )
+
+    with patch.dict(os.environ, {ENV_REQUEST_CACHE_PATH: str(tmp_path)}):
+        messages = list(ManifestDeclarativeSource(source_config=manifest).read(logger, {}, catalog, {}))
+
+    assert sorted(message.record.data["id"] for message in messages if message.record) == [1, 2, 10, 20]
+    assert lists_request.call_count == 1
+
+
 def _run_read(manifest: Mapping[str, Any], stream_name: str) -> List[AirbyteMessage]:
     source = ManifestDeclarativeSource(source_config=manifest)
     catalog = ConfiguredAirbyteCatalog(
@@ -1258,3 +1315,73 @@ def _run_read(manifest: Mapping[str, Any], stream_name: str) -> List[AirbyteMess
         ]
     )
     return list(source.read(logger, {}, catalog, {}))
+
+
+def _simple_manifest() -> Mapping[str, Any]:
+    return {
+        "version": "0.29.3",
+        "definitions": {"requester": {"url_base": "https://api.sendgrid.com", "path": "/v3/marketing/lists"}},
+        "streams": [
+            {
+                "type": "DeclarativeStream",
+                "$parameters": {"name": "lists", "primary_key": "id"},
+                "retriever": {
+                    "requester": {"$ref": "#/definitions/requester"},
+                    "record_selector": {"extractor": {"field_path": ["result"]}},
+                },
+            }
+        ],
+        "check": {"type": "CheckStream", "stream_names": ["lists"]},
+    }
+
+
+def test_given_manifest_cache_when_create_source_again_then_skip_resolution_and_validation(tmp_path):
+    source = ManifestDeclarativeSource(source_config=_simple_manifest(), manifest_cache_directory=str(tmp_path))
+
+    with patch.object(ManifestReferenceResolver, "preprocess_manifest") as preprocess_manifest, patch(
+        "airbyte_cdk.sources.declarative.manifest_declarative_source.validate"
+    ) as validate:
+        cached_source = ManifestDeclarativeSource(source_config=_simple_manifest(), manifest_cache_directory=str(tmp_path))
+
+    preprocess_manifest.assert_not_called()
+    validate.assert_not_called()
+    assert cached_source.resolved_manifest == source.resolved_manifest
+    assert [stream.name for stream in cached_source.streams({})] == ["lists"]
+
+
+def test_given_manifest_cache_path_env_variable_when_create_source_then_cache_manifest(tmp_path):
+    with patch.dict(os.environ, {ENV_MANIFEST_CACHE_PATH: str(tmp_path)}):
+        ManifestDeclarativeSource(source_config=_simple_manifest())
+
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_given_invalid_manifest_when_create_source_with_manifest_cache_then_do_not_cache(tmp_path):
+    manifest = _simple_manifest()
+    manifest["streams"][0]["retriever"]["requester"]["http_method"] = "NOT_A_METHOD"
+
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            ManifestDeclarativeSource(source_config=manifest, manifest_cache_directory=str(tmp_path))
+
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.parametrize("async_http_transport", [True, False])
+def test_given_async_http_transport_env_variable_when_read_then_send_requests_through_transport_and_close_it(
+    requests_mock, async_http_transport
+):
+    requests_mock.get("https://api.sendgrid.com/v3/marketing/lists", json={"result": [{"id": 1}]})
+    environment = {ENV_ASYNC_HTTP_TRANSPORT: "true"} if async_http_transport else {}
+
+    with patch.dict(os.environ, environment), patch(
+        "airbyte_cdk.sources.declarative.manifest_declarative_source.AsyncHttpTransport"
+    ) as transport_class:
+        records = [message.record.data for message in _run_read(_simple_manifest(), "lists") if message.record]
+
+    assert records == [{"id": 1}]
+    if async_http_transport:
+        transport_class.return_value.mount.assert_called()
+        transport_class.return_value.close.assert_called_once()
+    else:
+        transport_class.assert_not_called()
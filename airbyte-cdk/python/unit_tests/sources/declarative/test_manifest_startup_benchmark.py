@@ -0,0 +1,57 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+import glob
+import os
+import time
+from typing import Any, List, Mapping
+
+import pytest
+import yaml
+from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
+from airbyte_cdk.test.benchmark import benchmark, log_measure
+from jsonschema.exceptions import ValidationError
+
+# Benchmark of the time spent creating a ManifestDeclarativeSource for the low-code connectors of the repository, with and without the
+# manifest cache. Creating the source is what every spec/check/discover/read invocation of a low-code connector pays on startup
+
+_CONNECTORS_DIRECTORY = os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "..", "airbyte-integrations", "connectors")
+_NUMBER_OF_CONNECTORS = 20
+
+
+def _load_manifests() -> List[Mapping[str, Any]]:
+    manifests = []
+    for path in sorted(glob.glob(os.path.join(_CONNECTORS_DIRECTORY, "source-*", "source_*", "manifest.yaml")))[:_NUMBER_OF_CONNECTORS]:
+        with open(path) as manifest_file:
+            manifests.append(yaml.safe_load(manifest_file))
+    return manifests
+
+
+def _startup_time_in_seconds(manifest: Mapping[str, Any], manifest_cache_directory: str) -> float:
+    start = time.perf_counter()
+    ManifestDeclarativeSource(manifest, manifest_cache_directory=manifest_cache_directory)
+    return time.perf_counter() - start
+
+
+@benchmark
+def test_manifest_startup_time(tmp_path) -> None:
+    cold_startup_times = []
+    warm_startup_times = []
+    for manifest in _load_manifests():
+        try:
+            cold_startup_times.append(_startup_time_in_seconds(manifest, str(tmp_path)))
+        except (ValidationError, ValueError, RuntimeError):
+            # manifests that can't be loaded with this version of the CDK are not part of the benchmark
+            continue
+        warm_startup_times.append(_startup_time_in_seconds(manifest, str(tmp_path)))
+    if not cold_startup_times:
+        pytest.skip(f"No low-code connector found in {_CONNECTORS_DIRECTORY}")
+
+    number_of_connectors = len(cold_startup_times)
+    log_measure(
+        f"{number_of_connectors} low-code connectors: "
+        f"{sum(cold_startup_times) / number_of_connectors * 1000:.1f}ms per startup without manifest cache "
+        f"(max {max(cold_startup_times) * 1000:.1f}ms), "
+        f"{sum(warm_startup_times) / number_of_connectors * 1000:.1f}ms per startup with manifest cache "
+        f"(max {max(warm_startup_times) * 1000:.1f}ms)"
+    )
@@ -8,7 +8,7 @@ import io
 import logging
 import unittest
 from datetime import datetime
-from typing import Any, Dict, Generator, List, Set
+from typing import Any, Callable, Dict, Generator, List, Set, Tuple
 from unittest import TestCase, mock
 from unittest.mock import Mock
 
@@ -581,6 +581,95 @@ def test_mismatch_between_values_and_header(ignore_errors_on_fields_mismatch, da
         logger.error.assert_called_with(error_message)
 
 
+class ArrowCsvParserTest(unittest.TestCase):
+    _CONFIG_NAME = "config_name"
+    _SCHEMA = {
+        "properties": {"id": {"type": "integer"}, "active": {"type": "boolean"}, "tags": {"type": "array"}, "name": {"type": "string"}}
+    }
+
+    def setUp(self) -> None:
+        self._config_format = CsvFormat()
+        self._config = Mock()
+        self._config.name = self._CONFIG_NAME
+        self._config.format = self._config_format
+        self._config.schemaless = False
+
+        self._file = RemoteFile(uri="a uri", last_modified=datetime.now())
+        self._stream_reader = Mock(spec=AbstractFileBasedStreamReader)
+
+    def test_given_schema_when_parse_records_then_records_and_warnings_are_the_same_as_python(self) -> None:
+        data = [
+            "id,active,tags,name,ignored",
+            '1,true,"[""a""]",first,x',
+            'not an int,maybe,"{""a"": 1}",second,y',
+            ",false,[],,z",
+        ]
+
+        python_logger, python_records = self._parse_records(CsvParser(), data, self._SCHEMA)
+        arrow_logger, arrow_records = self._parse_records(CsvParser(use_pyarrow=True), data, self._SCHEMA)
+
+        assert arrow_records == python_records
+        assert arrow_records[0] == {"id": 1, "active": True, "tags": ["a"], "name": "first"}
+        assert arrow_logger.warning.call_args_list == python_logger.warning.call_args_list
+        assert arrow_logger.warning.call_count == 2
+
+    def test_given_no_schema_when_parse_records_then_values_are_not_cast(self) -> None:
+        _, records = self._parse_records(CsvParser(use_pyarrow=True), ["header1,header2", "1,true", '2,"multi\nline"'], None)
+        assert records == [{"header1": "1", "header2": "true"}, {"header1": "2", "header2": "multi\nline"}]
+
+    def test_given_skip_rows_and_non_ascii_values_when_parse_records_then_parse_properly(self) -> None:
+        self._config_format.skip_rows_before_header = 1
+        self._config_format.skip_rows_after_header = 1
+        data = ["skipped before", "header", "skipped after", "caf\u00e9", "\u65e5\u672c"]
+
+        _, records = self._parse_records(CsvParser(use_pyarrow=True), data, None)
+
+        assert records == [{"header": "caf\u00e9"}, {"header": "\u65e5\u672c"}]
+
+    def test_given_too_few_values_when_parse_records_then_raise_after_yielding_previous_records(self) -> None:
+        data = ["header1,header2", "a,b", "c,d", "too few values"]
+        records = []
+
+        self._stream_reader.open_file.side_effect = self._open_file_side_effect(data)
+        with pytest.raises(RecordParseError) as exc_info:
+            for record in CsvParser(use_pyarrow=True).parse_records(self._config, self._file, self._stream_reader, Mock(), None):
+                records.append(record)
+
+        assert records == [{"header1": "a", "header2": "b"}, {"header1": "c", "header2": "d"}]
+        assert "lineno=2" in str(exc_info.value)
+
+    def test_given_ignore_errors_on_fields_mismatch_when_parse_records_then_log_the_same_errors_as_python(self) -> None:
+        self._config_format.ignore_errors_on_fields_mismatch = True
+        data = ["header1,header2", "a,b", "too many,values,here", "c,d"]
+
+        python_logger, python_records = self._parse_records(CsvParser(), data, None)
+        arrow_logger, arrow_records = self._parse_records(CsvParser(use_pyarrow=True), data, None)
+
+        assert arrow_records == python_records
+        assert arrow_logger.error.call_args_list == python_logger.error.call_args_list
+        arrow_logger.error.assert_called_once_with("Skipping record in line 3 of file a uri; invalid CSV row with missing column.")
+
+    def test_given_generator_closed_when_parse_records_then_unregister_dialect(self) -> None:
+        self._stream_reader.open_file.side_effect = self._open_file_side_effect(["header", "a value", "another value"])
+
+        dialects_before = set(csv.list_dialects())
+        records = CsvParser(use_pyarrow=True).parse_records(self._config, self._file, self._stream_reader, Mock(), None)
+        next(records)
+        assert len(set(csv.list_dialects()) - dialects_before) == 1
+        records.close()
+        assert set(csv.list_dialects()) == dialects_before
+
+    def _parse_records(self, parser: CsvParser, data: List[str], schema: Any) -> Tuple[Mock, List[Dict[str, Any]]]:
+        self._stream_reader.open_file.side_effect = self._open_file_side_effect(data)
+        logger = Mock(spec=logging.Logger)
+        return logger, list(parser.parse_records(self._config, self._file, self._stream_reader, logger, schema))
+
+    @staticmethod
+    def _open_file_side_effect(data: List[str]) -> Callable[..., io.StringIO]:
+        # files can be opened again if pyarrow fails to parse them
+        return lambda *args, **kwargs: CsvFileBuilder().with_data(data).build()
+
+
 def test_encoding_is_passed_to_stream_reader() -> None:
     parser = CsvParser()
     encoding = "ascii"
@@ -4,16 +4,19 @@
 
 import asyncio
 import datetime
+import io
 import math
 from typing import Any, Mapping, Union
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, ValidationPolicy
 from airbyte_cdk.sources.file_based.config.jsonl_format import JsonlFormat
 from airbyte_cdk.sources.file_based.config.parquet_format import ParquetFormat
+from airbyte_cdk.sources.file_based.exceptions import RecordParseError
 from airbyte_cdk.sources.file_based.file_types import ParquetParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from pyarrow import Scalar
@@ -173,12 +176,14 @@ def test_type_mapping(parquet_type: pa.DataType, expected_type: Mapping[str, str
 def test_value_transformation(
     pyarrow_type: pa.DataType, parquet_format: ParquetFormat, parquet_object: Scalar, expected_value: Any
 ) -> None:
-    pyarrow_value = pa.array([parquet_object], type=pyarrow_type)[0]
-    py_value = ParquetParser._to_output_value(pyarrow_value, parquet_format)
-    if isinstance(py_value, float):
-        assert math.isclose(py_value, expected_value, abs_tol=0.01)
-    else:
-        assert py_value == expected_value
+    pyarrow_array = pa.array([parquet_object], type=pyarrow_type)
+    py_value = ParquetParser._to_output_value(pyarrow_array[0], parquet_format)
+    [py_value_from_column] = ParquetParser._to_output_values(pyarrow_array, parquet_format)
+    for value in [py_value, py_value_from_column]:
+        if isinstance(value, float):
+            assert math.isclose(value, expected_value, abs_tol=0.01)
+        else:
+            assert value == expected_value
 
 
 def test_value_dictionary() -> None:
@@ -242,6 +247,7 @@ def test_value_dictionary() -> None:
 def test_null_value_does_not_throw(parquet_type, parquet_format) -> None:
     pyarrow_value = pa.scalar(None, type=parquet_type)
     assert ParquetParser._to_output_value(pyarrow_value, parquet_format) is None
+    assert ParquetParser._to_output_values(pa.array([None], type=parquet_type), parquet_format) == [None]
 
 
 @pytest.mark.parametrize(
@@ -272,3 +278,58 @@ def test_wrong_file_format(file_format: Union[CsvFormat, JsonlFormat]) -> None:
     logger = Mock()
     with pytest.raises(ValueError):
         asyncio.get_event_loop().run_until_complete(parser.infer_schema(config, file, stream_reader, logger))
+
+
+def _parquet_file(table: pa.Table, row_group_size: int) -> io.BytesIO:
+    fp = io.BytesIO()
+    pq.write_table(table, fp, row_group_size=row_group_size)
+    fp.seek(0)
+    return fp
+
+
+def _parse_records(fp: io.BytesIO, uri: str = "s3://mybucket/test.parquet"):
+    config = FileBasedStreamConfig(name="test", format=_default_parquet_format, validation_policy=ValidationPolicy.emit_record)
+    file = RemoteFile(uri=uri, last_modified=datetime.datetime.now())
+    stream_reader = Mock()
+    stream_reader.open_file.return_value.__enter__ = Mock(return_value=fp)
+    stream_reader.open_file.return_value.__exit__ = Mock(return_value=None)
+    return ParquetParser().parse_records(config, file, stream_reader, Mock(), None)
+
+
+def test_parse_records_in_batches_smaller_than_row_groups() -> None:
+    table = pa.table(
+        {
+            "id": pa.array(range(10), type=pa.int64()),
+            "created_at": pa.array([datetime.datetime(2023, 1, 1, 0, 0, i) for i in range(10)], type=pa.timestamp("s")),
+            "amount": pa.array([None if i % 3 == 0 else i for i in range(10)], type=pa.decimal128(5, 2)),
+        }
+    )
+
+    with patch.object(ParquetParser, "BATCH_SIZE", 3):
+        records = list(_parse_records(_parquet_file(table, row_group_size=5), uri="s3://mybucket/year=2023/test.parquet"))
+
+    assert records == [
+        {
+            "id": i,
+            "created_at": f"2023-01-01T00:00:{i:02d}",
+            "amount": None if i % 3 == 0 else f"{i}.00",
+            "year": "2023",
+        }
+        for i in range(10)
+    ]
+
+
+def test_parse_records_with_dictionary_column() -> None:
+    dictionary = pa.DictionaryArray.from_arrays(pa.array([0, 1, 0], type=pa.int8()), ["apple", "banana"])
+    table = pa.table({"fruit": dictionary})
+
+    records = list(_parse_records(_parquet_file(table, row_group_size=2)))
+
+    assert records == [{"fruit": "apple"}, {"fruit": "banana"}, {"fruit": "apple"}]
+
+
+def test_given_invalid_value_when_parse_records_then_raise_record_parse_error() -> None:
+    table = pa.table({"value": pa.array([b"valid", b"\xff"], type=pa.binary())})
+
+    with pytest.raises(RecordParseError):
+        list(_parse_records(_parquet_file(table, row_group_size=2)))
@@ -2,6 +2,8 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import tempfile
+import threading
 import traceback
 import unittest
 from datetime import datetime, timezone
@@ -13,7 +15,7 @@ from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level
 from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources.file_based.availability_strategy import AbstractFileBasedAvailabilityStrategy
 from airbyte_cdk.sources.file_based.discovery_policy import AbstractDiscoveryPolicy
-from airbyte_cdk.sources.file_based.exceptions import FileBasedErrorsCollector, FileBasedSourceError
+from airbyte_cdk.sources.file_based.exceptions import FileBasedErrorsCollector, FileBasedSourceError, RecordParseError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader
 from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
@@ -24,7 +26,8 @@ from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
 
 class MockFormat:
-    pass
+    def dict(self) -> Mapping[str, Any]:
+        return {}
 
 
 @pytest.mark.parametrize(
@@ -73,6 +76,7 @@ def test_fill_nulls(input_schema: Mapping[str, Any], expected_output: Mapping[st
 class DefaultFileBasedStreamTest(unittest.TestCase):
     _NOW = datetime(2022, 10, 22, tzinfo=timezone.utc)
     _A_RECORD = {"a_record": 1}
+    _N_PREFETCHED_FILES = 0
 
     def setUp(self) -> None:
         self._stream_config = Mock()
@@ -82,6 +86,8 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
         self._stream_reader = Mock(spec=AbstractFileBasedStreamReader)
         self._availability_strategy = Mock(spec=AbstractFileBasedAvailabilityStrategy)
         self._discovery_policy = Mock(spec=AbstractDiscoveryPolicy)
+        self._discovery_policy.n_schema_inference_workers = 0
+        self._discovery_policy.schema_inference_cache_directory = None
         self._parser = Mock(spec=FileTypeParser)
         self._validation_policy = Mock(spec=AbstractSchemaValidationPolicy)
         self._validation_policy.name = "validation policy name"
@@ -97,6 +103,7 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
             validation_policy=self._validation_policy,
             cursor=self._cursor,
             errors_collector=FileBasedErrorsCollector(),
+            n_prefetched_files=self._N_PREFETCHED_FILES,
         )
 
     def test_when_read_records_from_slice_then_return_records(self) -> None:
@@ -173,6 +180,30 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
         assert messages[0].log.level == Level.ERROR
         assert messages[1].log.level == Level.WARN
 
+    def test_given_many_files_when_read_records_from_slice_then_return_records_in_order_and_add_each_file_to_cursor(self) -> None:
+        files = [RemoteFile(uri=f"file{i}", last_modified=self._NOW) for i in range(10)]
+        self._parser.parse_records.side_effect = lambda config, file, stream_reader, logger, schema: [{"uri": file.uri}, {"uri": file.uri}]
+
+        messages = list(self._stream.read_records_from_slice({"files": files}))
+
+        assert [message.record.data["data"]["uri"] for message in messages] == [file.uri for file in files for _ in range(2)]
+        assert [call.args[0] for call in self._cursor.add_file.call_args_list] == files
+
+    def test_given_parse_error_when_read_records_from_slice_then_collect_error_and_process_other_files(self) -> None:
+        self._parser.parse_records.side_effect = [
+            self._iter([self._A_RECORD, RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD)]),
+            [self._A_RECORD],
+        ]
+        files = [RemoteFile(uri="invalid_file", last_modified=self._NOW), RemoteFile(uri="valid_file", last_modified=self._NOW)]
+        self._stream.errors_collector = Mock(spec=FileBasedErrorsCollector)
+
+        messages = list(self._stream.read_records_from_slice({"files": files}))
+
+        assert len(messages) == 2
+        assert [call.args[0] for call in self._cursor.add_file.call_args_list] == [files[1]]
+        error = self._stream.errors_collector.collect.call_args.args[0]
+        assert "file=invalid_file line_no=2" in error.log.message
+
     def test_override_max_n_files_for_schema_inference_is_respected(self) -> None:
         self._discovery_policy.n_concurrent_requests = 1
         self._discovery_policy.get_max_n_files_for_schema_inference.return_value = 3
@@ -194,6 +225,58 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
         }
         assert self._parser.infer_schema.call_count == 3
 
+    def test_given_schema_inference_workers_when_infer_schema_then_infer_in_worker_threads_and_merge_schemas(self) -> None:
+        self._discovery_policy.n_concurrent_requests = 10
+        self._discovery_policy.n_schema_inference_workers = 2
+        threads = set()
+
+        async def infer_schema(config: Any, file: RemoteFile, stream_reader: Any, logger: Any) -> Mapping[str, Any]:
+            threads.add(threading.current_thread().name)
+            return {file.uri: {"type": "string"}}
+
+        self._parser.infer_schema.side_effect = infer_schema
+        files = [RemoteFile(uri=f"file{i}", last_modified=self._NOW) for i in range(5)]
+
+        schema = self._stream.infer_schema(files)
+
+        assert schema == {file.uri: {"type": ["null", "string"]} for file in files}
+        assert threads and all(thread.startswith("schema_inference") for thread in threads)
+
+    def test_given_cache_directory_when_infer_schema_twice_then_only_infer_changed_files(self) -> None:
+        self._discovery_policy.n_concurrent_requests = 10
+        self._parser.infer_schema.side_effect = self._infer_schema_from_uri
+        files = [RemoteFile(uri=f"file{i}", last_modified=self._NOW) for i in range(3)]
+
+        with tempfile.TemporaryDirectory() as cache_directory:
+            self._discovery_policy.schema_inference_cache_directory = cache_directory
+            first_schema = self._stream.infer_schema(files)
+            files[0] = RemoteFile(uri="file0", last_modified=datetime(2023, 1, 1, tzinfo=timezone.utc))
+            files[1] = RemoteFile(uri="file1", last_modified=self._NOW, etag="a new etag")
+            second_schema = self._stream.infer_schema(files)
+
+        assert first_schema == second_schema
+        assert [call.args[1] for call in self._parser.infer_schema.call_args_list] == [
+            RemoteFile(uri="file0", last_modified=self._NOW),
+            RemoteFile(uri="file1", last_modified=self._NOW),
+            RemoteFile(uri="file2", last_modified=self._NOW),
+            files[0],
+            files[1],
+        ]
+
+    def test_given_cache_directory_and_inference_error_when_infer_schema_then_do_not_cache(self) -> None:
+        self._discovery_policy.n_concurrent_requests = 10
+        self._parser.infer_schema.side_effect = [ValueError("an error"), {"file": {"type": "string"}}]
+        files = [RemoteFile(uri="file", last_modified=self._NOW)]
+
+        with tempfile.TemporaryDirectory() as cache_directory:
+            self._discovery_policy.schema_inference_cache_directory = cache_directory
+            assert self._stream.infer_schema(files) == {}
+            assert self._stream.infer_schema(files) == {"file": {"type": ["null", "string"]}}
+
+    @staticmethod
+    async def _infer_schema_from_uri(config: Any, file: RemoteFile, stream_reader: Any, logger: Any) -> Mapping[str, Any]:
+        return {file.uri: {"type": "string"}}
+
     def _iter(self, x: Iterable[Any]) -> Iterator[Any]:
         for item in x:
             if isinstance(item, Exception):
@@ -201,6 +284,10 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
             yield item
 
 
+class PrefetchingDefaultFileBasedStreamTest(DefaultFileBasedStreamTest):
+    _N_PREFETCHED_FILES = 2
+
+
 class TestFileBasedErrorCollector:
     test_error_collector: FileBasedErrorsCollector = FileBasedErrorsCollector()
 
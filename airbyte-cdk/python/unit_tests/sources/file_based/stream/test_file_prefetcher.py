@@ -0,0 +1,105 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List
+
+import pytest
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.stream.file_prefetcher import FilePrefetcher
+
+_NOW = datetime(2023, 1, 1)
+_TIMEOUT_IN_SECONDS = 5
+
+
+def _files(n: int) -> List[RemoteFile]:
+    return [RemoteFile(uri=f"file{i}", last_modified=_NOW) for i in range(n)]
+
+
+def _read_all(prefetcher: FilePrefetcher, files: List[RemoteFile], parse_file: Any) -> Dict[str, List[Any]]:
+    return {file.uri: list(records) for file, records in prefetcher.read(files, parse_file)}
+
+
+def test_given_files_when_read_then_return_records_of_each_file_in_order() -> None:
+    files = _files(5)
+
+    records_by_uri = _read_all(
+        FilePrefetcher(2, max_buffered_records_per_file=3), files, lambda file: ({"uri": file.uri, "i": i} for i in range(10))
+    )
+
+    assert list(records_by_uri.keys()) == [file.uri for file in files]
+    for file in files:
+        assert records_by_uri[file.uri] == [{"uri": file.uri, "i": i} for i in range(10)]
+
+
+def test_given_n_prefetched_files_when_read_then_parse_next_files_while_first_file_is_consumed() -> None:
+    files = _files(4)
+    # the first file can only be parsed once the two next ones have started
+    barrier = threading.Barrier(3, timeout=_TIMEOUT_IN_SECONDS)
+
+    def parse_file(file: RemoteFile) -> Iterable[Dict[str, Any]]:
+        if file.uri != "file3":
+            barrier.wait()
+        yield {"uri": file.uri}
+
+    records_by_uri = _read_all(FilePrefetcher(2), files, parse_file)
+
+    assert list(records_by_uri.keys()) == [file.uri for file in files]
+
+
+def test_given_parser_raises_when_read_then_raise_after_the_records_parsed_before_the_error() -> None:
+    def parse_file(file: RemoteFile) -> Iterable[Dict[str, Any]]:
+        yield {"uri": file.uri}
+        if file.uri == "file0":
+            raise ValueError("an error")
+
+    files_and_records = FilePrefetcher(1).read(_files(2), parse_file)
+    file, records = next(files_and_records)
+    records_iterator = iter(records)
+
+    assert next(records_iterator) == {"uri": "file0"}
+    with pytest.raises(ValueError):
+        next(records_iterator)
+    file, records = next(files_and_records)
+    assert list(records) == [{"uri": "file1"}]
+
+
+def test_given_parser_raises_on_open_when_read_then_raise_when_iterating_over_records() -> None:
+    def parse_file(file: RemoteFile) -> Iterable[Dict[str, Any]]:
+        raise ValueError("an error")
+
+    files_and_records = FilePrefetcher(1).read(_files(1), parse_file)
+    file, records = next(files_and_records)
+
+    with pytest.raises(ValueError):
+        list(records)
+
+
+def test_given_generator_closed_when_read_then_stop_parsing_files() -> None:
+    parsers_closed = threading.Semaphore(0)
+
+    def parse_file(file: RemoteFile) -> Iterable[Dict[str, Any]]:
+        try:
+            while True:
+                yield {"uri": file.uri}
+        finally:
+            parsers_closed.release()
+
+    files_and_records = FilePrefetcher(2, max_buffered_records_per_file=1).read(_files(3), parse_file)
+    file, records = next(files_and_records)
+    next(iter(records))
+    files_and_records.close()
+
+    for _ in range(3):
+        assert parsers_closed.acquire(timeout=_TIMEOUT_IN_SECONDS)
+
+
+def test_given_no_files_when_read_then_return_nothing() -> None:
+    assert list(FilePrefetcher(2).read([], lambda file: [])) == []
+
+
+def test_given_no_prefetched_files_when_create_then_raise() -> None:
+    with pytest.raises(ValueError):
+        FilePrefetcher(0)
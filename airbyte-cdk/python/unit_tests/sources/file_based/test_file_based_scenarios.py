@@ -2,12 +2,16 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+from copy import copy
 from pathlib import PosixPath
 
 import pytest
 from _pytest.capture import CaptureFixture
 from airbyte_cdk.sources.abstract_source import AbstractSource
+from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat
+from airbyte_cdk.sources.file_based.file_types import CsvParser
 from freezegun import freeze_time
+from unit_tests.sources.file_based.in_memory_files_source import InMemoryFilesSource
 from unit_tests.sources.file_based.scenarios.avro_scenarios import (
     avro_all_types_scenario,
     avro_file_with_double_as_number_scenario,
@@ -277,6 +281,36 @@ read_scenarios = discover_success_scenarios + [
     wait_for_rediscovery_scenario_single_stream,
 ]
 
+
+def _with_pyarrow_csv_parser(scenario: TestScenario[InMemoryFilesSource]) -> TestScenario[InMemoryFilesSource]:
+    """
+    Copies the scenario with a source reading csv files using pyarrow. Sources can only be read once so a new one is created.
+    """
+    source = scenario.source
+    pyarrow_scenario = copy(scenario)
+    pyarrow_scenario.source = InMemoryFilesSource(
+        source.files,
+        source.file_type,
+        source.availability_strategy,
+        source.discovery_policy,
+        source.validation_policies,
+        {**source.parsers, CsvFormat: CsvParser(use_pyarrow=True)},
+        source.stream_reader,
+        source.catalog.dict(exclude_unset=True) if source.catalog else None,
+        source.config,
+        source.state,
+        {},
+        source.cursor_cls,
+    )
+    return pyarrow_scenario
+
+
+pyarrow_csv_read_scenarios = [
+    _with_pyarrow_csv_parser(scenario)
+    for scenario in read_scenarios
+    if isinstance(scenario.source, InMemoryFilesSource) and scenario.source.file_type == "csv"
+]
+
 spec_scenarios = [
     single_csv_scenario,
 ]
@@ -310,6 +344,12 @@ def test_file_based_read(scenario: TestScenario[AbstractSource]) -> None:
     verify_read(scenario)
 
 
+@pytest.mark.parametrize("scenario", pyarrow_csv_read_scenarios, ids=[s.name for s in pyarrow_csv_read_scenarios])
+@freeze_time("2023-06-09T00:00:00Z")
+def test_file_based_read_with_pyarrow_csv_parser(scenario: TestScenario[AbstractSource]) -> None:
+    verify_read(scenario)
+
+
 @pytest.mark.parametrize("scenario", spec_scenarios, ids=[c.name for c in spec_scenarios])
 def test_file_based_spec(capsys: CaptureFixture[str], scenario: TestScenario[AbstractSource]) -> None:
     verify_spec(capsys, scenario)
@@ -0,0 +1,70 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import os
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from airbyte_cdk.sources.file_based.file_schema_cache import FileSchemaCache
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+
+_A_FILE = RemoteFile(uri="a/file.csv", last_modified=datetime(2023, 1, 1), etag="an etag")
+_A_PARSING_KEY = "CsvParser:{}"
+_A_SCHEMA = {"col1": {"type": "string"}}
+
+
+def test_given_schema_set_when_get_then_return_schema(tmp_path: Path) -> None:
+    cache = FileSchemaCache(str(tmp_path))
+    cache.set(_A_FILE, _A_PARSING_KEY, _A_SCHEMA)
+
+    assert FileSchemaCache(str(tmp_path)).get(_A_FILE, _A_PARSING_KEY) == _A_SCHEMA
+
+
+@pytest.mark.parametrize(
+    "file, parsing_key",
+    [
+        pytest.param(
+            RemoteFile(uri="another/file.csv", last_modified=_A_FILE.last_modified, etag=_A_FILE.etag), _A_PARSING_KEY, id="other-uri"
+        ),
+        pytest.param(
+            RemoteFile(uri=_A_FILE.uri, last_modified=datetime(2023, 1, 2), etag=_A_FILE.etag), _A_PARSING_KEY, id="modified-file"
+        ),
+        pytest.param(
+            RemoteFile(uri=_A_FILE.uri, last_modified=_A_FILE.last_modified, etag="another etag"), _A_PARSING_KEY, id="other-etag"
+        ),
+        pytest.param(_A_FILE, 'CsvParser:{"delimiter": ";"}', id="other-parsing-key"),
+    ],
+)
+def test_given_file_or_parsing_changed_when_get_then_return_none(tmp_path: Path, file: RemoteFile, parsing_key: str) -> None:
+    cache = FileSchemaCache(str(tmp_path))
+    cache.set(_A_FILE, _A_PARSING_KEY, _A_SCHEMA)
+
+    assert cache.get(file, parsing_key) is None
+
+
+def test_given_cdk_version_changed_when_get_then_return_none(tmp_path: Path) -> None:
+    with patch("airbyte_cdk.utils.json_file_cache.metadata.version", return_value="0.1.0"):
+        FileSchemaCache(str(tmp_path)).set(_A_FILE, _A_PARSING_KEY, _A_SCHEMA)
+
+    with patch("airbyte_cdk.utils.json_file_cache.metadata.version", return_value="0.2.0"):
+        assert FileSchemaCache(str(tmp_path)).get(_A_FILE, _A_PARSING_KEY) is None
+
+
+def test_given_corrupted_entry_when_get_then_return_none(tmp_path: Path) -> None:
+    cache = FileSchemaCache(str(tmp_path))
+    cache.set(_A_FILE, _A_PARSING_KEY, _A_SCHEMA)
+    [entry] = os.listdir(tmp_path)
+    (tmp_path / entry).write_text("{not json")
+
+    assert cache.get(_A_FILE, _A_PARSING_KEY) is None
+
+
+def test_given_missing_directory_when_create_then_create_directory(tmp_path: Path) -> None:
+    directory = tmp_path / "schemas"
+
+    FileSchemaCache(str(directory)).set(_A_FILE, _A_PARSING_KEY, _A_SCHEMA)
+
+    assert len(os.listdir(directory)) == 1
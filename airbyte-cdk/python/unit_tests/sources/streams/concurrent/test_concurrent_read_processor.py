@@ -332,6 +332,50 @@ class TestConcurrentReadProcessor(unittest.TestCase):
         ]
         assert expected_messages == messages
 
+    @freezegun.freeze_time("2020-01-01T00:00:00")
+    def test_on_records_emits_status_message_once_and_repository_messages_after_the_batch(self):
+        log_message = AirbyteMessage(
+            type=MessageType.LOG, log=AirbyteLogMessage(level=LogLevel.INFO, message="message emitted from the repository")
+        )
+        self._message_repository.consume_queue.return_value = [log_message]
+
+        handler = ConcurrentReadProcessor(
+            [self._stream],
+            self._partition_enqueuer,
+            self._thread_pool_manager,
+            self._logger,
+            self._slice_logger,
+            self._message_repository,
+            self._partition_reader,
+        )
+
+        messages = list(handler.on_records([self._record, self._record]))
+
+        record_message = AirbyteMessage(
+            type=MessageType.RECORD,
+            record=AirbyteRecordMessage(
+                stream=_STREAM_NAME,
+                data=self._record_data,
+                emitted_at=1577836800000,
+            ),
+        )
+        assert messages == [
+            AirbyteMessage(
+                type=MessageType.TRACE,
+                trace=AirbyteTraceMessage(
+                    type=TraceType.STREAM_STATUS,
+                    emitted_at=1577836800000.0,
+                    stream_status=AirbyteStreamStatusTraceMessage(
+                        stream_descriptor=StreamDescriptor(name=_STREAM_NAME), status=AirbyteStreamStatus(AirbyteStreamStatus.RUNNING)
+                    ),
+                ),
+            ),
+            record_message,
+            record_message,
+            log_message,
+        ]
+        assert handler._record_counter[_STREAM_NAME] == 2
+
     @freezegun.freeze_time("2020-01-01T00:00:00")
     def test_on_record_with_repository_messge(self):
         stream_instances_to_read_from = [self._stream]
@@ -1,9 +1,9 @@
 #
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
-from typing import Any, Mapping, Optional
+from typing import Any, List, Mapping, Optional
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
@@ -40,6 +40,9 @@ class ConcurrentCursorTest(TestCase):
         self._message_repository = Mock(spec=MessageRepository)
         self._state_manager = Mock(spec=ConnectorStateManager)
         self._state_converter = EpochValueConcurrentStreamStateConverter()
+        # the legacy state is updated in place so a copy of the state is recorded every time it is updated
+        self._updated_states: List[Mapping[str, Any]] = []
+        self._state_manager.update_state_for_stream.side_effect = lambda name, namespace, state: self._updated_states.append(dict(state))
 
     def _cursor_with_slice_boundary_fields(self) -> ConcurrentCursor:
         return ConcurrentCursor(
@@ -54,6 +57,23 @@ class ConcurrentCursorTest(TestCase):
             None,
         )
 
+    def _cursor_with_throttled_state_emission(
+        self, partition_interval: int, time_interval_in_seconds: Optional[float] = None
+    ) -> ConcurrentCursor:
+        return ConcurrentCursor(
+            _A_STREAM_NAME,
+            _A_STREAM_NAMESPACE,
+            {},
+            self._message_repository,
+            self._state_manager,
+            self._state_converter,
+            CursorField(_A_CURSOR_FIELD_KEY),
+            _SLICE_BOUNDARY_FIELDS,
+            None,
+            state_emission_partition_interval=partition_interval,
+            state_emission_time_interval_in_seconds=time_interval_in_seconds,
+        )
+
     def _cursor_without_slice_boundary_fields(self) -> ConcurrentCursor:
         return ConcurrentCursor(
             _A_STREAM_NAME,
@@ -137,3 +157,54 @@ class ConcurrentCursorTest(TestCase):
         cursor = self._cursor_with_slice_boundary_fields()
         with pytest.raises(KeyError):
             cursor.close_partition(_partition({"not_matching_key": "value"}))
+
+    def test_given_partitions_closed_out_of_order_when_close_partition_then_state_is_lowest_contiguous_value(self) -> None:
+        cursor = self._cursor_with_slice_boundary_fields()
+
+        for lower, upper in [(0, 10), (21, 30), (11, 20)]:
+            cursor.close_partition(_partition({_LOWER_SLICE_BOUNDARY_FIELD: lower, _UPPER_SLICE_BOUNDARY_FIELD: upper}))
+
+        assert self._updated_states == [
+            {_A_CURSOR_FIELD_KEY: 10},
+            {_A_CURSOR_FIELD_KEY: 10},
+            {_A_CURSOR_FIELD_KEY: 30},
+        ]
+        assert cursor.state["slices"] == [
+            {"start": self._state_converter.parse_timestamp(0), "end": self._state_converter.parse_timestamp(30)}
+        ]
+
+    def test_given_partition_interval_when_close_partitions_then_emit_state_on_first_advance_and_every_interval(self) -> None:
+        cursor = self._cursor_with_throttled_state_emission(partition_interval=3)
+
+        for lower in range(0, 70, 10):
+            cursor.close_partition(_partition({_LOWER_SLICE_BOUNDARY_FIELD: lower, _UPPER_SLICE_BOUNDARY_FIELD: lower + 9}))
+
+        assert self._updated_states == [
+            {_A_CURSOR_FIELD_KEY: 9},
+            {_A_CURSOR_FIELD_KEY: 39},
+            {_A_CURSOR_FIELD_KEY: 69},
+        ]
+
+    def test_given_partition_interval_when_ensure_at_least_one_state_emitted_then_emit_latest_state(self) -> None:
+        cursor = self._cursor_with_throttled_state_emission(partition_interval=100)
+        for lower in range(0, 50, 10):
+            cursor.close_partition(_partition({_LOWER_SLICE_BOUNDARY_FIELD: lower, _UPPER_SLICE_BOUNDARY_FIELD: lower + 9}))
+
+        cursor.ensure_at_least_one_state_emitted()
+
+        assert self._updated_states[-1] == {_A_CURSOR_FIELD_KEY: 49}
+        assert self._message_repository.emit_message.call_count == 2
+
+    @patch("airbyte_cdk.sources.streams.concurrent.cursor.time")
+    def test_given_time_interval_when_close_partitions_then_emit_state_once_interval_elapsed(self, time_mock: Mock) -> None:
+        time_mock.monotonic.return_value = 0
+        cursor = self._cursor_with_throttled_state_emission(partition_interval=100, time_interval_in_seconds=60)
+
+        for lower, now in [(0, 1), (10, 30), (20, 59), (30, 61), (40, 62)]:
+            time_mock.monotonic.return_value = now
+            cursor.close_partition(_partition({_LOWER_SLICE_BOUNDARY_FIELD: lower, _UPPER_SLICE_BOUNDARY_FIELD: lower + 9}))
+
+        assert self._updated_states == [
+            {_A_CURSOR_FIELD_KEY: 9},
+            {_A_CURSOR_FIELD_KEY: 39},
+        ]
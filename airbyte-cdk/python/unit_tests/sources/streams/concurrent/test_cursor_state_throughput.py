@@ -0,0 +1,101 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+import random
+import time
+from typing import Any, Iterable, List, Mapping, Optional
+
+import pytest
+from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
+from airbyte_cdk.sources.message import InMemoryMessageRepository
+from airbyte_cdk.sources.streams.concurrent.cursor import ConcurrentCursor, CursorField
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.concurrent.state_converters.datetime_stream_state_converter import EpochValueConcurrentStreamStateConverter
+from airbyte_cdk.test.benchmark import benchmark, log_measure
+
+# Benchmark of the time spent by the ConcurrentCursor to close partitions and to emit state depending on the order in which partitions are
+# closed and on how often state is emitted
+
+_STREAM_NAME = "stream"
+_NUMBER_OF_PARTITIONS = 100_000
+_PARTITION_SIZE_IN_SECONDS = 3600
+_SHUFFLE_WINDOW = 100
+
+
+class _SlicePartition(Partition):
+    def __init__(self, lower: int) -> None:
+        self._slice = {"start": lower, "end": lower + _PARTITION_SIZE_IN_SECONDS - 1}
+
+    def read(self) -> Iterable[Record]:
+        return []
+
+    def to_slice(self) -> Optional[Mapping[str, Any]]:
+        return self._slice
+
+    def stream_name(self) -> str:
+        return _STREAM_NAME
+
+    def close(self) -> None:
+        pass
+
+    def is_closed(self) -> bool:
+        return True
+
+    def __hash__(self) -> int:
+        return hash(self._slice["start"])
+
+
+def _order_partitions(partitions: List[Partition], order: str) -> List[Partition]:
+    if order == "shuffled":
+        # partitions are not closed in order when they are read concurrently. Shuffling within windows simulates a pool of workers
+        randomizer = random.Random(42)
+        windows = [partitions[start : start + _SHUFFLE_WINDOW] for start in range(0, len(partitions), _SHUFFLE_WINDOW)]
+        for window in windows:
+            randomizer.shuffle(window)
+        return [partition for window in windows for partition in window]
+    if order == "first_partition_last":
+        # a slow first partition leaves a gap at the start of the state until the end of the sync
+        return partitions[1:] + partitions[:1]
+    raise ValueError(f"Unknown order {order}")
+
+
+@benchmark
+@pytest.mark.parametrize(
+    "order, state_emission_partition_interval",
+    [
+        pytest.param("shuffled", 1, id="shuffled-state-every-partition"),
+        pytest.param("shuffled", 1_000, id="shuffled-state-every-1000-partitions"),
+        pytest.param("first_partition_last", 1_000, id="first-partition-last-state-every-1000-partitions"),
+    ],
+)
+def test_close_partitions_throughput(order: str, state_emission_partition_interval: int) -> None:
+    message_repository = InMemoryMessageRepository()
+    cursor = ConcurrentCursor(
+        _STREAM_NAME,
+        None,
+        {},
+        message_repository,
+        ConnectorStateManager(stream_instance_map={}),
+        EpochValueConcurrentStreamStateConverter(),
+        CursorField("updated_at"),
+        ("start", "end"),
+        None,
+        state_emission_partition_interval=state_emission_partition_interval,
+    )
+    partitions = _order_partitions([_SlicePartition(i * _PARTITION_SIZE_IN_SECONDS) for i in range(_NUMBER_OF_PARTITIONS)], order)
+
+    number_of_states = 0
+    start = time.perf_counter()
+    for partition in partitions:
+        cursor.close_partition(partition)
+        number_of_states += sum(1 for _ in message_repository.consume_queue())
+    cursor.ensure_at_least_one_state_emitted()
+    elapsed = time.perf_counter() - start
+    number_of_states += sum(1 for _ in message_repository.consume_queue())
+
+    assert len(cursor.state["slices"]) == 1
+    log_measure(
+        f"{order} partitions, state every {state_emission_partition_interval} partitions: "
+        f"{_NUMBER_OF_PARTITIONS / elapsed:.0f} partitions/sec ({elapsed:.2f}s, {number_of_states} states)"
+    )
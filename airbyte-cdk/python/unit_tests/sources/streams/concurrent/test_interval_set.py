@@ -0,0 +1,57 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+import random
+from typing import List, Tuple
+
+import pytest
+from airbyte_cdk.sources.streams.concurrent.state_converters.datetime_stream_state_converter import EpochValueConcurrentStreamStateConverter
+
+_CONVERTER = EpochValueConcurrentStreamStateConverter()
+
+
+def _intervals(boundaries: List[Tuple[int, int]]) -> List[dict]:
+    return [{"start": _CONVERTER.parse_timestamp(start), "end": _CONVERTER.parse_timestamp(end)} for start, end in boundaries]
+
+
+@pytest.mark.parametrize(
+    "initial_intervals, added_interval, expected_intervals",
+    [
+        pytest.param([], (0, 10), [(0, 10)], id="empty-set"),
+        pytest.param([(0, 10)], (11, 20), [(0, 20)], id="adjacent-after"),
+        pytest.param([(11, 20)], (0, 10), [(0, 20)], id="adjacent-before"),
+        pytest.param([(0, 10)], (12, 20), [(0, 10), (12, 20)], id="gap-after"),
+        pytest.param([(12, 20)], (0, 10), [(0, 10), (12, 20)], id="gap-before"),
+        pytest.param([(0, 10), (21, 30)], (11, 20), [(0, 30)], id="fills-gap"),
+        pytest.param([(0, 10), (15, 20), (25, 30), (40, 50)], (5, 27), [(0, 30), (40, 50)], id="covers-several-intervals"),
+        pytest.param([(0, 30)], (5, 10), [(0, 30)], id="contained"),
+        pytest.param([(5, 10)], (5, 30), [(5, 30)], id="same-start"),
+        pytest.param([(0, 10), (20, 30)], (14, 16), [(0, 10), (14, 16), (20, 30)], id="between-intervals"),
+    ],
+)
+def test_add_interval(initial_intervals, added_interval, expected_intervals):
+    interval_set = _CONVERTER.create_interval_set(_intervals(initial_intervals))
+
+    interval_set.add(_intervals([added_interval])[0])
+
+    assert interval_set.intervals == _intervals(expected_intervals)
+
+
+def test_given_unmerged_intervals_when_create_interval_set_then_merge_intervals():
+    interval_set = _CONVERTER.create_interval_set(_intervals([(20, 30), (0, 10), (11, 15)]))
+
+    assert interval_set.intervals == _intervals([(0, 15), (20, 30)])
+
+
+def test_given_random_intervals_when_add_then_intervals_match_merge_intervals():
+    randomizer = random.Random(42)
+    interval_set = _CONVERTER.create_interval_set([])
+    added_intervals = []
+
+    for _ in range(200):
+        start = randomizer.randint(0, 2_000)
+        boundaries = (start, start + randomizer.randint(0, 20))
+        interval_set.add(_intervals([boundaries])[0])
+        added_intervals.append(boundaries)
+
+        assert interval_set.intervals == _CONVERTER.merge_intervals(_intervals(added_intervals))
@@ -53,6 +53,31 @@ class PartitionReaderTest(unittest.TestCase):
             assert self._queue.get() == _RECORDS[i]
         assert self._queue.get() == exception
 
+    def test_given_batch_size_when_process_partition_then_queue_batches_of_records(self):
+        partition_reader = PartitionReader(self._queue, batch_size=2)
+        records = _RECORDS + [Record({"id": 3, "name": "Jane"}, "stream")]
+
+        partition_reader.process_partition(self._a_partition(records))
+
+        assert self._queue.get() == records[:2]
+        assert self._queue.get() == records[2:]
+        assert isinstance(self._queue.get(), PartitionCompleteSentinel)
+
+    def test_given_batch_size_and_exception_when_process_partition_then_queue_pending_batch_before_exception(self):
+        partition_reader = PartitionReader(self._queue, batch_size=10)
+        partition = Mock()
+        exception = ValueError()
+        partition.read.side_effect = self._read_with_exception(_RECORDS, exception)
+
+        partition_reader.process_partition(partition)
+
+        assert self._queue.get() == _RECORDS
+        assert self._queue.get() == exception
+
+    def test_given_batch_size_lower_than_one_then_raise(self):
+        with pytest.raises(ValueError):
+            PartitionReader(self._queue, batch_size=0)
+
     def _a_partition(self, records: List[Record]) -> Partition:
         partition = Mock(spec=Partition)
         partition.read.return_value = iter(records)
@@ -0,0 +1,202 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterable, List, Mapping, Optional
+
+import pytest
+import requests
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.http import HttpStream
+from airbyte_cdk.sources.streams.http.async_transport import AsyncHttpTransport
+
+_RESPONSE_DELAY_IN_SECONDS = 0.2
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    Echoes the request. The path selects the behavior: `/slow` waits before responding and `/rate_limited` responds with a 429 status code
+    to the first request
+    """
+
+    rate_limited_requests: List[str] = []
+
+    def do_GET(self) -> None:
+        self._respond()
+
+    def do_POST(self) -> None:
+        self._respond()
+
+    def _respond(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode("utf-8")
+        if self.path.startswith("/slow"):
+            time.sleep(_RESPONSE_DELAY_IN_SECONDS)
+        if self.path.startswith("/rate_limited") and self.path not in self.rate_limited_requests:
+            self.rate_limited_requests.append(self.path)
+            self._send(429, {"error": "rate limited"})
+            return
+        self._send(200, {"method": self.command, "path": self.path, "body": body, "header": self.headers.get("X-Custom-Header")})
+
+    def _send(self, status: int, payload: Mapping[str, Any]) -> None:
+        content = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture(name="server_url")
+def server_url_fixture() -> Iterable[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(name="transport")
+def transport_fixture() -> Iterable[AsyncHttpTransport]:
+    transport = AsyncHttpTransport(max_connections_per_host=50)
+    yield transport
+    transport.close()
+
+
+def _prepare(method: str, url: str, **kwargs: Any) -> requests.PreparedRequest:
+    return requests.Request(method, url, **kwargs).prepare()
+
+
+def test_given_request_when_send_then_return_requests_response(server_url, transport):
+    response = transport.send(_prepare("POST", f"{server_url}/echo", json={"a": 1}, headers={"X-Custom-Header": "value"}))
+
+    assert isinstance(response, requests.Response)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json; charset=utf-8"
+    assert response.encoding == "utf-8"
+    assert response.url == f"{server_url}/echo"
+    assert response.json() == {"method": "POST", "path": "/echo", "body": '{"a": 1}', "header": "value"}
+
+
+def test_given_requests_sent_from_many_threads_when_send_then_requests_are_in_flight_concurrently(server_url, transport):
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        responses = list(executor.map(lambda i: transport.send(_prepare("GET", f"{server_url}/slow/{i}")), range(20)))
+    paths = [response.json()["path"] for response in responses]
+
+    assert paths == [f"/slow/{i}" for i in range(20)]
+    assert time.monotonic() - start < 10 * _RESPONSE_DELAY_IN_SECONDS
+
+
+def test_given_max_connections_per_host_when_send_then_limit_requests_in_flight(server_url):
+    transport = AsyncHttpTransport(max_connections_per_host=2)
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        list(executor.map(lambda i: transport.send(_prepare("GET", f"{server_url}/slow/{i}")), range(6)))
+    transport.close()
+
+    assert time.monotonic() - start >= 3 * _RESPONSE_DELAY_IN_SECONDS
+
+
+def test_given_stream_when_send_then_read_content_as_it_is_consumed(server_url, transport):
+    session = requests.Session()
+    transport.mount(session)
+
+    response = session.send(_prepare("POST", f"{server_url}/echo", data="a" * 100_000), stream=True)
+
+    assert not response._content_consumed
+    first_chunk = response.raw.read(10)
+    assert first_chunk == b'{"method":'
+    content = first_chunk + b"".join(response.iter_content(chunk_size=1024))
+    assert json.loads(content)["body"] == "a" * 100_000
+    response.close()
+
+
+def test_given_stream_when_close_before_content_is_read_then_release_connection(server_url):
+    transport = AsyncHttpTransport(max_connections_per_host=1)
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    try:
+        for _ in range(3):
+            # the content is large enough not to be received entirely before the response is closed. The single connection would never be
+            # available again if closing the response did not release it
+            request = _prepare("POST", f"{server_url}/echo", data="a" * 1_000_000)
+            response = executor.submit(transport.send, request, stream=True).result(timeout=5)
+            response.close()
+
+        assert executor.submit(transport.send, _prepare("GET", f"{server_url}/echo")).result(timeout=5).json()["path"] == "/echo"
+    finally:
+        # closing the transport cancels the requests waiting for a connection
+        transport.close()
+        executor.shutdown()
+
+
+def test_given_closed_transport_when_send_then_raise_error(server_url):
+    transport = AsyncHttpTransport()
+    transport.send(_prepare("GET", f"{server_url}/echo"))
+    transport.close()
+
+    with pytest.raises(RuntimeError):
+        transport.send(_prepare("GET", f"{server_url}/echo"))
+
+
+def test_given_closed_transport_when_read_streamed_content_then_raise_error(server_url):
+    transport = AsyncHttpTransport()
+    response = transport.send(_prepare("POST", f"{server_url}/echo", data="a" * 100_000), stream=True)
+    transport.close()
+
+    with pytest.raises(RuntimeError):
+        response.raw.read(10)
+
+
+def test_given_read_timeout_when_send_then_raise_read_timeout(server_url, transport):
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        transport.send(_prepare("GET", f"{server_url}/slow"), timeout=_RESPONSE_DELAY_IN_SECONDS / 4)
+
+
+def test_given_server_unreachable_when_send_then_raise_connection_error(transport):
+    with socket.socket() as unused_socket:
+        unused_socket.bind(("127.0.0.1", 0))
+        port = unused_socket.getsockname()[1]
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        transport.send(_prepare("GET", f"http://127.0.0.1:{port}/"))
+
+
+class StubHttpStream(HttpStream):
+    primary_key = "id"
+    url_base = ""
+
+    def __init__(self, url: str, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._url = url
+
+    def path(self, **kwargs: Any) -> str:
+        return self._url
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        return None
+
+    def parse_response(self, response: requests.Response, **kwargs: Any) -> Iterable[Mapping[str, Any]]:
+        yield response.json()
+
+    def backoff_time(self, response: requests.Response) -> Optional[float]:
+        return 0.01
+
+
+def test_given_http_transport_when_read_records_then_send_requests_through_transport_with_retries(server_url, transport):
+    stream = StubHttpStream(f"{server_url}/rate_limited/stream", http_transport=transport)
+
+    records = list(stream.read_records(SyncMode.full_refresh))
+
+    assert records == [{"method": "GET", "path": "/rate_limited/stream", "body": "", "header": None}]
+    assert _Handler.rate_limited_requests == ["/rate_limited/stream"]
@@ -1,14 +1,17 @@
 #
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
+import json
 import os
 import tempfile
+import threading
 import time
 from datetime import datetime, timedelta
 from typing import Iterable, Mapping
 
 import pytest
-from airbyte_cdk.models import SyncMode
+from airbyte_cdk.models import SyncMode, Type
+from airbyte_cdk.sources.message import InMemoryMessageRepository
 from airbyte_cdk.sources.streams.call_rate import (
     APIBudget,
     CallRateLimitHit,
@@ -16,6 +19,7 @@ from airbyte_cdk.sources.streams.call_rate import (
     HttpRequestMatcher,
     MovingWindowCallRatePolicy,
     Rate,
+    TokenBucketCallRatePolicy,
     UnlimitedCallRatePolicy,
 )
 from airbyte_cdk.sources.streams.http import HttpStream
@@ -246,6 +250,110 @@ class TestMovingWindowCallRatePolicy:
         assert str(excinfo.value) == "Bucket for item=call with Rate limit=2/1.0h is already full"
 
 
+class TestTokenBucketCallRatePolicy:
+    def test_limit_rate(self):
+        policy = TokenBucketCallRatePolicy(rate=Rate(10, timedelta(minutes=1)), matchers=[])
+
+        for i in range(10):
+            policy.try_acquire("call", weight=1), f"{i + 1} call"
+
+        with pytest.raises(CallRateLimitHit) as excinfo:
+            policy.try_acquire("call", weight=1), "call over limit"
+        assert excinfo.value.time_to_wait.total_seconds() == pytest.approx(6, 0.1), "credits are refilled at 1 call per 6 seconds"
+
+    def test_weight_exceeds_limit(self):
+        policy = TokenBucketCallRatePolicy(rate=Rate(10, timedelta(minutes=1)), matchers=[])
+
+        with pytest.raises(ValueError, match="Weight can not exceed the call limit"):
+            policy.try_acquire("call", weight=11)
+
+    def test_acquire_serves_waiting_threads_in_order(self):
+        policy = TokenBucketCallRatePolicy(rate=Rate(5, timedelta(hours=1)), matchers=[])
+        policy.try_acquire("call", weight=5)
+        acquired = []
+
+        def acquire(index: int) -> None:
+            policy.acquire("call", weight=1)
+            acquired.append(index)
+
+        threads = []
+        for index in range(5):
+            thread = threading.Thread(target=acquire, args=(index,))
+            thread.start()
+            threads.append(thread)
+            # make sure the thread is waiting before starting the next one
+            while len(policy._waiters) <= index:
+                time.sleep(0.001)
+
+        for index in range(5):
+            # a single call is available at a time so only the first waiting thread can acquire it
+            policy.update(available_calls=1, call_reset_ts=None)
+            threads[index].join(timeout=5)
+            assert acquired == list(range(index + 1))
+
+    def test_acquire_with_timeout(self):
+        policy = TokenBucketCallRatePolicy(rate=Rate(1, timedelta(hours=1)), matchers=[])
+        policy.try_acquire("call", weight=1)
+
+        with pytest.raises(CallRateLimitHit):
+            policy.acquire("call", weight=1, timeout=0.01)
+
+    def test_update_with_reset_spreads_available_calls_until_reset(self):
+        policy = TokenBucketCallRatePolicy(rate=Rate(1, timedelta(hours=1)), matchers=[])
+        policy.try_acquire("call", weight=1)
+
+        policy.update(available_calls=101, call_reset_ts=datetime.now() + timedelta(seconds=10))
+
+        policy.try_acquire("call", weight=1)
+        with pytest.raises(CallRateLimitHit) as excinfo:
+            policy.try_acquire("call", weight=1)
+        assert excinfo.value.time_to_wait.total_seconds() == pytest.approx(0.1, 0.1), "the 100 other calls are spread over 10 seconds"
+
+    def test_update_without_available_calls_waits_until_reset(self):
+        policy = TokenBucketCallRatePolicy(rate=Rate(10, timedelta(minutes=1)), matchers=[])
+
+        policy.update(available_calls=0, call_reset_ts=datetime.now() + timedelta(seconds=30))
+
+        with pytest.raises(CallRateLimitHit) as excinfo:
+            policy.try_acquire("call", weight=1)
+        assert excinfo.value.time_to_wait.total_seconds() == pytest.approx(30, 0.1)
+
+    def test_rate_is_restored_after_reset(self):
+        policy = TokenBucketCallRatePolicy(rate=Rate(10, timedelta(minutes=1)), matchers=[])
+        policy.update(available_calls=0, call_reset_ts=datetime.now() + timedelta(milliseconds=10))
+
+        time.sleep(0.02)
+
+        for i in range(10):
+            policy.try_acquire("call", weight=1), f"{i + 1} call"
+
+
+class TestAPIBudget:
+    def test_given_token_bucket_policy_when_acquire_call_then_wait_for_credits(self):
+        api_budget = APIBudget(policies=[TokenBucketCallRatePolicy(rate=Rate(1, timedelta(milliseconds=50)), matchers=[])])
+
+        start = time.monotonic()
+        api_budget.acquire_call("call")
+        api_budget.acquire_call("call")
+
+        assert time.monotonic() - start >= 0.04
+
+    def test_given_message_repository_when_acquire_call_then_log_wait_time_metrics(self):
+        message_repository = InMemoryMessageRepository()
+        api_budget = APIBudget(
+            policies=[TokenBucketCallRatePolicy(rate=Rate(1, timedelta(milliseconds=50)), matchers=[])],
+            message_repository=message_repository,
+            metrics_emission_interval_in_seconds=0,
+        )
+
+        api_budget.acquire_call("call")
+        api_budget.acquire_call("call")
+
+        logs = [json.loads(message.log.message) for message in message_repository.consume_queue() if message.type == Type.LOG]
+        assert [log["api_budget"]["waiting_calls"] for log in logs] == [0, 1]
+        assert logs[1]["api_budget"]["max_wait_time_in_seconds"] >= 0.04
+
+
 class TestHttpStreamIntegration:
     def test_without_cache(self, mocker, requests_mock):
         """Test that HttpStream will use call budget when provided"""
@@ -2,6 +2,8 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+from collections import defaultdict
+from types import MappingProxyType
 from unittest.mock import MagicMock
 
 import pytest
@@ -17,6 +19,7 @@ from airbyte_cdk.models import (
 )
 from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
+from freezegun import freeze_time
 
 NOW = 1234567
 STREAM_NAME = "my_stream"
@@ -83,3 +86,32 @@ def test_state_message_to_message(test_name, data):
     schema = {}
     with pytest.raises(ValueError):
         stream_data_to_airbyte_message(STREAM_NAME, data, transformer, schema)
+
+
+@freeze_time("2024-01-01")
+@pytest.mark.parametrize(
+    "test_name, data",
+    [
+        ("test_dict", {"id": 0}),
+        ("test_mapping_that_is_not_a_dict", MappingProxyType({"id": 0})),
+        ("test_dict_subclass", defaultdict(int, {"id": 0})),
+    ],
+)
+def test_given_no_transform_when_stream_data_to_airbyte_message_then_record_is_a_dict(test_name, data):
+    message = stream_data_to_airbyte_message(STREAM_NAME, data)
+
+    assert type(message.record.data) == dict
+    assert message == AirbyteMessage(
+        type=MessageType.RECORD, record=AirbyteRecordMessage(stream=STREAM_NAME, data={"id": 0}, emitted_at=1704067200000)
+    )
+    assert message.json(exclude_unset=True) == AirbyteMessage(
+        type=MessageType.RECORD, record=AirbyteRecordMessage(stream=STREAM_NAME, data={"id": 0}, emitted_at=1704067200000)
+    ).json(exclude_unset=True)
+
+
+def test_given_no_transform_when_stream_data_to_airbyte_message_then_dict_is_not_copied():
+    data = {"id": 0}
+
+    message = stream_data_to_airbyte_message(STREAM_NAME, data)
+
+    assert message.record.data is data
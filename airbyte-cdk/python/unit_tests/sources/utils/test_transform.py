@@ -2,10 +2,14 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import copy
 import json
+import time
 
 import pytest
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
+from airbyte_cdk.test.benchmark import benchmark, log_measure
+from jsonschema import RefResolutionError
 
 SIMPLE_SCHEMA = {"type": "object", "properties": {"value": {"type": "string"}}}
 COMPLEX_SCHEMA = {
@@ -205,8 +209,9 @@ VERY_NESTED_SCHEMA = {
         ),
     ],
 )
-def test_transform(schema, actual, expected, expected_warns, caplog):
-    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+@pytest.mark.parametrize("compile_schemas", [True, False])
+def test_transform(schema, actual, expected, expected_warns, compile_schemas, caplog):
+    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization, compile_schemas=compile_schemas)
     t.transform(actual, schema)
     assert json.dumps(actual) == json.dumps(expected)
     if expected_warns:
@@ -264,3 +269,145 @@ def test_custom_transform_with_default_normalization():
     obj = {"value": 12}
     s.transformer.transform(obj, SIMPLE_SCHEMA)
     assert obj == {"value": "transformed"}
+
+
+@pytest.mark.parametrize(
+    "schema, record",
+    [
+        pytest.param(
+            COMPLEX_SCHEMA,
+            {
+                "value": "1",
+                "prop": 1,
+                "prop_with_null": None,
+                "number_prop": "1.5",
+                "int_prop": "a",
+                "array": [1, None],
+                "list_of_lists": [1, ["a", 2]],
+            },
+            id="test_complex_schema",
+        ),
+        pytest.param(VERY_NESTED_SCHEMA, {"very_nested_value": {"very_nested_value": {"very_nested_value": "a"}}}, id="test_nested_schema"),
+        pytest.param(
+            {"type": "object", "properties": {"id": {"type": "integer"}, "child": {"$ref": "#"}}},
+            {"id": "1", "child": {"id": "2", "child": {"id": "not an int"}}},
+            id="test_recursive_schema",
+        ),
+        pytest.param(
+            {"type": "object", "properties": {"tags": {"type": "array", "items": {"type": "string"}}, "flag": {"type": "boolean"}}},
+            {"tags": "a single tag", "flag": "not a boolean"},
+            id="test_value_wrapped_in_array",
+        ),
+    ],
+)
+def test_compiled_schema_normalizes_like_jsonschema(schema, record, caplog):
+    compiled_record = copy.deepcopy(record)
+    TypeTransformer(TransformConfig.DefaultSchemaNormalization, compile_schemas=False).transform(record, schema)
+    expected_warnings = [log.message for log in caplog.records]
+    caplog.clear()
+
+    TypeTransformer(TransformConfig.DefaultSchemaNormalization, compile_schemas=True).transform(compiled_record, schema)
+
+    assert compiled_record == record
+    assert [log.message for log in caplog.records] == expected_warnings
+
+
+def test_compiled_schema_is_reused():
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+
+    transformer.transform({"value": 1}, SIMPLE_SCHEMA)
+    compiled_schema = transformer._get_compiled_schema(SIMPLE_SCHEMA)
+    transformer.transform({"value": 2}, SIMPLE_SCHEMA)
+
+    assert compiled_schema is not None
+    assert transformer._get_compiled_schema(SIMPLE_SCHEMA) is compiled_schema
+
+
+def test_compiled_schema_is_reused_for_a_copy_of_the_schema():
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    compiled_schema = transformer._get_compiled_schema(SIMPLE_SCHEMA)
+
+    for value in range(100):
+        record = {"value": value}
+        transformer.transform(record, copy.deepcopy(SIMPLE_SCHEMA))
+        assert record == {"value": str(value)}
+
+    assert transformer._get_compiled_schema(copy.deepcopy(SIMPLE_SCHEMA)) is compiled_schema
+    assert len(transformer._compiled_schemas) == 1
+
+
+def test_least_recently_used_compiled_schemas_are_evicted():
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    schemas = [
+        {"type": "object", "properties": {f"value_{i}": {"type": "string"}}} for i in range(TypeTransformer.MAX_COMPILED_SCHEMAS + 1)
+    ]
+    first_compiled_schema = transformer._get_compiled_schema(schemas[0])
+
+    for schema in schemas[1:]:
+        transformer._get_compiled_schema(schema)
+
+    assert len(transformer._compiled_schemas) == TypeTransformer.MAX_COMPILED_SCHEMAS
+    assert transformer._get_compiled_schema(copy.deepcopy(schemas[0])) is not first_compiled_schema
+
+
+def test_given_unresolvable_reference_when_transform_then_only_records_with_the_property_fail():
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+
+    record = {"prop": 1}
+    transformer.transform(record, COMPLEX_SCHEMA)
+    assert record == {"prop": "1"}
+
+    with pytest.raises(RefResolutionError):
+        transformer.transform({"def": {"dd": 1}}, COMPLEX_SCHEMA)
+
+
+def test_given_schema_that_cannot_be_compiled_when_transform_then_use_jsonschema():
+    schema = {"type": "object", "properties": {"value": {"type": "string"}, "any": True}}
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+
+    record = {"value": 1}
+    transformer.transform(record, schema)
+
+    assert transformer._get_compiled_schema(schema) is None
+    assert record == {"value": "1"}
+
+
+def test_given_default_convert_is_overridden_when_transform_then_use_overridden_method():
+    class UpperCaseTransformer(TypeTransformer):
+        @staticmethod
+        def default_convert(original_item, subschema):
+            return str(original_item).upper()
+
+    record = {"value": "a"}
+    UpperCaseTransformer(TransformConfig.DefaultSchemaNormalization).transform(record, SIMPLE_SCHEMA)
+
+    assert record == {"value": "A"}
+
+
+@benchmark
+def test_compiled_schema_performance():
+    # Benchmark of the compiled schema normalization against the jsonschema based normalization
+    records = [
+        {
+            "value": i % 2,
+            "prop": i,
+            "prop_with_null": None,
+            "number_prop": str(i),
+            "int_prop": str(i),
+            "array": [i, str(i)],
+            "nested": {"a": i},
+        }
+        for i in range(5_000)
+    ]
+    durations = {}
+    for compile_schemas in [False, True]:
+        transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization, compile_schemas=compile_schemas)
+        records_to_transform = copy.deepcopy(records)
+        start = time.perf_counter()
+        for record in records_to_transform:
+            transformer.transform(record, COMPLEX_SCHEMA)
+        durations[compile_schemas] = time.perf_counter() - start
+
+    log_measure(
+        f"Normalized {len(records)} records in {durations[False]:.3f}s with jsonschema and in {durations[True]:.3f}s with a compiled schema"
+    )
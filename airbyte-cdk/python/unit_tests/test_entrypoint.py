@@ -2,10 +2,15 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import datetime
+import json
+import logging
 import os
+import sys
 from argparse import Namespace
 from collections import defaultdict
 from copy import deepcopy
+from decimal import Decimal
 from typing import Any, List, Mapping, MutableMapping, Union
 from unittest import mock
 from unittest.mock import MagicMock, patch
@@ -426,3 +431,107 @@ def test_handle_record_counts(incoming_message, stream_message_count, expected_m
 
     if actual_message.type == Type.STATE:
         assert isinstance(actual_message.state.sourceStats.recordCount, float), "recordCount value should be expressed as a float"
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data={"id": 1, "name": "é"}, emitted_at=1)),
+            id="test_record",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(namespace="namespace", stream="stream", data={}, emitted_at=1)),
+            id="test_record_with_namespace",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(namespace=None, stream="stream", data={}, emitted_at=1)),
+            id="test_record_with_namespace_explicitly_unset",
+        ),
+        pytest.param(
+            AirbyteMessage(
+                type=Type.RECORD,
+                record=AirbyteRecordMessage(stream="stream", data={"updated_at": datetime.datetime(2024, 1, 1), "amount": Decimal("1.5")}, emitted_at=1),
+            ),
+            id="test_record_with_values_that_are_not_json_serializable",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data={}, emitted_at=1, extra_field="value")),
+            id="test_record_with_extra_field",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"cursor": 1})),
+            id="test_state",
+        ),
+    ],
+)
+def test_airbyte_message_to_string_is_the_same_as_pydantic_serialization(message):
+    # the spacing can differ when a faster JSON encoder is installed so the parsed messages are compared
+    assert json.loads(AirbyteEntrypoint.airbyte_message_to_string(message)) == json.loads(message.json(exclude_unset=True))
+
+
+def test_launch_writes_buffered_records_before_other_messages(mocker, capsys):
+    record = AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data={"id": 1}, emitted_at=1)).json(exclude_unset=True)
+    state = AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"cursor": 1})).json(exclude_unset=True)
+    write = mocker.spy(entrypoint_module, "_write")
+    mocker.patch.object(AirbyteEntrypoint, "run", return_value=iter([record, record, state, record]))
+
+    entrypoint_module.launch(MockSource(), ["spec"])
+
+    assert capsys.readouterr().out == "".join(f"{message}\n" for message in [record, record, state, record])
+    # records are buffered until the state message, the last record is written once the read is done
+    assert write.call_count == 2
+
+
+def test_launch_writes_buffered_records_on_exception(mocker, capsys):
+    record = AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data={"id": 1}, emitted_at=1)).json(exclude_unset=True)
+
+    def _run_with_exception(parsed_args):
+        yield record
+        raise ValueError()
+
+    mocker.patch.object(AirbyteEntrypoint, "run", side_effect=_run_with_exception)
+
+    with pytest.raises(ValueError):
+        entrypoint_module.launch(MockSource(), ["spec"])
+    assert capsys.readouterr().out == f"{record}\n"
+
+
+@pytest.mark.parametrize("orjson_installed", [True, False])
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param({"nan": float("nan"), "none": None}, id="test_nan"),
+        pytest.param({"nested": [{"infinity": float("inf")}, float("-inf")]}, id="test_nested_infinity"),
+        pytest.param({"none": None, "float": 1.5}, id="test_null_without_non_finite_float"),
+    ],
+)
+def test_non_finite_floats_are_serialized_the_same_with_and_without_orjson(mocker, data, orjson_installed):
+    if orjson_installed:
+        pytest.importorskip("orjson")
+    else:
+        mocker.patch.object(entrypoint_module, "orjson", None)
+    # the spacing can differ when orjson is installed so the output is parsed and serialized again
+    assert json.dumps(json.loads(entrypoint_module._dumps(data))) == json.dumps(data)
+
+
+def test_launch_writes_buffered_records_before_log_messages(mocker, capsys):
+    record = AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data={"id": 1}, emitted_at=1)).json(
+        exclude_unset=True
+    )
+
+    def _run_with_log(parsed_args):
+        yield record
+        logging.getLogger("airbyte").info("a log message")
+        yield record
+
+    mocker.patch.object(AirbyteEntrypoint, "run", side_effect=_run_with_log)
+    # the handler configured by the CDK writes to the stdout that was set before the output was captured
+    handler = logging.StreamHandler(sys.stdout)
+    logging.getLogger().addHandler(handler)
+    try:
+        entrypoint_module.launch(MockSource(), ["spec"])
+    finally:
+        logging.getLogger().removeHandler(handler)
+
+    assert capsys.readouterr().out.splitlines() == [record, "a log message", record]
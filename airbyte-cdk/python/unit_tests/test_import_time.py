@@ -0,0 +1,62 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+# Every connector invocation, including spec and check, pays for importing the entrypoint. These tests record the modules it is allowed to
+# import along with an import time budget. The import times can be inspected by running:
+# `python -X importtime -c "import airbyte_cdk.entrypoint"`
+
+_NUMBER_OF_RUNS = 3
+_IMPORT_TIME_BUDGETS_IN_SECONDS = {
+    "airbyte_cdk": 0.05,
+    "airbyte_cdk.entrypoint": 1.0,
+}
+_MODULES_NOT_IMPORTED_BY_ENTRYPOINT = [
+    "airbyte_cdk.sources.abstract_source",
+    "airbyte_cdk.sources.declarative",
+    "airbyte_cdk.sources.file_based",
+    "airbyte_cdk.sources.streams.http",
+    "distutils",
+    "jinja2",
+    "pkg_resources",
+    "pyrate_limiter",
+    "requests_cache",
+]
+
+
+def _import_times_in_seconds(module: str) -> Dict[str, float]:
+    """
+    Import the module in a new interpreter and return the cumulative import time of every module it imported
+    """
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True)
+    import_times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_time_in_microseconds, imported_module = line.split("|")
+        import_times[imported_module.strip()] = int(cumulative_time_in_microseconds) / 1_000_000
+    return import_times
+
+
+@pytest.mark.parametrize("module", list(_IMPORT_TIME_BUDGETS_IN_SECONDS))
+def test_import_time_is_within_budget(module: str) -> None:
+    # the fastest of a few runs is kept to limit the impact of the load of the machine running the tests
+    import_time = min(_import_times_in_seconds(module)[module] for _ in range(_NUMBER_OF_RUNS))
+
+    assert import_time <= _IMPORT_TIME_BUDGETS_IN_SECONDS[module]
+
+
+def test_importing_package_does_not_import_entrypoint() -> None:
+    assert "airbyte_cdk.entrypoint" not in _import_times_in_seconds("airbyte_cdk")
+
+
+def test_entrypoint_does_not_import_modules_only_needed_by_some_sources() -> None:
+    imported_modules = _import_times_in_seconds("airbyte_cdk.entrypoint")
+
+    assert [module for module in _MODULES_NOT_IMPORTED_BY_ENTRYPOINT if module in imported_modules] == []
@@ -0,0 +1,52 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import os
+import time
+from pathlib import Path
+
+from airbyte_cdk.utils.json_file_cache import JsonFileCache
+
+
+def _set_entries(cache: JsonFileCache, keys: range) -> None:
+    for key in keys:
+        cache.set(key, {"value": key})
+        # entries are ordered by their modification time which might not change between two writes otherwise
+        time.sleep(0.01)
+
+
+def test_given_value_set_when_get_then_return_value(tmp_path: Path) -> None:
+    JsonFileCache(str(tmp_path)).set(["a", "key"], {"value": 1})
+
+    assert JsonFileCache(str(tmp_path)).get(["a", "key"]) == {"value": 1}
+
+
+def test_given_more_entries_than_maximum_when_set_then_evict_least_recently_used_entries(tmp_path: Path) -> None:
+    cache = JsonFileCache(str(tmp_path), max_entries=10)
+    _set_entries(cache, range(10))
+    assert cache.get(0) == {"value": 0}
+
+    _set_entries(cache, range(10, 11))
+
+    assert len(os.listdir(tmp_path)) == 9
+    assert cache.get(0) == {"value": 0}
+    assert cache.get(1) is None
+    assert cache.get(2) is None
+    assert cache.get(10) == {"value": 10}
+
+
+def test_given_entries_written_by_another_cache_when_set_then_count_them_for_eviction(tmp_path: Path) -> None:
+    _set_entries(JsonFileCache(str(tmp_path)), range(10))
+
+    _set_entries(JsonFileCache(str(tmp_path), max_entries=10), range(10, 11))
+
+    assert len(os.listdir(tmp_path)) == 9
+
+
+def test_given_key_not_serializable_when_set_then_do_not_cache(tmp_path: Path) -> None:
+    cache = JsonFileCache(str(tmp_path))
+
+    cache.set({"a", "set"}, {"value": 1})
+
+    assert os.listdir(tmp_path) == []
@@ -9,7 +9,7 @@ import re
 import uuid
 from collections import defaultdict
 from logging import getLogger
-from typing import Any, Iterable, Mapping
+from typing import Any, Dict, Iterable, List, Mapping
 
 import duckdb
 from airbyte_cdk import AirbyteLogger
@@ -33,6 +33,11 @@ def validated_sql_name(sql_name: Any) -> str:
 
 
 class DestinationDuckdb(Destination):
+    # Buffered records are flushed once any of these limits is reached, so that streams without intermediate state messages don't
+    # accumulate all their records in memory
+    MAX_BUFFERED_RECORDS = 100_000
+    MAX_BUFFERED_BYTES = 64 * 1024 * 1024
+
     @staticmethod
     def _get_destination_path(destination_path: str) -> str:
         """
@@ -109,23 +114,16 @@ class DestinationDuckdb(Destination):
 
             con.execute(query)
 
-        buffer = defaultdict(list)
+        buffer: Dict[str, Dict[str, List[str]]] = defaultdict(lambda: defaultdict(list))
+        buffered_records = 0
+        buffered_bytes = 0
 
         for message in input_messages:
             if message.type == Type.STATE:
-                # flush the buffer
-                for stream_name in buffer.keys():
-                    logger.info(f"flushing buffer for state: {message}")
-                    table_name = f"_airbyte_raw_{stream_name}"
-                    query = f"""
-                    INSERT INTO {schema_name}.{table_name}
-                      (_airbyte_ab_id, _airbyte_emitted_at, _airbyte_data)
-                    VALUES (?,?,?)
-                    """
-                    con.executemany(query, buffer[stream_name])
-
-                con.commit()
-                buffer = defaultdict(list)
+                logger.info(f"flushing buffer for state: {message}")
+                self._flush(con, schema_name, buffer)
+                buffer.clear()
+                buffered_records, buffered_bytes = 0, 0
 
                 yield message
             elif message.type == Type.RECORD:
@@ -136,26 +134,38 @@ class DestinationDuckdb(Destination):
                     continue
 
                 # add to buffer
-                buffer[stream].append(
-                    (
-                        str(uuid.uuid4()),
-                        datetime.datetime.now().isoformat(),
-                        json.dumps(data),
-                    )
-                )
+                serialized_data = json.dumps(data)
+                columns = buffer[stream]
+                columns["_airbyte_ab_id"].append(str(uuid.uuid4()))
+                columns["_airbyte_emitted_at"].append(datetime.datetime.now().isoformat())
+                columns["_airbyte_data"].append(serialized_data)
+                buffered_records += 1
+                buffered_bytes += len(serialized_data)
+                if buffered_records >= self.MAX_BUFFERED_RECORDS or buffered_bytes >= self.MAX_BUFFERED_BYTES:
+                    logger.info(f"flushing buffer of {buffered_records} records ({buffered_bytes} bytes)")
+                    self._flush(con, schema_name, buffer)
+                    buffer.clear()
+                    buffered_records, buffered_bytes = 0, 0
             else:
                 logger.info(f"Message type {message.type} not supported, skipping")
 
         # flush any remaining messages
-        for stream_name in buffer.keys():
-            table_name = f"_airbyte_raw_{stream_name}"
+        self._flush(con, schema_name, buffer)
+
+    @staticmethod
+    def _flush(con: duckdb.DuckDBPyConnection, schema_name: str, buffer: Mapping[str, Mapping[str, List[str]]]) -> None:
+        """
+        Insert the buffered records of every stream in bulk and commit them. The columns of the records are passed as lists which DuckDB
+        unnests into rows in a single statement, which is much faster than inserting the records one by one.
+        """
+        for stream_name, columns in buffer.items():
             query = f"""
-            INSERT INTO {schema_name}.{table_name}
-            VALUES (?,?,?)
+            INSERT INTO {schema_name}._airbyte_raw_{stream_name}
+              (_airbyte_ab_id, _airbyte_emitted_at, _airbyte_data)
+            SELECT unnest(?), unnest(?), unnest(?)
             """
-
-            con.executemany(query, buffer[stream_name])
-            con.commit()
+            con.execute(query, [columns["_airbyte_ab_id"], columns["_airbyte_emitted_at"], columns["_airbyte_data"]])
+        con.commit()
 
     def check(self, logger: AirbyteLogger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
         """
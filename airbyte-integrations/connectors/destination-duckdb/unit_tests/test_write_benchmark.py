@@ -0,0 +1,86 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import datetime
+import json
+import logging
+import os
+import time
+import uuid
+from typing import Any, Dict, Iterable
+
+import duckdb
+import pytest
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStream,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    SyncMode,
+    Type,
+)
+from destination_duckdb.destination import DestinationDuckdb
+
+# Benchmark of the throughput of DestinationDuckdb.write for a stream of 1M records without intermediate state messages, compared with
+# inserting the records one by one with `executemany` as the destination used to do. As the latter is orders of magnitude slower, it is
+# measured on a sample of the records
+
+_NUMBER_OF_RECORDS = 1_000_000
+_NUMBER_OF_RECORDS_INSERTED_ONE_BY_ONE = 20_000
+_STREAM_NAME = "benchmark"
+
+# The benchmark is slow and its measures depend on the machine running it, so it is skipped unless the RUN_BENCHMARKS environment variable
+# is set, e.g. `RUN_BENCHMARKS=1 pytest -o log_cli=true unit_tests/test_write_benchmark.py`
+benchmark = pytest.mark.skipif(
+    not os.environ.get("RUN_BENCHMARKS"), reason="Benchmarks only run when the RUN_BENCHMARKS environment variable is set"
+)
+logger = logging.getLogger("airbyte.benchmark")
+
+
+def _data(index: int) -> Dict[str, Any]:
+    return {"id": index, "name": f"name_{index}", "updated_at": "2023-01-01T00:00:00Z", "amount": index * 1.5}
+
+
+def _messages() -> Iterable[AirbyteMessage]:
+    for index in range(_NUMBER_OF_RECORDS):
+        yield AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream=_STREAM_NAME, data=_data(index), emitted_at=0))
+
+
+def _records_per_second_inserted_one_by_one(path: str) -> float:
+    rows = [
+        (str(uuid.uuid4()), datetime.datetime.now().isoformat(), json.dumps(_data(index)))
+        for index in range(_NUMBER_OF_RECORDS_INSERTED_ONE_BY_ONE)
+    ]
+    with duckdb.connect(database=path) as con:
+        con.execute("CREATE TABLE one_by_one (_airbyte_ab_id TEXT PRIMARY KEY, _airbyte_emitted_at DATETIME, _airbyte_data JSON)")
+        start = time.perf_counter()
+        con.executemany("INSERT INTO one_by_one (_airbyte_ab_id, _airbyte_emitted_at, _airbyte_data) VALUES (?,?,?)", rows)
+        con.commit()
+        return len(rows) / (time.perf_counter() - start)
+
+
+@benchmark
+def test_write_throughput(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(DestinationDuckdb, "_get_destination_path", lambda _, path: path)
+    config = {"destination_path": str(tmp_path / "benchmark.duckdb")}
+    stream = AirbyteStream(name=_STREAM_NAME, json_schema={}, supported_sync_modes=[SyncMode.full_refresh])
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(stream=stream, sync_mode=SyncMode.full_refresh, destination_sync_mode=DestinationSyncMode.overwrite)
+        ]
+    )
+
+    start = time.perf_counter()
+    list(DestinationDuckdb().write(config, catalog, _messages()))
+    records_per_second = _NUMBER_OF_RECORDS / (time.perf_counter() - start)
+    records_per_second_one_by_one = _records_per_second_inserted_one_by_one(str(tmp_path / "one_by_one.duckdb"))
+
+    with duckdb.connect(database=config["destination_path"]) as con:
+        assert con.execute(f"SELECT count(*) FROM main._airbyte_raw_{_STREAM_NAME}").fetchone() == (_NUMBER_OF_RECORDS,)
+    logger.info(
+        f"{_NUMBER_OF_RECORDS} records written at {records_per_second:.0f} records/s in batches, "
+        f"{records_per_second_one_by_one:.0f} records/s when inserted one by one"
+    )
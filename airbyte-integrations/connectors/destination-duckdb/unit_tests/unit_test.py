@@ -2,7 +2,23 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
+from typing import Any, Dict, List, Mapping
+from unittest.mock import MagicMock
+
+import duckdb
 import pytest
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStateMessage,
+    AirbyteStream,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    SyncMode,
+    Type,
+)
 from destination_duckdb.destination import DestinationDuckdb, validated_sql_name
 
 
@@ -34,3 +50,74 @@ def test_validated_sql_name(input, expected):
             validated_sql_name(input)
     else:
         assert validated_sql_name(input) == expected
+
+
+@pytest.fixture
+def local_config(tmp_path, monkeypatch) -> Dict[str, str]:
+    monkeypatch.setattr(DestinationDuckdb, "_get_destination_path", lambda _, path: path)
+    return {"destination_path": str(tmp_path / "test.duckdb")}
+
+
+def _catalog(stream_name: str) -> ConfiguredAirbyteCatalog:
+    stream = AirbyteStream(name=stream_name, json_schema={}, supported_sync_modes=[SyncMode.full_refresh])
+    return ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(stream=stream, sync_mode=SyncMode.full_refresh, destination_sync_mode=DestinationSyncMode.overwrite)
+        ]
+    )
+
+
+def _record(stream_name: str, data: Dict[str, Any]) -> AirbyteMessage:
+    return AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream=stream_name, data=data, emitted_at=0))
+
+
+def _read_data(config: Mapping[str, str], stream_name: str) -> List[Dict[str, Any]]:
+    with duckdb.connect(database=config["destination_path"]) as con:
+        rows = con.execute(f"SELECT _airbyte_data FROM main._airbyte_raw_{stream_name} ORDER BY _airbyte_data").fetchall()
+    return [json.loads(row[0]) for row in rows]
+
+
+@pytest.mark.parametrize(
+    "max_buffered_records, max_buffered_bytes, expected_number_of_flushes",
+    [
+        pytest.param(2, 1024, 3, id="test_flush_when_max_buffered_records_is_reached"),
+        pytest.param(100, 30, 3, id="test_flush_when_max_buffered_bytes_is_reached"),
+        pytest.param(100, 1024, 1, id="test_flush_once_when_limits_are_not_reached"),
+    ],
+)
+def test_given_stream_without_state_when_write_then_flush_records_in_batches(
+    local_config, monkeypatch, max_buffered_records, max_buffered_bytes, expected_number_of_flushes
+):
+    monkeypatch.setattr(DestinationDuckdb, "MAX_BUFFERED_RECORDS", max_buffered_records)
+    monkeypatch.setattr(DestinationDuckdb, "MAX_BUFFERED_BYTES", max_buffered_bytes)
+    flush = MagicMock(side_effect=DestinationDuckdb._flush)
+    monkeypatch.setattr(DestinationDuckdb, "_flush", flush)
+    records = [{"id": i, "name": f"name_{i}"} for i in range(5)]
+
+    list(DestinationDuckdb().write(local_config, _catalog("users"), [_record("users", record) for record in records]))
+
+    assert flush.call_count == expected_number_of_flushes
+    assert _read_data(local_config, "users") == records
+
+
+def test_given_state_when_write_then_records_before_state_are_persisted_when_state_is_emitted(local_config):
+    messages = [
+        _record("users", {"id": 1}),
+        AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"id": 1})),
+        _record("users", {"id": 2}),
+    ]
+
+    output = DestinationDuckdb().write(local_config, _catalog("users"), messages)
+
+    assert next(output).state.data == {"id": 1}
+    assert _read_data(local_config, "users") == [{"id": 1}]
+    assert list(output) == []
+    assert _read_data(local_config, "users") == [{"id": 1}, {"id": 2}]
+
+
+def test_given_records_with_quotes_when_write_then_insert_records_in_bulk(local_config):
+    records = [{"id": i, "value": "a ' quote"} for i in range(3)]
+
+    list(DestinationDuckdb().write(local_config, _catalog("users"), [_record("users", record) for record in records]))
+
+    assert _read_data(local_config, "users") == records
@@ -4,15 +4,41 @@
 
 import heapq
 import itertools
-from typing import Optional
+import json
+from functools import lru_cache
+from string import Template
+from typing import Callable, Optional
 
 import sgqlc.operation
 from sgqlc.operation import Selector
+from sgqlc.types import Variable
 
-from . import github_schema
 
-_schema = github_schema
-_schema_root = _schema.github_schema
+def _schema_root():
+    # The schema module is imported on first use since loading it takes most of the import time of the connector, which is wasted by
+    # the spec, check and discover commands and by syncs without GraphQL streams
+    from . import github_schema
+
+    return github_schema.github_schema
+
+
+def _query_template(build: Callable[..., str]) -> Callable[..., Template]:
+    """
+    Caches the queries built by `build` by the arguments which determine their shape, like the page size. The values which change
+    from one request to the other are sgqlc variables in the built query, which are substituted by their GraphQL literals for each
+    request, so the query sent is the same as if it was built with the values.
+    """
+
+    @lru_cache(maxsize=None)
+    def template(*args) -> Template:
+        return Template(build(*args))
+
+    return template
+
+
+def _substitute(query: Template, **values) -> str:
+    # sgqlc serializes the values of string and integer arguments as JSON
+    return query.substitute({variable: json.dumps(value) for variable, value in values.items()})
 
 
 def select_user_fields(user):
@@ -27,12 +53,18 @@ def select_user_fields(user):
 
 
 def get_query_pull_requests(owner, name, first, after, direction):
+    query = _get_query_pull_requests(first, bool(after), direction)
+    return _substitute(query, owner=owner, name=name, after=after)
+
+
+@_query_template
+def _get_query_pull_requests(first, after, direction):
     kwargs = {"first": first, "order_by": {"field": "UPDATED_AT", "direction": direction}}
     if after:
-        kwargs["after"] = after
+        kwargs["after"] = Variable("after")
 
-    op = sgqlc.operation.Operation(_schema_root.query_type)
-    repository = op.repository(owner=owner, name=name)
+    op = sgqlc.operation.Operation(_schema_root().query_type)
+    repository = op.repository(owner=Variable("owner"), name=Variable("name"))
     repository.name()
     repository.owner.login()
     pull_requests = repository.pull_requests(**kwargs)
@@ -55,19 +87,25 @@ def get_query_pull_requests(owner, name, first, after, direction):
     reviews = pull_requests.nodes.reviews(first=100, __alias__="review_comments")
     reviews.total_count()
     reviews.nodes.comments.__fields__(total_count=True)
-    user = pull_requests.nodes.merged_by(__alias__="merged_by").__as__(_schema_root.User)
+    user = pull_requests.nodes.merged_by(__alias__="merged_by").__as__(_schema_root().User)
     select_user_fields(user)
     pull_requests.page_info.__fields__(has_next_page=True, end_cursor=True)
     return str(op)
 
 
 def get_query_projectsV2(owner, name, first, after, direction):
+    query = _get_query_projectsV2(first, bool(after), direction)
+    return _substitute(query, owner=owner, name=name, after=after)
+
+
+@_query_template
+def _get_query_projectsV2(first, after, direction):
     kwargs = {"first": first, "order_by": {"field": "UPDATED_AT", "direction": direction}}
     if after:
-        kwargs["after"] = after
+        kwargs["after"] = Variable("after")
 
-    op = sgqlc.operation.Operation(_schema_root.query_type)
-    repository = op.repository(owner=owner, name=name)
+    op = sgqlc.operation.Operation(_schema_root().query_type)
+    repository = op.repository(owner=Variable("owner"), name=Variable("name"))
     repository.name()
     repository.owner.login()
     projects_v2 = repository.projects_v2(**kwargs)
@@ -96,16 +134,28 @@ def get_query_projectsV2(owner, name, first, after, direction):
 
 
 def get_query_reviews(owner, name, first, after, number=None):
-    op = sgqlc.operation.Operation(_schema_root.query_type)
-    repository = op.repository(owner=owner, name=name)
+    query = _get_query_reviews(first, bool(after), bool(number))
+    return _substitute(
+        query,
+        owner=owner,
+        name=name,
+        after=after,
+        number=number,
+    )
+
+
+@_query_template
+def _get_query_reviews(first, after, number):
+    op = sgqlc.operation.Operation(_schema_root().query_type)
+    repository = op.repository(owner=Variable("owner"), name=Variable("name"))
     repository.name()
     repository.owner.login()
     if number:
-        pull_request = repository.pull_request(number=number)
+        pull_request = repository.pull_request(number=Variable("number"))
     else:
         kwargs = {"first": first, "order_by": {"field": "UPDATED_AT", "direction": "ASC"}}
         if after:
-            kwargs["after"] = after
+            kwargs["after"] = Variable("after")
         pull_requests = repository.pull_requests(**kwargs)
         pull_requests.page_info.__fields__(has_next_page=True, end_cursor=True)
         pull_request = pull_requests.nodes
@@ -113,7 +163,7 @@ def get_query_reviews(owner, name, first, after, number=None):
     pull_request.__fields__(number=True, url=True)
     kwargs = {"first": first}
     if number and after:
-        kwargs["after"] = after
+        kwargs["after"] = Variable("after")
     reviews = pull_request.reviews(**kwargs)
     reviews.page_info.__fields__(has_next_page=True, end_cursor=True)
     reviews.nodes.__fields__(
@@ -128,22 +178,34 @@ def get_query_reviews(owner, name, first, after, number=None):
         updated_at="updated_at",
     )
     reviews.nodes.commit.oid()
-    user = reviews.nodes.author(__alias__="user").__as__(_schema_root.User)
+    user = reviews.nodes.author(__alias__="user").__as__(_schema_root().User)
     select_user_fields(user)
     return str(op)
 
 
 def get_query_issue_reactions(owner, name, first, after, number=None):
-    op = sgqlc.operation.Operation(_schema_root.query_type)
-    repository = op.repository(owner=owner, name=name)
+    query = _get_query_issue_reactions(first, bool(after), bool(number))
+    return _substitute(
+        query,
+        owner=owner,
+        name=name,
+        after=after,
+        number=number,
+    )
+
+
+@_query_template
+def _get_query_issue_reactions(first, after, number):
+    op = sgqlc.operation.Operation(_schema_root().query_type)
+    repository = op.repository(owner=Variable("owner"), name=Variable("name"))
     repository.name()
     repository.owner.login()
     if number:
-        issue = repository.issue(number=number)
+        issue = repository.issue(number=Variable("number"))
     else:
         kwargs = {"first": first}
         if after:
-            kwargs["after"] = after
+            kwargs["after"] = Variable("after")
         issues = repository.issues(**kwargs)
         issues.page_info.__fields__(has_next_page=True, end_cursor=True)
         issue = issues.nodes
@@ -151,7 +213,7 @@ def get_query_issue_reactions(owner, name, first, after, number=None):
     issue.__fields__(number=True)
     kwargs = {"first": first}
     if number and after:
-        kwargs["after"] = after
+        kwargs["after"] = Variable("after")
     reactions = issue.reactions(**kwargs)
     reactions.page_info.__fields__(has_next_page=True, end_cursor=True)
     reactions.nodes.__fields__(
@@ -190,22 +252,28 @@ class QueryReactions:
           }
         }
         """
-        op = self._get_operation()
-        repository = op.repository(owner=owner, name=name)
+        query = self._get_query_root_repository(first, bool(after))
+        return _substitute(query, owner=owner, name=name, after=after)
+
+    @classmethod
+    @_query_template
+    def _get_query_root_repository(cls, first: int, after: bool):
+        op = cls._get_operation()
+        repository = op.repository(owner=Variable("owner"), name=Variable("name"))
         repository.name()
         repository.owner.login()
 
         kwargs = {"first": first}
         if after:
-            kwargs["after"] = after
+            kwargs["after"] = Variable("after")
         pull_requests = repository.pull_requests(**kwargs)
         pull_requests.page_info.__fields__(has_next_page=True, end_cursor=True)
         pull_requests.total_count()
         pull_requests.nodes.id(__alias__="node_id")
 
-        reviews = self._select_reviews(pull_requests.nodes, first=self.AVERAGE_REVIEWS)
-        comments = self._select_comments(reviews.nodes, first=self.AVERAGE_COMMENTS)
-        self._select_reactions(comments.nodes, first=self.AVERAGE_REACTIONS)
+        reviews = cls._select_reviews(pull_requests.nodes, first=cls.AVERAGE_REVIEWS)
+        comments = cls._select_comments(reviews.nodes, first=cls.AVERAGE_COMMENTS)
+        cls._select_reactions(comments.nodes, first=cls.AVERAGE_REACTIONS)
         return str(op)
 
     def get_query_root_pull_request(self, node_id: str, first: int, after: str):
@@ -222,15 +290,21 @@ class QueryReactions:
           }
         }
         """
-        op = self._get_operation()
-        pull_request = op.node(id=node_id).__as__(_schema_root.PullRequest)
+        query = self._get_query_root_pull_request(first, bool(after))
+        return _substitute(query, id=node_id, after=after)
+
+    @classmethod
+    @_query_template
+    def _get_query_root_pull_request(cls, first: int, after: bool):
+        op = cls._get_operation()
+        pull_request = op.node(id=Variable("id")).__as__(_schema_root().PullRequest)
         pull_request.id(__alias__="node_id")
         pull_request.repository.name()
         pull_request.repository.owner.login()
 
-        reviews = self._select_reviews(pull_request, first, after)
-        comments = self._select_comments(reviews.nodes, first=self.AVERAGE_COMMENTS)
-        self._select_reactions(comments.nodes, first=self.AVERAGE_REACTIONS)
+        reviews = cls._select_reviews(pull_request, first, Variable("after") if after else None)
+        comments = cls._select_comments(reviews.nodes, first=cls.AVERAGE_COMMENTS)
+        cls._select_reactions(comments.nodes, first=cls.AVERAGE_REACTIONS)
         return str(op)
 
     def get_query_root_review(self, node_id: str, first: int, after: str):
@@ -245,14 +319,20 @@ class QueryReactions:
           }
         }
         """
-        op = self._get_operation()
-        review = op.node(id=node_id).__as__(_schema_root.PullRequestReview)
+        query = self._get_query_root_review(first, bool(after))
+        return _substitute(query, id=node_id, after=after)
+
+    @classmethod
+    @_query_template
+    def _get_query_root_review(cls, first: int, after: bool):
+        op = cls._get_operation()
+        review = op.node(id=Variable("id")).__as__(_schema_root().PullRequestReview)
         review.id(__alias__="node_id")
         review.repository.name()
         review.repository.owner.login()
 
-        comments = self._select_comments(review, first, after)
-        self._select_reactions(comments.nodes, first=self.AVERAGE_REACTIONS)
+        comments = cls._select_comments(review, first, Variable("after") if after else None)
+        cls._select_reactions(comments.nodes, first=cls.AVERAGE_REACTIONS)
         return str(op)
 
     def get_query_root_comment(self, node_id: str, first: int, after: str):
@@ -265,16 +345,23 @@ class QueryReactions:
           }
         }
         """
-        op = self._get_operation()
-        comment = op.node(id=node_id).__as__(_schema_root.PullRequestReviewComment)
+        query = self._get_query_root_comment(first, bool(after))
+        return _substitute(query, id=node_id, after=after)
+
+    @classmethod
+    @_query_template
+    def _get_query_root_comment(cls, first: int, after: bool):
+        op = cls._get_operation()
+        comment = op.node(id=Variable("id")).__as__(_schema_root().PullRequestReviewComment)
         comment.id(__alias__="node_id")
         comment.database_id(__alias__="id")
         comment.repository.name()
         comment.repository.owner.login()
-        self._select_reactions(comment, first, after)
+        cls._select_reactions(comment, first, Variable("after") if after else None)
         return str(op)
 
-    def _select_reactions(self, comment: Selector, first: int, after: Optional[str] = None):
+    @classmethod
+    def _select_reactions(cls, comment: Selector, first: int, after: Optional[Variable] = None):
         kwargs = {"first": first}
         if after:
             kwargs["after"] = after
@@ -285,7 +372,8 @@ class QueryReactions:
         select_user_fields(reactions.nodes.user())
         return reactions
 
-    def _select_comments(self, review: Selector, first: int, after: Optional[str] = None):
+    @classmethod
+    def _select_comments(cls, review: Selector, first: int, after: Optional[Variable] = None):
         kwargs = {"first": first}
         if after:
             kwargs["after"] = after
@@ -296,7 +384,8 @@ class QueryReactions:
         comments.nodes.database_id(__alias__="id")
         return comments
 
-    def _select_reviews(self, pull_request: Selector, first: int, after: Optional[str] = None):
+    @classmethod
+    def _select_reviews(cls, pull_request: Selector, first: int, after: Optional[Variable] = None):
         kwargs = {"first": first}
         if after:
             kwargs["after"] = after
@@ -307,8 +396,9 @@ class QueryReactions:
         reviews.nodes.database_id(__alias__="id")
         return reviews
 
-    def _get_operation(self):
-        return sgqlc.operation.Operation(_schema_root.query_type)
+    @classmethod
+    def _get_operation(cls):
+        return sgqlc.operation.Operation(_schema_root().query_type)
 
 
 class CursorStorage:
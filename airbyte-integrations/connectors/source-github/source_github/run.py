@@ -4,14 +4,28 @@
 
 
 import sys
+from typing import List
 
-from airbyte_cdk.entrypoint import launch
+from airbyte_cdk.entrypoint import AirbyteEntrypoint, launch
 from source_github import SourceGithub
 from source_github.config_migrations import MigrateBranch, MigrateRepository
 
 
+def _get_source(args: List[str]) -> SourceGithub:
+    catalog_path = AirbyteEntrypoint.extract_catalog(args)
+    config_path = AirbyteEntrypoint.extract_config(args)
+    state_path = AirbyteEntrypoint.extract_state(args)
+    return SourceGithub(
+        SourceGithub.read_catalog(catalog_path) if catalog_path else None,
+        SourceGithub.read_config(config_path) if config_path else None,
+        SourceGithub.read_state(state_path) if state_path else None,
+    )
+
+
 def run():
+    args = sys.argv[1:]
     source = SourceGithub()
-    MigrateRepository.migrate(sys.argv[1:], source)
-    MigrateBranch.migrate(sys.argv[1:], source)
-    launch(source, sys.argv[1:])
+    MigrateRepository.migrate(args, source)
+    MigrateBranch.migrate(args, source)
+    # the source is created once the config is migrated as the catalog, config and state are needed to read the streams concurrently
+    launch(_get_source(args), args)
@@ -2,17 +2,25 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import logging
 from os import getenv
 from typing import Any, List, Mapping, MutableMapping, Optional, Tuple
 from urllib.parse import urlparse
 
 from airbyte_cdk import AirbyteLogger
-from airbyte_cdk.models import FailureType, SyncMode
-from airbyte_cdk.sources import AbstractSource
+from airbyte_cdk.entrypoint import logger as entrypoint_logger
+from airbyte_cdk.models import ConfiguredAirbyteCatalog, FailureType, SyncMode
+from airbyte_cdk.sources.concurrent_source.concurrent_source import ConcurrentSource
+from airbyte_cdk.sources.concurrent_source.concurrent_source_adapter import ConcurrentSourceAdapter
+from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
+from airbyte_cdk.sources.message.repository import InMemoryMessageRepository
+from airbyte_cdk.sources.source import TState
 from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams.concurrent.adapters import StreamFacade
+from airbyte_cdk.sources.streams.concurrent.cursor import FinalStateCursor
 from airbyte_cdk.sources.streams.http.auth import MultipleTokenAuthenticator
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
-from source_github.utils import MultipleTokenAuthenticatorWithRateLimiter
+from source_github.utils import MultipleTokenAuthenticatorWithRateLimiter, RepositoryCursor
 
 from . import constants
 from .streams import (
@@ -59,10 +67,47 @@ from .streams import (
 )
 from .utils import read_full_refresh
 
+logger = logging.getLogger("airbyte")
 
-class SourceGithub(AbstractSource):
+_MAX_CONCURRENCY = 20
+# repositories are read one at a time unless more workers are configured
+_DEFAULT_CONCURRENCY = 1
+
+
+class SourceGithub(ConcurrentSourceAdapter):
 
     continue_sync_on_stream_failure = True
+    message_repository = InMemoryMessageRepository(entrypoint_logger.level)
+
+    def __init__(
+        self,
+        catalog: Optional[ConfiguredAirbyteCatalog] = None,
+        config: Optional[Mapping[str, Any]] = None,
+        state: TState = None,
+        **kwargs,
+    ):
+        if config:
+            concurrency_level = min(config.get("num_workers", _DEFAULT_CONCURRENCY), _MAX_CONCURRENCY)
+        else:
+            concurrency_level = _DEFAULT_CONCURRENCY
+        concurrent_source = ConcurrentSource.create(
+            concurrency_level, max(concurrency_level // 2, 1), logger, self._slice_logger, self.message_repository
+        )
+        super().__init__(concurrent_source)
+        self._state = state
+        # The streams are only wrapped to be read concurrently when reading a catalog with several workers, so that `check` and
+        # `discover` as well as syncs with a single worker behave exactly as before
+        self._read_concurrently = bool(catalog) and concurrency_level > 1
+        if self._read_concurrently:
+            logger.info(f"Reading repositories concurrently with {concurrency_level} workers")
+        if catalog:
+            self._streams_configured_as_full_refresh = {
+                configured_stream.stream.name
+                for configured_stream in catalog.streams
+                if configured_stream.sync_mode == SyncMode.full_refresh
+            }
+        else:
+            self._streams_configured_as_full_refresh = set()
 
     @staticmethod
     def _get_org_repositories(
@@ -131,7 +176,8 @@ class SourceGithub(AbstractSource):
     def _get_authenticator(self, config: Mapping[str, Any]):
         _, token = self.get_access_token(config)
         tokens = [t.strip() for t in token.split(constants.TOKEN_SEPARATOR)]
-        return MultipleTokenAuthenticatorWithRateLimiter(tokens=tokens)
+        # concurrent requests are spread over the tokens instead of draining them one after the other
+        return MultipleTokenAuthenticatorWithRateLimiter(tokens=tokens, balance_tokens=self._read_concurrently)
 
     def _validate_and_transform_config(self, config: MutableMapping[str, Any]) -> MutableMapping[str, Any]:
         config = self._ensure_default_values(config)
@@ -264,7 +310,7 @@ class SourceGithub(AbstractSource):
         team_members_stream = TeamMembers(parent=teams_stream, **repository_args)
         workflow_runs_stream = WorkflowRuns(**repository_args_with_start_date)
 
-        return [
+        streams = [
             IssueTimelineEvents(**repository_args),
             Assignees(**repository_args),
             Branches(**repository_args),
@@ -305,3 +351,29 @@ class SourceGithub(AbstractSource):
             WorkflowJobs(parent=workflow_runs_stream, **repository_args_with_start_date),
             TeamMemberships(parent=team_members_stream, **repository_args),
         ]
+        if not self._read_concurrently:
+            return streams
+
+        state_manager = ConnectorStateManager(stream_instance_map={stream.name: stream for stream in streams}, state=self._state)
+        return [self._to_concurrent(stream, state_manager) for stream in streams]
+
+    def _to_concurrent(self, stream: Stream, state_manager: ConnectorStateManager) -> Stream:
+        """
+        Wrap the streams with one partition per repository in a `StreamFacade` so that the `ConcurrentSource` spreads the repositories
+        over its workers. The other streams are read one slice at a time after the concurrent ones.
+        """
+        if not stream.concurrent_repositories:
+            return stream
+
+        if stream.name in self._streams_configured_as_full_refresh or not stream.supports_incremental:
+            return StreamFacade.create_from_stream(
+                stream,
+                self,
+                entrypoint_logger,
+                {},
+                FinalStateCursor(stream_name=stream.name, stream_namespace=stream.namespace, message_repository=self.message_repository),
+            )
+
+        state = state_manager.get_stream_state(stream.name, stream.namespace)
+        cursor = RepositoryCursor(stream, state, self.message_repository, state_manager)
+        return StreamFacade.create_from_stream(stream, self, entrypoint_logger, state, cursor)
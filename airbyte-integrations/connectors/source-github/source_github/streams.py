@@ -38,6 +38,10 @@ class GithubStreamABC(HttpStream, ABC):
     # Detect streams with high API load
     large_stream = False
 
+    # Streams whose repositories can be read concurrently: they have one slice per repository, their state is keyed by repository and
+    # reading a repository does not depend on the state of the other repositories or of the stream instance.
+    concurrent_repositories = False
+
     stream_base_params = {}
 
     def __init__(self, api_url: str = "https://api.github.com", access_token_type: str = "", **kwargs):
@@ -226,6 +230,9 @@ class GithubStreamABC(HttpStream, ABC):
 
 
 class GithubStream(GithubStreamABC):
+
+    concurrent_repositories = True
+
     def __init__(self, repositories: List[str], page_size_for_large_streams: int, **kwargs):
         super().__init__(**kwargs)
         self.repositories = repositories
@@ -679,6 +686,7 @@ class Commits(IncrementalMixin, GithubStream):
     Pull commits from each branch of each repository, tracking state for each branch
     """
 
+    concurrent_repositories = False
     primary_key = "sha"
     cursor_field = "created_at"
     slice_keys = ["repository", "branch"]
@@ -935,6 +943,7 @@ class PullRequestCommits(GithubStream):
     API docs: https://docs.github.com/en/rest/pulls/pulls?apiVersion=2022-11-28#list-commits-on-a-pull-request
     """
 
+    concurrent_repositories = False
     primary_key = "sha"
 
     def __init__(self, parent: HttpStream, **kwargs):
@@ -1006,6 +1015,7 @@ class ProjectsV2(SemiIncrementalMixin, GitHubGraphQLStream):
 
 class ReactionStream(GithubStream, ABC):
 
+    concurrent_repositories = False
     parent_key = "id"
     copy_parent_key = "comment_id"
     cursor_field = "created_at"
@@ -1161,6 +1171,8 @@ class PullRequestCommentReactions(SemiIncrementalMixin, GitHubGraphQLStream):
     https://docs.github.com/en/graphql/reference/objects#reaction
     """
 
+    # the cursors of the pages are stored in a single `CursorStorage` for all repositories
+    concurrent_repositories = False
     cursor_field = "created_at"
 
     def __init__(self, **kwargs):
@@ -1284,6 +1296,7 @@ class ProjectColumns(GithubStream):
     API docs: https://docs.github.com/en/rest/projects/columns?apiVersion=2022-11-28#list-project-columns
     """
 
+    concurrent_repositories = False
     use_cache = True
     cursor_field = "updated_at"
 
@@ -1354,6 +1367,7 @@ class ProjectCards(GithubStream):
     API docs: https://docs.github.com/en/rest/projects/cards?apiVersion=2022-11-28#list-project-cards
     """
 
+    concurrent_repositories = False
     cursor_field = "updated_at"
     stream_base_params = {"archived_state": "all"}
 
@@ -1496,6 +1510,7 @@ class WorkflowJobs(SemiIncrementalMixin, GithubStream):
     API documentation: https://docs.github.com/pt/rest/actions/workflow-jobs?apiVersion=2022-11-28#list-jobs-for-a-workflow-run
     """
 
+    concurrent_repositories = False
     cursor_field = "completed_at"
 
     def __init__(self, parent: WorkflowRuns, **kwargs):
@@ -1550,6 +1565,7 @@ class TeamMembers(GithubStream):
     API docs: https://docs.github.com/en/rest/teams/members?apiVersion=2022-11-28#list-team-members
     """
 
+    concurrent_repositories = False
     use_cache = True
     primary_key = ["id", "team_slug"]
 
@@ -1584,6 +1600,7 @@ class TeamMemberships(GithubStream):
     API docs: https://docs.github.com/en/rest/teams/members?apiVersion=2022-11-28#get-team-membership-for-a-user
     """
 
+    concurrent_repositories = False
     primary_key = ["url"]
 
     def __init__(self, parent: TeamMembers, **kwargs):
@@ -1681,6 +1698,7 @@ class IssueTimelineEvents(GithubStream):
     API docs https://docs.github.com/en/rest/issues/timeline?apiVersion=2022-11-28#list-timeline-events-for-an-issue
     """
 
+    concurrent_repositories = False
     primary_key = ["repository", "issue_number"]
 
     def __init__(self, **kwargs):
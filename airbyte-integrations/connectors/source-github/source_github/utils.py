@@ -2,15 +2,22 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import copy
+import threading
 import time
 from dataclasses import dataclass
 from itertools import cycle
-from typing import Any, List, Mapping
+from typing import Any, List, Mapping, MutableMapping, Optional
 
 import pendulum
 import requests
 from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
+from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams.concurrent.cursor import Cursor
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
 from airbyte_cdk.sources.streams.http.requests_native_auth import TokenAuthenticator
 from airbyte_cdk.sources.streams.http.requests_native_auth.abstract_token import AbstractHeaderAuthenticator
 
@@ -52,11 +59,14 @@ class MultipleTokenAuthenticatorWithRateLimiter(AbstractHeaderAuthenticator):
     If a token exceeds the capacity limit, the system switches to another token.
     If all tokens are exhausted, the system will enter a sleep state until
     the first token becomes available again.
+
+    When `balance_tokens` is set, as when streams are read concurrently, each request is
+    instead sent with the token which has the most remaining requests for its API (REST or GraphQL).
     """
 
     DURATION = pendulum.duration(seconds=3600)  # Duration at which the current rate limit window resets
 
-    def __init__(self, tokens: List[str], auth_method: str = "token", auth_header: str = "Authorization"):
+    def __init__(self, tokens: List[str], auth_method: str = "token", auth_header: str = "Authorization", balance_tokens: bool = False):
         self._auth_method = auth_method
         self._auth_header = auth_header
         self._tokens = {t: Token() for t in tokens}
@@ -64,6 +74,9 @@ class MultipleTokenAuthenticatorWithRateLimiter(AbstractHeaderAuthenticator):
         self._tokens_iter = cycle(self._tokens)
         self._active_token = next(self._tokens_iter)
         self._max_time = 60 * 10  # 10 minutes as default
+        self._balance_tokens = balance_tokens
+        # requests can be sent from several threads, the counters are updated and the token is selected under the lock
+        self._lock = threading.Lock()
 
     @property
     def auth_header(self) -> str:
@@ -77,16 +90,19 @@ class MultipleTokenAuthenticatorWithRateLimiter(AbstractHeaderAuthenticator):
 
     def __call__(self, request):
         """Attach the HTTP headers required to authenticate on the HTTP request"""
-        while True:
-            current_token = self._tokens[self.current_active_token]
-            if "graphql" in request.path_url:
-                if self.process_token(current_token, "count_graphql", "reset_at_graphql"):
-                    break
-            else:
-                if self.process_token(current_token, "count_rest", "reset_at_rest"):
+        if "graphql" in request.path_url:
+            count_attr, reset_attr = "count_graphql", "reset_at_graphql"
+        else:
+            count_attr, reset_attr = "count_rest", "reset_at_rest"
+
+        with self._lock:
+            while True:
+                if self._balance_tokens:
+                    self._active_token = max(self._tokens, key=lambda token: getattr(self._tokens[token], count_attr))
+                if self.process_token(self._tokens[self.current_active_token], count_attr, reset_attr):
                     break
 
-        request.headers.update(self.get_auth_header())
+            request.headers.update(self.get_auth_header())
 
         return request
 
@@ -150,3 +166,52 @@ class MultipleTokenAuthenticatorWithRateLimiter(AbstractHeaderAuthenticator):
         else:
             self.update_token()
         return False
+
+
+class RepositoryCursor(Cursor):
+    """
+    Cursor of the incremental streams read concurrently with one partition per repository.
+
+    The state is kept by repository like `SemiIncrementalMixin.get_updated_state` does. As the records of a repository are not always
+    sorted by cursor value, the state of a repository is only updated and emitted once all of its records were read so that an interrupted
+    sync does not skip the records of the repositories which were being read.
+    """
+
+    def __init__(
+        self,
+        stream: Stream,
+        stream_state: Optional[Mapping[str, Any]],
+        message_repository: MessageRepository,
+        connector_state_manager: ConnectorStateManager,
+    ):
+        self._stream = stream
+        self._message_repository = message_repository
+        self._connector_state_manager = connector_state_manager
+        self._state = copy.deepcopy(stream_state) if stream_state else {}
+        # cursor values of the records read so far, including the ones of the repositories which are still being read
+        self._observed_state = copy.deepcopy(self._state)
+        # records are observed from the worker threads
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> MutableMapping[str, Any]:
+        return self._state
+
+    def observe(self, record: Record) -> None:
+        with self._lock:
+            self._stream.get_updated_state(self._observed_state, record.data)
+
+    def close_partition(self, partition: Partition) -> None:
+        repository = partition.to_slice()["repository"]
+        with self._lock:
+            if repository in self._observed_state:
+                self._state[repository] = copy.deepcopy(self._observed_state[repository])
+            self._emit_state()
+
+    def ensure_at_least_one_state_emitted(self) -> None:
+        with self._lock:
+            self._emit_state()
+
+    def _emit_state(self) -> None:
+        self._connector_state_manager.update_state_for_stream(self._stream.name, self._stream.namespace, copy.deepcopy(self._state))
+        self._message_repository.emit_message(self._connector_state_manager.create_state_message(self._stream.name, self._stream.namespace))
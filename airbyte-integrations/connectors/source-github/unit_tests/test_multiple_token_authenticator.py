@@ -41,6 +41,28 @@ def test_authenticator_counter(rate_limit_mock_response):
     assert authenticator._tokens["token1"].count_rest == 4998
 
 
+@responses.activate
+def test_authenticator_balance_tokens(rate_limit_mock_response):
+    """
+    This test ensures that when the tokens are balanced, each request is sent with the token which has the most remaining requests.
+    """
+    authenticator = MultipleTokenAuthenticatorWithRateLimiter(tokens=["token1", "token2", "token3"], balance_tokens=True)
+    authenticator._tokens["token1"].count_rest = 4000
+    authenticator._tokens["token3"].count_graphql = 4000
+    tokens = []
+
+    def request_callback(request):
+        tokens.append(request.headers["Authorization"])
+        return (200, {}, json.dumps({"id": 1}))
+
+    responses.add_callback("GET", "https://api.github.com/orgs/org1", callback=request_callback)
+    stream = Organizations(organizations=["org1"] * 3, authenticator=authenticator)
+    list(read_full_refresh(stream))
+
+    assert tokens == ["token token2", "token token3", "token token2"]
+    assert [(x.count_rest, x.count_graphql) for x in authenticator._tokens.values()] == [(4000, 5000), (4998, 5000), (4999, 4000)]
+
+
 @responses.activate
 def test_multiple_token_authenticator_with_rate_limiter():
     """
@@ -4,14 +4,19 @@
 
 import logging
 import os
+import threading
 from unittest.mock import MagicMock
 
 import pytest
 import responses
-from airbyte_cdk.models import AirbyteConnectionStatus, Status
+from airbyte_cdk.models import AirbyteConnectionStatus, Status, SyncMode, Type
+from airbyte_cdk.sources.streams.concurrent.adapters import StreamFacade
+from airbyte_cdk.test.catalog_builder import CatalogBuilder
+from airbyte_cdk.test.state_builder import StateBuilder
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 from source_github import constants
 from source_github.source import SourceGithub
+from source_github.streams import Stargazers
 
 from .utils import command_check
 
@@ -287,3 +292,73 @@ def test_user_friendly_message(error_message, expected_user_friendly_message):
     source = SourceGithub()
     user_friendly_error_message = source.user_friendly_error_message(error_message)
     assert user_friendly_error_message == expected_user_friendly_message
+
+
+def _add_repository_responses(*repositories):
+    for repository in repositories:
+        responses.add(responses.GET, f"https://api.github.com/repos/{repository}?per_page=100", json={"full_name": repository})
+
+
+@responses.activate
+@pytest.mark.parametrize("num_workers, expected_concurrent_streams", ((None, set()), (1, set()), (2, {"stargazers", "issues"})))
+def test_streams_wrapped_to_be_read_concurrently(num_workers, expected_concurrent_streams, rate_limit_mock_response):
+    _add_repository_responses("airbyte/test")
+    config = {"access_token": "test_token", "repositories": ["airbyte/test"]}
+    if num_workers:
+        config["num_workers"] = num_workers
+    catalog = (
+        CatalogBuilder()
+        .with_stream("stargazers", SyncMode.incremental)
+        .with_stream("issues", SyncMode.full_refresh)
+        .with_stream("commits", SyncMode.incremental)
+        .build()
+    )
+
+    streams = SourceGithub(catalog, config, None).streams(config=config)
+
+    concurrent_streams = {stream.name for stream in streams if isinstance(stream, StreamFacade)}
+    assert concurrent_streams & {"stargazers", "issues", "commits"} == expected_concurrent_streams
+
+
+@responses.activate
+def test_read_repositories_concurrently_with_state_by_repository(monkeypatch, rate_limit_mock_response):
+    _add_repository_responses("airbyte/repo1", "airbyte/repo2")
+    responses.add(
+        responses.GET,
+        "https://api.github.com/repos/airbyte/repo1/stargazers?per_page=100",
+        json=[
+            {"starred_at": "2022-01-01T00:00:00Z", "user": {"id": 1}},
+            {"starred_at": "2023-01-01T00:00:00Z", "user": {"id": 2}},
+        ],
+    )
+    responses.add(
+        responses.GET,
+        "https://api.github.com/repos/airbyte/repo2/stargazers?per_page=100",
+        json=[{"starred_at": "2021-01-01T00:00:00Z", "user": {"id": 3}}],
+    )
+    # each repository waits for the request of the other one, so the read only succeeds if they are read at the same time
+    barrier = threading.Barrier(2)
+    send_request = Stargazers._send_request
+
+    def _send_request_in_parallel(stream, request, request_kwargs):
+        barrier.wait(timeout=5)
+        return send_request(stream, request, request_kwargs)
+
+    monkeypatch.setattr(Stargazers, "_send_request", _send_request_in_parallel)
+    config = {
+        "credentials": {"option_title": "PAT Credentials", "personal_access_token": "test_token"},
+        "repositories": ["airbyte/repo1", "airbyte/repo2"],
+        "num_workers": 2,
+    }
+    catalog = CatalogBuilder().with_stream("stargazers", SyncMode.incremental).build()
+    state = StateBuilder().with_stream_state("stargazers", {"airbyte/repo1": {"starred_at": "2022-06-01T00:00:00Z"}}).build()
+
+    messages = list(SourceGithub(catalog, config, state).read(logging.getLogger("airbyte"), config, catalog, state))
+
+    records = [message.record.data for message in messages if message.type == Type.RECORD]
+    states = [message.state.stream.stream_state.dict() for message in messages if message.type == Type.STATE]
+    assert sorted(record["user_id"] for record in records) == [2, 3]
+    assert states[-1] == {
+        "airbyte/repo1": {"starred_at": "2023-01-01T00:00:00Z"},
+        "airbyte/repo2": {"starred_at": "2021-01-01T00:00:00Z"},
+    }
@@ -15,6 +15,7 @@ from airbyte_cdk.sources.streams.http.exceptions import BaseBackoffException, Us
 from requests import HTTPError
 from responses import matchers
 from source_github import SourceGithub, constants
+from source_github.graphql import QueryReactions
 from source_github.streams import (
     Branches,
     Collaborators,
@@ -1336,6 +1337,16 @@ def test_stream_pull_request_comment_reactions_read():
     assert stream_state == {"airbytehq/airbyte": {"created_at": "2022-01-02T00:00:01Z"}}
 
 
+def test_query_reactions_builds_query_once_by_page_size():
+    QueryReactions._get_query_root_comment.cache_clear()
+
+    QueryReactions().get_query_root_comment("comment1", 2, None)
+    QueryReactions().get_query_root_comment("comment2", 2, "end_cursor_value")
+    QueryReactions().get_query_root_comment("comment3", 2, None)
+
+    assert QueryReactions._get_query_root_comment.cache_info().misses == 2
+
+
 @responses.activate
 def test_stream_projects_v2_graphql_retry(rate_limit_mock_response):
     repository_args_with_start_date = {
@@ -115,7 +115,8 @@ class SourceHubspot(AbstractSource):
         start_date = config.get("start_date", DEFAULT_START_DATE)
         credentials = config["credentials"]
         api = self.get_api(config=config)
-        return dict(api=api, start_date=start_date, credentials=credentials)
+        concurrent_associations = config.get("concurrent_associations", False)
+        return dict(api=api, start_date=start_date, credentials=credentials, concurrent_associations=concurrent_associations)
 
     def streams(self, config: Mapping[str, Any]) -> List[Stream]:
         credentials = config.get("credentials", {})
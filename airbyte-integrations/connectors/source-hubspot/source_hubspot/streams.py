@@ -7,6 +7,7 @@ import logging
 import sys
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import timedelta
 from functools import cached_property, lru_cache
 from http import HTTPStatus
@@ -332,6 +333,8 @@ class Stream(HttpStream, ABC):
     granted_scopes: Set = None
     properties_scopes: Set = None
     unnest_fields: Optional[List[str]] = None
+    # maximum number of chunks of properties of a page requested at the same time when there are too many properties for a single request
+    MAX_CONCURRENT_CHUNK_REQUESTS = 4
 
     @cached_property
     def record_unnester(self):
@@ -377,10 +380,18 @@ class Stream(HttpStream, ABC):
             return APIv2Property(properties)
         return APIv3Property(properties)
 
-    def __init__(self, api: API, start_date: Union[str, pendulum.datetime], credentials: Mapping[str, Any] = None, **kwargs):
+    def __init__(
+        self,
+        api: API,
+        start_date: Union[str, pendulum.datetime],
+        credentials: Mapping[str, Any] = None,
+        concurrent_associations: bool = False,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self._api: API = api
         self._credentials = credentials
+        self._concurrent_associations = concurrent_associations
 
         self._start_date = start_date
         if isinstance(self._start_date, str):
@@ -471,18 +482,37 @@ class Stream(HttpStream, ABC):
         #  (https://community.hubspot.com/t5/APIs-Integrations/Get-all-contact-properties-without-explicitly-listing-them/m-p/447950)
         #  and the official documentation, this does not exist at the moment.
 
+        #  The chunks of properties of the page are requested concurrently and their records are merged as the responses arrive, so only
+        #  the records of the current page are held in memory. Requests which have not started yet are cancelled as soon as one of them
+        #  fails, and rate limited requests are retried after the delay returned by the API like any other request of the stream.
+
         group_by_pk = self.primary_key and not self.denormalize_records
         post_processor: IRecordPostProcessor = GroupByKey(self.primary_key) if group_by_pk else StoreAsIs()
-        response = None
-
-        properties = self._property_wrapper
-        for chunk in properties.split():
-            response = self.handle_request(
-                stream_slice=stream_slice, stream_state=stream_state, next_page_token=next_page_token, properties=chunk
-            )
-            for record in self._transform(self.parse_response(response, stream_state=stream_state)):
-                post_processor.add_record(record)
 
+        chunks = list(self._property_wrapper.split())
+        # the cassette of the cache is stored on the stream, so cached requests are not sent concurrently
+        max_workers = 1 if self.use_cache or len(chunks) <= 1 else min(self.MAX_CONCURRENT_CHUNK_REQUESTS, len(chunks))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self.handle_request,
+                    stream_slice=stream_slice,
+                    stream_state=stream_state,
+                    next_page_token=next_page_token,
+                    properties=chunk,
+                )
+                for chunk in chunks
+            ]
+            try:
+                for future in as_completed(futures):
+                    for record in self._transform(self.parse_response(future.result(), stream_state=stream_state)):
+                        post_processor.add_record(record)
+            finally:
+                for future in futures:
+                    future.cancel()
+
+        # the pagination is read from the response of the last chunk as it used to be when the chunks were requested one after another
+        response = futures[-1].result() if futures else None
         return post_processor.flat, response
 
     def read_records(
@@ -1069,6 +1099,8 @@ class CRMSearchStream(IncrementalStream, ABC):
     last_modified_field: str = None
     associations: List[str] = None
     fully_qualified_name: str = None
+    # maximum number of association types of a page of search results requested at the same time in the concurrent associations mode
+    MAX_CONCURRENT_ASSOCIATION_REQUESTS = 4
 
     @property
     def url(self):
@@ -1128,18 +1160,58 @@ class CRMSearchStream(IncrementalStream, ABC):
         associations_stream = AssociationsStream(
             api=self._api, start_date=self._start_date, credentials=self._credentials, parent_stream=self, identifiers=identifiers
         )
-        slices = associations_stream.stream_slices(sync_mode=SyncMode.full_refresh)
-
-        for _slice in slices:
-            logger.info(f"Reading {_slice} associations of {self.entity}")
-            associations = associations_stream.read_records(stream_slice=_slice, sync_mode=SyncMode.full_refresh)
-            for group in associations:
-                current_record = records_by_pk[group["from"]["id"]]
-                associations_list = current_record.get(_slice, [])
-                associations_list.extend(association["toObjectId"] for association in group["to"])
-                current_record[_slice] = associations_list
+        slices = list(associations_stream.stream_slices(sync_mode=SyncMode.full_refresh))
+
+        if not self._concurrent_associations:
+            for _slice in slices:
+                logger.info(f"Reading {_slice} associations of {self.entity}")
+                associations = associations_stream.read_records(stream_slice=_slice, sync_mode=SyncMode.full_refresh)
+                self._add_associations(records_by_pk, _slice, associations)
+            return records_by_pk.values()
+
+        # Each association type is read entirely in a worker so that its requests go through the backoff handlers of the
+        # associations stream, then the association types are added to the records as they complete
+        max_workers = max(1, min(self.MAX_CONCURRENT_ASSOCIATION_REQUESTS, len(slices)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self._read_association_type, associations_stream, _slice): _slice for _slice in slices}
+            try:
+                for future in as_completed(futures):
+                    self._add_associations(records_by_pk, futures[future], future.result())
+            finally:
+                for future in futures:
+                    future.cancel()
         return records_by_pk.values()
 
+    def _read_association_type(self, associations_stream: AssociationsStream, association_type: str) -> List[Mapping[str, Any]]:
+        logger.info(f"Reading {association_type} associations of {self.entity}")
+        return list(associations_stream.read_records(stream_slice=association_type, sync_mode=SyncMode.full_refresh))
+
+    @staticmethod
+    def _add_associations(
+        records_by_pk: Mapping[str, MutableMapping[str, Any]], association_type: str, associations: Iterable[Mapping[str, Any]]
+    ) -> None:
+        for group in associations:
+            current_record = records_by_pk[group["from"]["id"]]
+            associations_list = current_record.get(association_type, [])
+            associations_list.extend(association["toObjectId"] for association in group["to"])
+            current_record[association_type] = associations_list
+
+    def _prefetch_search_page(
+        self,
+        executor: Optional[ThreadPoolExecutor],
+        raw_response: requests.Response,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Optional[Future]:
+        """
+        Requests the next page of search results while the associations of the current page are read in the concurrent associations mode.
+        The page following the limit of results of a search query is not requested ahead as the new query depends on the records read.
+        """
+        next_page_token = self.next_page_token(raw_response)
+        if executor is None or not next_page_token or next_page_token["payload"]["after"] >= 10000:
+            return None
+        return executor.submit(self._process_search, next_page_token=next_page_token, stream_state=stream_state, stream_slice=stream_slice)
+
     def read_records(
         self,
         sync_mode: SyncMode,
@@ -1152,39 +1224,53 @@ class CRMSearchStream(IncrementalStream, ABC):
         next_page_token = None
 
         latest_cursor = None
-        while not pagination_complete:
-            if self.state:
-                records, raw_response = self._process_search(
-                    next_page_token=next_page_token,
-                    stream_state=stream_state,
-                    stream_slice=stream_slice,
-                )
-                records = self._read_associations(records)
-            else:
-                records, raw_response = self._read_stream_records(
-                    stream_slice=stream_slice,
-                    stream_state=stream_state,
-                    next_page_token=next_page_token,
-                )
-                records = self._flat_associations(records)
-            records = self._filter_old_records(records)
-            records = self.record_unnester.unnest(records)
+        executor = ThreadPoolExecutor(max_workers=1) if self._concurrent_associations else None
+        next_search_page = None
+        try:
+            while not pagination_complete:
+                if self.state:
+                    if next_search_page:
+                        records, raw_response = next_search_page.result()
+                    else:
+                        records, raw_response = self._process_search(
+                            next_page_token=next_page_token,
+                            stream_state=stream_state,
+                            stream_slice=stream_slice,
+                        )
+                    next_search_page = self._prefetch_search_page(
+                        executor, raw_response, stream_slice=stream_slice, stream_state=stream_state
+                    )
+                    records = self._read_associations(records)
+                else:
+                    records, raw_response = self._read_stream_records(
+                        stream_slice=stream_slice,
+                        stream_state=stream_state,
+                        next_page_token=next_page_token,
+                    )
+                    records = self._flat_associations(records)
+                records = self._filter_old_records(records)
+                records = self.record_unnester.unnest(records)
 
-            for record in records:
-                cursor = self._field_to_datetime(record[self.updated_at_field])
-                latest_cursor = max(cursor, latest_cursor) if latest_cursor else cursor
-                yield record
+                for record in records:
+                    cursor = self._field_to_datetime(record[self.updated_at_field])
+                    latest_cursor = max(cursor, latest_cursor) if latest_cursor else cursor
+                    yield record
 
-            next_page_token = self.next_page_token(raw_response)
-            if not next_page_token:
-                pagination_complete = True
-            elif self.state and next_page_token["payload"]["after"] >= 10000:
-                # Hubspot documentation states that the search endpoints are limited to 10,000 total results
-                # for any given query. Attempting to page beyond 10,000 will result in a 400 error.
-                # https://developers.hubspot.com/docs/api/crm/search. We stop getting data at 10,000 and
-                # start a new search query with the latest state that has been collected.
-                self._update_state(latest_cursor=latest_cursor)
-                next_page_token = None
+                next_page_token = self.next_page_token(raw_response)
+                if not next_page_token:
+                    pagination_complete = True
+                elif self.state and next_page_token["payload"]["after"] >= 10000:
+                    # Hubspot documentation states that the search endpoints are limited to 10,000 total results
+                    # for any given query. Attempting to page beyond 10,000 will result in a 400 error.
+                    # https://developers.hubspot.com/docs/api/crm/search. We stop getting data at 10,000 and
+                    # start a new search query with the latest state that has been collected.
+                    self._update_state(latest_cursor=latest_cursor)
+                    next_page_token = None
+        finally:
+            if next_search_page:
+                next_search_page.cancel()
+            if executor:
+                executor.shutdown()
 
         # Since Search stream does not have slices is safe to save the latest
         # state as the initial sync date
@@ -4,6 +4,7 @@
 
 
 import logging
+import threading
 from datetime import timedelta
 from http import HTTPStatus
 from unittest.mock import MagicMock
@@ -11,11 +12,12 @@ from unittest.mock import MagicMock
 import mock
 import pendulum
 import pytest
+import requests
 from airbyte_cdk.models import ConfiguredAirbyteCatalog, SyncMode, Type
 from source_hubspot.errors import HubspotRateLimited, InvalidStartDateConfigError
 from source_hubspot.helpers import APIv3Property
 from source_hubspot.source import SourceHubspot
-from source_hubspot.streams import API, Companies, Deals, Engagements, MarketingEmails, Products, Stream
+from source_hubspot.streams import API, AssociationsStream, Companies, Contacts, Deals, Engagements, MarketingEmails, Products, Stream
 
 from .utils import read_full_refresh, read_incremental
 
@@ -385,6 +387,62 @@ class TestSplittingPropertiesFunctionality:
 
         assert len(stream_records) == 6
 
+    def test_stream_with_splitting_properties_requests_chunks_concurrently(
+        self, requests_mock, common_params, api, fake_properties_list, monkeypatch
+    ):
+        """
+        Check that the chunks of properties of a page are requested at the same time and merged by record id
+        """
+        parsed_properties = list(APIv3Property(fake_properties_list).split())
+        assert 1 < len(parsed_properties) <= Stream.MAX_CONCURRENT_CHUNK_REQUESTS
+        self.set_mock_properties(requests_mock, "/properties/v2/product/properties", fake_properties_list)
+
+        test_stream = Products(**common_params)
+        for property_slice in parsed_properties:
+            record_responses = [
+                {
+                    "json": {
+                        "results": [
+                            {**self.BASE_OBJECT_BODY, **{"id": id, "properties": {p: "fake_data" for p in property_slice.properties}}}
+                            for id in ["6043593519", "1092593519"]
+                        ],
+                        "paging": {},
+                    },
+                    "status_code": 200,
+                }
+            ]
+            prop_key, prop_val = next(iter(property_slice.as_url_param().items()))
+            requests_mock.register_uri("GET", f"{test_stream.url}?{prop_key}={prop_val}", record_responses)
+
+        all_chunks_requested = threading.Barrier(len(parsed_properties))
+        handle_request = test_stream.handle_request
+
+        def handle_request_once_all_chunks_are_requested(**kwargs):
+            # the barrier is broken after the timeout if the requests of the chunks are not sent at the same time
+            all_chunks_requested.wait(timeout=5)
+            return handle_request(**kwargs)
+
+        monkeypatch.setattr(test_stream, "handle_request", handle_request_once_all_chunks_are_requested)
+
+        stream_records = list(test_stream.read_records(sync_mode=SyncMode.incremental))
+
+        assert [record["id"] for record in stream_records] == ["6043593519", "1092593519"]
+        for record in stream_records:
+            assert len(record["properties"]) == NUMBER_OF_PROPERTIES
+
+    def test_stream_with_splitting_properties_fails_when_a_chunk_fails(self, requests_mock, common_params, api, fake_properties_list):
+        parsed_properties = list(APIv3Property(fake_properties_list).split())
+        self.set_mock_properties(requests_mock, "/properties/v2/product/properties", fake_properties_list)
+
+        test_stream = Products(**common_params)
+        for index, property_slice in enumerate(parsed_properties):
+            prop_key, prop_val = next(iter(property_slice.as_url_param().items()))
+            response = {"json": {"results": [], "paging": {}}, "status_code": 200} if index else {"json": {}, "status_code": 400}
+            requests_mock.register_uri("GET", f"{test_stream.url}?{prop_key}={prop_val}", [response])
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            list(test_stream.read_records(sync_mode=SyncMode.incremental))
+
 
 @pytest.fixture(name="configured_catalog")
 def configured_catalog_fixture():
@@ -485,6 +543,103 @@ def test_search_based_stream_should_not_attempt_to_get_more_than_10k_records(req
     assert test_stream.state["updatedAt"] == test_stream._init_sync.to_iso8601_string()
 
 
+@pytest.fixture(name="concurrent_associations_params")
+def concurrent_associations_params_fixture(config):
+    return SourceHubspot().get_common_params(config={**config, "concurrent_associations": True})
+
+
+def test_search_based_stream_reads_association_types_concurrently(
+    requests_mock, concurrent_associations_params, fake_properties_list, monkeypatch
+):
+    test_stream = Contacts(**concurrent_associations_params)
+    test_stream.state = {"updatedAt": "2022-02-24T16:43:11Z"}
+    requests_mock.register_uri(
+        "POST",
+        "/crm/v3/objects/contact/search",
+        json={
+            "results": [{"id": "1", "updatedAt": "2022-02-25T16:43:11Z"}, {"id": "2", "updatedAt": "2022-02-25T16:43:11Z"}],
+            "paging": {},
+        },
+    )
+    requests_mock.register_uri(
+        "GET", "/properties/v2/contact/properties", json=[{"name": name, "type": "string"} for name in fake_properties_list]
+    )
+    requests_mock.register_uri(
+        "POST",
+        "/crm/v4/associations/contact/contacts/batch/read",
+        json={"results": [{"from": {"id": "1"}, "to": [{"toObjectId": "3"}]}]},
+    )
+    requests_mock.register_uri(
+        "POST",
+        "/crm/v4/associations/contact/companies/batch/read",
+        json={"results": [{"from": {"id": "1"}, "to": [{"toObjectId": "4"}]}, {"from": {"id": "2"}, "to": [{"toObjectId": "5"}]}]},
+    )
+
+    all_association_types_requested = threading.Barrier(len(Contacts.associations))
+    send_request = AssociationsStream._send_request
+
+    def send_request_once_all_association_types_are_requested(self, *args, **kwargs):
+        # the barrier is broken after the timeout if the association types are not requested at the same time
+        all_association_types_requested.wait(timeout=5)
+        return send_request(self, *args, **kwargs)
+
+    monkeypatch.setattr(AssociationsStream, "_send_request", send_request_once_all_association_types_are_requested)
+
+    records, _ = read_incremental(test_stream, {})
+
+    assert [(record["id"], record.get("contacts"), record.get("companies")) for record in records] == [
+        ("1", ["3"], ["4"]),
+        ("2", None, ["5"]),
+    ]
+
+
+def test_search_based_stream_requests_next_page_while_reading_associations(
+    requests_mock, concurrent_associations_params, fake_properties_list, monkeypatch
+):
+    test_stream = Companies(**concurrent_associations_params)
+    test_stream.state = {"updatedAt": "2022-02-24T16:43:11Z"}
+    requests_mock.register_uri(
+        "POST",
+        "/crm/v3/objects/company/search",
+        [
+            {"json": {"results": [{"id": "1", "updatedAt": "2022-02-25T16:43:11Z"}], "paging": {"next": {"after": "1"}}}},
+            {"json": {"results": [{"id": "2", "updatedAt": "2022-02-26T16:43:11Z"}], "paging": {}}},
+        ],
+    )
+    requests_mock.register_uri(
+        "GET", "/properties/v2/company/properties", json=[{"name": name, "type": "string"} for name in fake_properties_list]
+    )
+    requests_mock.register_uri(
+        "POST",
+        "/crm/v4/associations/company/contacts/batch/read",
+        [
+            {"json": {"results": [{"from": {"id": "1"}, "to": [{"toObjectId": "3"}]}]}},
+            {"json": {"results": [{"from": {"id": "2"}, "to": [{"toObjectId": "4"}]}]}},
+        ],
+    )
+
+    next_page_requested = threading.Event()
+    search = test_stream.search
+
+    def search_and_record_next_page(url, data, params=None):
+        if data.get("after"):
+            next_page_requested.set()
+        return search(url=url, data=data, params=params)
+
+    send_request = AssociationsStream._send_request
+
+    def send_request_once_next_page_is_requested(self, *args, **kwargs):
+        assert next_page_requested.wait(timeout=5)
+        return send_request(self, *args, **kwargs)
+
+    monkeypatch.setattr(test_stream, "search", search_and_record_next_page)
+    monkeypatch.setattr(AssociationsStream, "_send_request", send_request_once_next_page_is_requested)
+
+    records, _ = read_incremental(test_stream, {})
+
+    assert [(record["id"], record["contacts"]) for record in records] == [("1", ["3"]), ("2", ["4"])]
+
+
 def test_engagements_stream_pagination_works(requests_mock, common_params):
     """
     Tests the engagements stream handles pagination correctly, for both
@@ -163,6 +163,8 @@ class SourceSalesforce(ConcurrentSourceAdapter):
 
         api_type = cls._get_api_type(stream_name, json_schema, config.get("force_use_bulk_api", False))
         full_refresh, incremental = cls._get_stream_type(stream_name, api_type)
+        if api_type == "bulk":
+            stream_kwargs["pipelined_download"] = config.get("pipelined_bulk_download", False)
         if replication_key and stream_name not in UNSUPPORTED_FILTERING_STREAMS:
             stream_class = incremental
             stream_kwargs["replication_key"] = replication_key
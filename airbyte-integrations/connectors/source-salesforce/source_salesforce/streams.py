@@ -4,14 +4,18 @@
 
 import csv
 import ctypes
+import io
 import math
 import os
+import queue
+import threading
 import time
 import urllib.parse
 import uuid
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import closing
-from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Type, Union
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Type, Union
 
 import pandas as pd
 import pendulum
@@ -141,6 +145,8 @@ class PropertyChunk:
 
 class RestSalesforceStream(SalesforceStream):
     state_converter = IsoMillisConcurrentStreamStateConverter()
+    # maximum number of property chunks of a stream requested at the same time
+    MAX_CONCURRENT_CHUNK_REQUESTS = 4
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -210,10 +216,12 @@ class RestSalesforceStream(SalesforceStream):
             yield local_properties
 
     @staticmethod
-    def _next_chunk_id(property_chunks: Mapping[int, PropertyChunk]) -> Optional[int]:
+    def _next_chunk_ids(property_chunks: Mapping[int, PropertyChunk], max_records_ahead: int) -> List[int]:
         """
-        Figure out which chunk is going to be read next.
-        It should be the one with the least number of records read by the moment.
+        Figure out which chunks are going to be read next.
+        These are the chunks that are less than `max_records_ahead` records ahead of the one with the least number of records read by the
+        moment, so that the number of partial records waiting for the other chunks stays bounded even if the pages of the chunks do not
+        have the same size.
         """
         non_exhausted_chunks = {
             # We skip chunks that have already attempted a sync before and do not have a next page
@@ -222,8 +230,11 @@ class RestSalesforceStream(SalesforceStream):
             if property_chunk.first_time or property_chunk.next_page
         }
         if not non_exhausted_chunks:
-            return None
-        return min(non_exhausted_chunks, key=non_exhausted_chunks.get)
+            return []
+        least_records_read = min(non_exhausted_chunks.values())
+        return [
+            chunk_id for chunk_id, record_counter in non_exhausted_chunks.items() if record_counter - least_records_read < max_records_ahead
+        ]
 
     def _read_pages(
         self,
@@ -238,46 +249,63 @@ class RestSalesforceStream(SalesforceStream):
         property_chunks: Mapping[int, PropertyChunk] = {
             index: PropertyChunk(properties=properties) for index, properties in enumerate(self.chunk_properties())
         }
-        while True:
-            chunk_id = self._next_chunk_id(property_chunks)
-            if chunk_id is None:
-                # pagination complete
-                break
-
-            property_chunk = property_chunks[chunk_id]
-            request, response = self._fetch_next_page_for_chunk(
-                stream_slice, stream_state, property_chunk.next_page, property_chunk.properties
-            )
-
-            # When this is the first time we're getting a chunk's records, we set this to False to be used when deciding the next chunk
-            if property_chunk.first_time:
-                property_chunk.first_time = False
-            property_chunk.next_page = self.next_page_token(response)
-            chunk_page_records = records_generator_fn(request, response, stream_state, stream_slice)
-            if not self.too_many_properties:
-                # this is the case when a stream has no primary key
-                # (it is allowed when properties length does not exceed the maximum value)
-                # so there would be a single chunk, therefore we may and should yield records immediately
-                for record in chunk_page_records:
-                    property_chunk.record_counter += 1
-                    yield record
-                continue
-
-            # stick together different parts of records by their primary key and emit if a record is complete
-            for record in chunk_page_records:
-                property_chunk.record_counter += 1
-                record_id = record[self.primary_key]
-                if record_id not in records_by_primary_key:
-                    records_by_primary_key[record_id] = (record, 1)
-                    continue
-                partial_record, counter = records_by_primary_key[record_id]
-                partial_record.update(record)
-                counter += 1
-                if counter == len(property_chunks):
-                    yield partial_record  # now it's complete
-                    records_by_primary_key.pop(record_id)
-                else:
-                    records_by_primary_key[record_id] = (partial_record, counter)
+        # The next pages of the chunks are requested concurrently and their records are merged as the responses arrive. Requests which have
+        # not started yet are cancelled as soon as one of them fails, for example because the API limit is reached.
+        with ThreadPoolExecutor(max_workers=max(1, min(self.MAX_CONCURRENT_CHUNK_REQUESTS, len(property_chunks)))) as executor:
+            while True:
+                chunk_ids = self._next_chunk_ids(property_chunks, max_records_ahead=self.page_size)
+                if not chunk_ids:
+                    # pagination complete
+                    break
+
+                futures = {
+                    executor.submit(
+                        self._fetch_next_page_for_chunk,
+                        stream_slice,
+                        stream_state,
+                        property_chunks[chunk_id].next_page,
+                        property_chunks[chunk_id].properties,
+                    ): chunk_id
+                    for chunk_id in chunk_ids
+                }
+                try:
+                    for future in as_completed(futures):
+                        property_chunk = property_chunks[futures[future]]
+                        request, response = future.result()
+
+                        # When this is the first time we're getting a chunk's records, we set this to False to be used when deciding the
+                        # next chunks
+                        if property_chunk.first_time:
+                            property_chunk.first_time = False
+                        property_chunk.next_page = self.next_page_token(response)
+                        chunk_page_records = records_generator_fn(request, response, stream_state, stream_slice)
+                        if not self.too_many_properties:
+                            # this is the case when a stream has no primary key
+                            # (it is allowed when properties length does not exceed the maximum value)
+                            # so there would be a single chunk, therefore we may and should yield records immediately
+                            for record in chunk_page_records:
+                                property_chunk.record_counter += 1
+                                yield record
+                            continue
+
+                        # stick together different parts of records by their primary key and emit if a record is complete
+                        for record in chunk_page_records:
+                            property_chunk.record_counter += 1
+                            record_id = record[self.primary_key]
+                            if record_id not in records_by_primary_key:
+                                records_by_primary_key[record_id] = (record, 1)
+                                continue
+                            partial_record, counter = records_by_primary_key[record_id]
+                            partial_record.update(record)
+                            counter += 1
+                            if counter == len(property_chunks):
+                                yield partial_record  # now it's complete
+                                records_by_primary_key.pop(record_id)
+                            else:
+                                records_by_primary_key[record_id] = (partial_record, counter)
+                finally:
+                    for future in futures:
+                        future.cancel()
 
         # Process what's left.
         # Because we make multiple calls to query N records (each call to fetch X properties of all the N records),
@@ -341,10 +369,51 @@ class RestSalesforceSubStream(BatchedSubStream, RestSalesforceStream):
     pass
 
 
+class _ChunksReader(io.RawIOBase):
+    """
+    Readable binary stream over chunks of bytes, so that they can be decoded and parsed as they are received
+    """
+
+    def __init__(self, chunks: Iterator[bytes]):
+        super().__init__()
+        self._chunks = chunks
+        self._chunk = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._chunk:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._chunk = memoryview(chunk)
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+
+# Markers sent by the thread downloading the results of a job to the thread parsing them
+_END_OF_PAGE = object()
+_END_OF_RESULTS = object()
+
+
 class BulkSalesforceStream(SalesforceStream):
     DEFAULT_WAIT_TIMEOUT_SECONDS = 86400  # 24-hour bulk job running time
     MAX_CHECK_INTERVAL_SECONDS = 2.0
     MAX_RETRY_NUMBER = 3
+    # size of the chunks read from the responses and of the buffer of the CSV parser when the results are downloaded in pipelined mode
+    PIPELINED_READ_BUFFER_SIZE = 1024 * 1024
+    # maximum number of chunks downloaded ahead of the parsing in pipelined mode, which bounds the memory used by the download
+    PIPELINED_MAX_PREFETCHED_CHUNKS = 16
+
+    def __init__(self, *args, pipelined_download: bool = False, **kwargs):
+        """
+        :param pipelined_download: parse the results of the job as they are downloaded instead of saving them to a temporary file first
+        """
+        super().__init__(*args, **kwargs)
+        self.pipelined_download = pipelined_download
 
     def path(self, next_page_token: Mapping[str, Any] = None, **kwargs: Any) -> str:
         return f"/services/data/{self.sf_api.version}/jobs/query"
@@ -565,6 +634,89 @@ class BulkSalesforceStream(SalesforceStream):
             # remove binary tmp file, after data is read
             os.remove(path)
 
+    def read_csv_stream(self, chunks: Iterator[bytes], encoding: str) -> Iterable[Mapping[str, Any]]:
+        """
+        Parses CSV rows as the chunks of the content are received. Like `read_with_chunks`, all values are returned as strings and empty
+        values as None.
+        @ chunks: iterator - the chunks of binary CSV data
+        @ encoding: string - encoding of the binary data according to Standard Encodings from codecs module
+        """
+        raw = io.BufferedReader(_ChunksReader(chunks), buffer_size=self.PIPELINED_READ_BUFFER_SIZE)
+        with io.TextIOWrapper(raw, encoding=encoding, newline="") as data:
+            for row in csv.DictReader(data, dialect="unix"):
+                yield {key: value if value != "" else None for key, value in row.items()}
+
+    def read_results_pipelined(self, job_full_url: str) -> Iterable[Mapping[str, Any]]:
+        """
+        Reads the results of the job while they are downloaded by a background thread. The download does not wait for the records to be
+        read, so the next page of results, identified by the `Sforce-Locator` header, is requested while the records of the current page
+        are still being emitted. At most PIPELINED_MAX_PREFETCHED_CHUNKS chunks are held in memory at once.
+        @ job_full_url: string - the url of the `executed_job`
+        """
+        chunks: queue.Queue = queue.Queue(maxsize=self.PIPELINED_MAX_PREFETCHED_CHUNKS)
+        stop = threading.Event()
+        downloader = threading.Thread(target=self._download_results, args=(job_full_url, chunks, stop), name=f"{self.name}_download")
+        downloader.start()
+        try:
+            while True:
+                item = self._next_chunk(chunks)
+                if item is _END_OF_RESULTS:
+                    return
+                yield from self.read_csv_stream(self._page_chunks(chunks), encoding=item)
+        finally:
+            stop.set()
+            downloader.join()
+
+    def _download_results(self, job_full_url: str, chunks: queue.Queue, stop: threading.Event) -> None:
+        """
+        Downloads all the pages of results of the job. For each page, the encoding of the page is sent followed by its chunks of data.
+        """
+
+        def send(item: Any) -> bool:
+            # the parsing can stop before all the results are read, in which case the download is interrupted instead of waiting forever
+            while not stop.is_set():
+                try:
+                    chunks.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        try:
+            salesforce_bulk_api_locator = None
+            while True:
+                req = PreparedRequest()
+                req.prepare_url(f"{job_full_url}/results", {"locator": salesforce_bulk_api_locator})
+                with closing(self._send_http_request("GET", req.url, headers={"Accept-Encoding": "gzip"}, stream=True)) as response:
+                    if not send(self.get_response_encoding(response.headers)):
+                        return
+                    for chunk in response.iter_content(chunk_size=self.PIPELINED_READ_BUFFER_SIZE):
+                        chunk = self.filter_null_bytes(chunk)
+                        if chunk and not send(chunk):
+                            return
+                    if not send(_END_OF_PAGE):
+                        return
+                    salesforce_bulk_api_locator = response.headers.get("Sforce-Locator", "null")
+                if salesforce_bulk_api_locator == "null":
+                    break
+            send(_END_OF_RESULTS)
+        except Exception as exception:
+            send(exception)
+
+    @staticmethod
+    def _next_chunk(chunks: queue.Queue) -> Any:
+        item = chunks.get()
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    def _page_chunks(self, chunks: queue.Queue) -> Iterator[bytes]:
+        while True:
+            item = self._next_chunk(chunks)
+            if item is _END_OF_PAGE:
+                return
+            yield item
+
     def abort_job(self, url: str):
         data = {"state": "Aborted"}
         self._send_http_request("PATCH", url=url, json=data)
@@ -639,6 +791,10 @@ class BulkSalesforceStream(SalesforceStream):
                 )
                 return
             raise SalesforceException(f"Job for {self.name} stream using BULK API was failed.")
+        if self.pipelined_download:
+            yield from self.read_results_pipelined(job_full_url)
+            self.delete_job(url=job_full_url)
+            return
         salesforce_bulk_api_locator = None
         while True:
             req = PreparedRequest()
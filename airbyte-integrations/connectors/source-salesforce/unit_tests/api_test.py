@@ -4,8 +4,10 @@
 
 import csv
 import io
+import itertools
 import logging
 import re
+import threading
 from datetime import datetime, timedelta
 from typing import List
 from unittest.mock import Mock, patch
@@ -40,6 +42,7 @@ from source_salesforce.streams import (
     BulkSalesforceSubStream,
     Describe,
     IncrementalRestSalesforceStream,
+    PropertyChunk,
     RestSalesforceStream,
     SalesforceStream,
 )
@@ -194,6 +197,87 @@ def test_bulk_sync_pagination(stream_config, stream_api, requests_mock):
     assert result_uri.request_history[2].query == "locator=somelocator_2"
 
 
+def test_bulk_sync_pagination_pipelined(stream_config, stream_api, requests_mock):
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", {**stream_config, "pipelined_bulk_download": True}, stream_api)
+    job_id = "fake_job"
+    requests_mock.register_uri("POST", stream.path(), json={"id": job_id})
+    requests_mock.register_uri("GET", stream.path() + f"/{job_id}", json={"state": "JobComplete"})
+    resp_text = ["Field1,LastModifiedDate,ID"] + [f"test,2021-11-16,{i}" for i in range(5)]
+    result_uri = requests_mock.register_uri(
+        "GET",
+        stream.path() + f"/{job_id}/results",
+        [
+            {"text": "\n".join(resp_text), "headers": {"Sforce-Locator": "somelocator_1"}},
+            {"text": "\n".join(resp_text), "headers": {"Sforce-Locator": "somelocator_2"}},
+            {"text": "\n".join(resp_text), "headers": {"Sforce-Locator": "null"}},
+        ],
+    )
+    delete_uri = requests_mock.register_uri("DELETE", stream.path() + f"/{job_id}")
+
+    stream_slices = next(iter(stream.stream_slices(sync_mode=SyncMode.incremental)))
+    loaded_ids = [int(record["ID"]) for record in stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice=stream_slices)]
+    assert loaded_ids == [0, 1, 2, 3, 4, 0, 1, 2, 3, 4, 0, 1, 2, 3, 4]
+    assert result_uri.call_count == 3
+    assert result_uri.request_history[1].query == "locator=somelocator_1"
+    assert result_uri.request_history[2].query == "locator=somelocator_2"
+    assert delete_uri.call_count == 1
+
+
+def test_read_results_pipelined_prefetches_next_page_while_current_page_is_read(stream_config, stream_api, requests_mock):
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
+    job_full_url = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA"
+    last_page_requested = threading.Event()
+
+    def last_page(request, context):
+        last_page_requested.set()
+        context.headers["Sforce-Locator"] = "null"
+        return "ID\n2"
+
+    requests_mock.register_uri(
+        "GET",
+        job_full_url + "/results",
+        [
+            {"text": "ID\n0", "headers": {"Sforce-Locator": "somelocator_1"}},
+            {"text": "ID\n1", "headers": {"Sforce-Locator": "somelocator_2"}},
+        ],
+    )
+    requests_mock.register_uri("GET", job_full_url + "/results?locator=somelocator_2", text=last_page)
+
+    records = stream.read_results_pipelined(job_full_url)
+    assert next(records) == {"ID": "0"}
+    assert last_page_requested.wait(timeout=5)
+    assert list(records) == [{"ID": "1"}, {"ID": "2"}]
+
+
+def test_read_results_pipelined_raises_download_error(stream_config, stream_api, requests_mock):
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
+    job_full_url = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA"
+    requests_mock.register_uri(
+        "GET",
+        job_full_url + "/results",
+        [{"text": "ID\n0", "headers": {"Sforce-Locator": "somelocator_1"}}, {"status_code": 400, "json": [{"errorCode": "INVALID"}]}],
+    )
+
+    records = stream.read_results_pipelined(job_full_url)
+    assert next(records) == {"ID": "0"}
+    with pytest.raises(HTTPError):
+        next(records)
+
+
+def test_read_results_pipelined_stops_download_when_reading_stops(stream_config, stream_api, requests_mock):
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
+    stream.PIPELINED_READ_BUFFER_SIZE = 8
+    stream.PIPELINED_MAX_PREFETCHED_CHUNKS = 1
+    job_full_url = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA"
+    requests_mock.register_uri("GET", job_full_url + "/results", text="ID\n" + "\n".join(str(i) for i in range(1000)))
+
+    records = stream.read_results_pipelined(job_full_url)
+    assert next(records) == {"ID": "0"}
+    records.close()
+
+    assert [thread for thread in threading.enumerate() if thread.name == f"{stream.name}_download"] == []
+
+
 def _prepare_mock(m, stream):
     job_id = "fake_job_1"
     m.register_uri("POST", stream.path(), json={"id": job_id})
@@ -589,6 +673,44 @@ def test_csv_reader_dialect_unix():
         assert result == data
 
 
+@pytest.mark.parametrize(
+    "content, encoding, expected_records",
+    (
+        (b'"Id","IsDeleted"\n"0014W000027f6UwQAI","false"\n', "utf-8", [{"Id": "0014W000027f6UwQAI", "IsDeleted": "false"}]),
+        (b'"IsDeleted","Age","Name"\n"false",,"Airbyte"\n', "utf-8", [{"IsDeleted": "false", "Age": None, "Name": "Airbyte"}]),
+        (b'"ZipCode","Age"\n"01234",24\n', "utf-8", [{"ZipCode": "01234", "Age": "24"}]),
+        (b'"\xc4"\n"\xca \xfc"', "ISO-8859-1", [{"Ä": "Ê ü"}]),
+        (b'"\xd5\x80"\n"\xe3\x82\x82 \xe3\x83\xa4 \xf0\x9d\x9c\xb5"', "utf-8", [{"Հ": "も ヤ 𝜵"}]),
+        (b"", "utf-8", []),
+    ),
+    ids=["strings", "empty_value", "digits", "iso_8859_1", "multibyte_utf_8", "empty_content"],
+)
+@pytest.mark.parametrize("chunk_size", (1, 3, 1024))
+def test_read_csv_stream(content, encoding, expected_records, chunk_size):
+    stream: BulkSalesforceStream = BulkSalesforceStream(stream_name=None, sf_api=None, pk=None)
+    chunks = iter([content[i : i + chunk_size] for i in range(0, len(content), chunk_size)])
+
+    assert list(stream.read_csv_stream(chunks, encoding)) == expected_records
+
+
+def test_read_csv_stream_dialect_unix():
+    stream: BulkSalesforceStream = BulkSalesforceStream(stream_name=None, sf_api=None, pk=None)
+    data = [
+        {"Id": "1", "Name": '"first_name" "last_name"'},
+        {"Id": "2", "Name": "'" + 'first_name"\n' + "'" + 'last_name\n"'},
+        {"Id": "3", "Name": "first_name last_name"},
+    ]
+
+    with io.StringIO("", newline="") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=["Id", "Name"], dialect="unix")
+        writer.writeheader()
+        for line in data:
+            writer.writerow(line)
+        content = csvfile.getvalue().encode("utf-8")
+
+    assert list(stream.read_csv_stream(iter([content[:20], content[20:]]), "utf-8")) == data
+
+
 @pytest.mark.parametrize(
     "stream_names,catalog_stream_names,",
     (
@@ -828,6 +950,53 @@ def test_stream_with_no_records_in_response(stream_config, stream_api_v2_pk_too_
     assert records == []
 
 
+def test_too_many_properties_chunks_are_requested_concurrently(
+    stream_config, stream_api_v2_pk_too_many_properties, requests_mock, monkeypatch
+):
+    stream = generate_stream("Account", stream_config, stream_api_v2_pk_too_many_properties)
+    assert len(list(stream.chunk_properties())) > RestSalesforceStream.MAX_CONCURRENT_CHUNK_REQUESTS
+    url = "https://fase-account.salesforce.com/services/data/v57.0/queryAll"
+    requests_mock.get(url, json={"records": [{"Id": 1, "propertyA": "A"}, {"Id": 2, "propertyA": "A"}]})
+
+    first_requests_sent = threading.Barrier(RestSalesforceStream.MAX_CONCURRENT_CHUNK_REQUESTS)
+    requests_counter = itertools.count()
+    fetch_next_page_for_chunk = stream._fetch_next_page_for_chunk
+
+    def fetch_next_page_for_chunk_concurrently(*args):
+        # the barrier is broken after the timeout if the first requests are not sent at the same time
+        if next(requests_counter) < RestSalesforceStream.MAX_CONCURRENT_CHUNK_REQUESTS:
+            first_requests_sent.wait(timeout=5)
+        return fetch_next_page_for_chunk(*args)
+
+    monkeypatch.setattr(stream, "_fetch_next_page_for_chunk", fetch_next_page_for_chunk_concurrently)
+
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh))
+    assert records == [{"Id": 1, "propertyA": "A"}, {"Id": 2, "propertyA": "A"}]
+
+
+@pytest.mark.parametrize(
+    "chunks, expected_chunk_ids",
+    (
+        ({0: (True, None, 0), 1: (True, None, 0)}, [0, 1]),
+        ({0: (False, {"next_token": "a"}, 2000), 1: (False, {"next_token": "b"}, 2000)}, [0, 1]),
+        ({0: (False, {"next_token": "a"}, 4000), 1: (False, {"next_token": "b"}, 1000)}, [1]),
+        ({0: (False, {"next_token": "a"}, 2500), 1: (False, {"next_token": "b"}, 1000)}, [0, 1]),
+        ({0: (False, None, 0), 1: (False, {"next_token": "b"}, 2000)}, [1]),
+        ({0: (False, None, 2000), 1: (False, None, 2000)}, []),
+    ),
+    ids=["first_pages", "aligned_chunks", "chunk_too_far_ahead", "chunk_less_than_a_page_ahead", "exhausted_chunk", "all_chunks_exhausted"],
+)
+def test_next_chunk_ids(chunks, expected_chunk_ids):
+    property_chunks = {}
+    for chunk_id, (first_time, next_page, record_counter) in chunks.items():
+        property_chunks[chunk_id] = PropertyChunk(properties={})
+        property_chunks[chunk_id].first_time = first_time
+        property_chunks[chunk_id].next_page = next_page
+        property_chunks[chunk_id].record_counter = record_counter
+
+    assert RestSalesforceStream._next_chunk_ids(property_chunks, max_records_ahead=2000) == expected_chunk_ids
+
+
 @pytest.mark.parametrize(
     "status_code,response_json,log_message",
     [
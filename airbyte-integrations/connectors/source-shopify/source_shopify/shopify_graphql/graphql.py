@@ -3,14 +3,21 @@
 #
 
 
+import json
+from functools import lru_cache
+from string import Template
 from typing import Optional
 
 import sgqlc.operation
+from sgqlc.types import Variable
 
-from . import schema
 
-_schema = schema
-_schema_root = _schema.shopify_schema
+def _schema_root():
+    # The schema module is imported on first use since loading it takes a significant part of the import time of the connector, which
+    # is wasted by the spec, check and discover commands and by syncs without GraphQL streams
+    from . import schema
+
+    return schema.shopify_schema
 
 
 # the graphql api requires the query filter to be snake case even though the column returned is camel case
@@ -25,12 +32,23 @@ def _camel_to_snake(camel_case: str):
 
 
 def get_query_products(first: int, filter_field: str, filter_value: str, next_page_token: Optional[str]):
-    op = sgqlc.operation.Operation(_schema_root.query_type)
     snake_case_filter_field = _camel_to_snake(filter_field)
+    query = f"{snake_case_filter_field}:>'{filter_value}'" if filter_value else None
+    # sgqlc serializes the values of string arguments as JSON
+    return _get_query_products(first).substitute(query=json.dumps(query), after=json.dumps(next_page_token))
+
+
+@lru_cache(maxsize=None)
+def _get_query_products(first: int) -> Template:
+    """
+    The query is built once by page size, with sgqlc variables in place of the arguments which change from one request to the other.
+    They are substituted by the literals of their values for each request, so the query sent is the same as if it was built with them.
+    """
+    op = sgqlc.operation.Operation(_schema_root().query_type)
     products_args = {
         "first": first,
-        "query": f"{snake_case_filter_field}:>'{filter_value}'" if filter_value else None,
-        "after": next_page_token,
+        "query": Variable("query"),
+        "after": Variable("after"),
     }
     products = op.products(**products_args)
     products.nodes.id()
@@ -61,4 +79,4 @@ def get_query_products(first: int, filter_field: str, filter_value: str, next_pa
     products.page_info()
     products.page_info.has_next_page()
     products.page_info.end_cursor()
-    return str(op)
+    return Template(str(op))
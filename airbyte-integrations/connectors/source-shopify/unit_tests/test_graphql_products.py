@@ -1,7 +1,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 
 import pytest
-from source_shopify.shopify_graphql.graphql import get_query_products
+from source_shopify.shopify_graphql.graphql import _get_query_products, get_query_products
 
 
 @pytest.mark.parametrize(
@@ -14,3 +14,13 @@ from source_shopify.shopify_graphql.graphql import get_query_products
 )
 def test_get_query_products(page_size, filter_value, next_page_token, expected_query):
     assert get_query_products(page_size, 'updatedAt', filter_value, next_page_token) == expected_query
+
+
+def test_get_query_products_builds_query_once_by_page_size():
+    _get_query_products.cache_clear()
+
+    get_query_products(100, "updatedAt", None, None)
+    get_query_products(100, "updatedAt", "2027-07-11T13:07:45-07:00", "end_cursor_value")
+    get_query_products(250, "updatedAt", None, None)
+
+    assert _get_query_products.cache_info().misses == 2
@@ -0,0 +1,44 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import logging
+import subprocess
+import sys
+from typing import Any, Mapping
+
+_SPEC_STARTUP = """
+import json, logging, sys, time
+start = time.perf_counter()
+from source_shopify import SourceShopify
+SourceShopify().spec(logging.getLogger("airbyte"))
+print(json.dumps({"spec_seconds": time.perf_counter() - start, "schema_imported": "source_shopify.shopify_graphql.schema" in sys.modules}))
+"""
+
+_SCHEMA_IMPORT = """
+import json, time
+start = time.perf_counter()
+import source_shopify.shopify_graphql.schema
+print(json.dumps({"import_seconds": time.perf_counter() - start}))
+"""
+
+logger = logging.getLogger("airbyte.benchmark")
+
+
+def _run_in_new_interpreter(code: str) -> Mapping[str, Any]:
+    # a new interpreter is used so that nothing is already imported
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def test_graphql_schema_is_not_imported_on_spec() -> None:
+    # the GraphQL schema takes a significant time to import so it is only imported once a GraphQL stream is read
+    startup = _run_in_new_interpreter(_SPEC_STARTUP)
+    schema_import = _run_in_new_interpreter(_SCHEMA_IMPORT)
+
+    assert not startup["schema_imported"]
+    logger.info(
+        f"spec ran in {startup['spec_seconds']:.3f}s, the GraphQL schema is imported in {schema_import['import_seconds']:.3f}s when a "
+        "GraphQL stream is read"
+    )